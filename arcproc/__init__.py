@@ -1,4 +1,5 @@
 """Processing framework library based on ArcGIS/ArcPy."""
+from arcproc.advisor import IndexAdvisor, IndexRecommendation
 from arcproc.convert import (
     convert_lines_to_vertex_points,
     convert_points_to_multipoints,
@@ -11,7 +12,14 @@ from arcproc.convert import (
     split_lines_at_vertices,
 )
 from arcproc.dataset import (
+    CHUNK_WEIGHT_TOKENS,
+    SCRATCH_FIELD_TYPE_BYTES,
+    SCRATCH_GEOMETRY_TYPE_BYTES,
+    SCRATCH_PLACEMENT,
+    ChunkPlan,
     DatasetView,
+    DatasetViewPool,
+    ScratchPlacement,
     TempDatasetCopy,
     add_index,
     compress_dataset,
@@ -20,6 +28,7 @@ from arcproc.dataset import (
     create_dataset,
     dataset_as_feature_set,
     dataset_feature_count,
+    dataset_signature,
     delete_dataset,
     is_valid_dataset,
     remove_all_default_field_values,
@@ -76,28 +85,55 @@ from arcproc.geometry import (
     coordinate_distance,
     geometry_axis_bound,
     line_between_centroids,
+    morton_code,
 )
 from arcproc.geoset import identity_features, join_features_at_center, union_features
 from arcproc.managers import Procedure
 from arcproc.metadata import (
+    DOMAIN_REGISTRY,
+    FEATURE_COUNT_CACHE,
+    METADATA_CACHE,
     Dataset,
     Domain,
+    DomainRegistry,
+    FeatureCountCache,
     Field,
+    MetadataCache,
     SpatialReference,
     SpatialReferenceSourceItem,
     Workspace,
 )
 from arcproc.misc import same_feature, same_value
 from arcproc.network import (
+    NetworkSession,
+    NodeGraph,
+    RoutingGraph,
     build_network,
     closest_facility_routes,
     coordinates_node_map,
     create_service_areas,
     create_service_rings,
     id_node_map,
+    native_closest_facility_routes,
+    od_cost_matrix,
     update_fields_with_node_ids,
 )
+from arcproc.profiling import (
+    FIELD_ACCESS_LOG,
+    FIELD_ACCESS_TYPES,
+    CursorProfile,
+    FieldAccessLog,
+    Metric,
+    ProfiledCursor,
+    clear_metrics,
+    cursor_profiling_enabled,
+    metrics,
+    profile_cursor,
+    record_metric,
+)
 from arcproc.proximity import (
+    AdjacencyIndex,
+    NearestNeighborIndex,
     adjacent_neighbors_map,
     buffer_features,
     clip_features,
@@ -106,7 +142,13 @@ from arcproc.proximity import (
     nearest_features,
 )
 from arcproc.services import service_features_as_dicts
-from arcproc.tracking import consolidate_tracking_rows, update_tracking_rows
+from arcproc.topology import TopologyReport, network_topology_report
+from arcproc.tracking import (
+    TrackingIndex,
+    consolidate_tracking_rows,
+    update_tracking_rows,
+    update_tracking_rows_multi,
+)
 from arcproc.workspace import (
     Session,
     build_locator,
@@ -123,6 +165,9 @@ from arcproc.workspace import (
 
 
 __all__ = [
+    # Advisor.
+    "IndexAdvisor",
+    "IndexRecommendation",
     # Convert.
     "convert_lines_to_vertex_points",
     "convert_points_to_multipoints",
@@ -134,7 +179,14 @@ __all__ = [
     "convert_to_planar_lines",
     "split_lines_at_vertices",
     # Dataset.
+    "CHUNK_WEIGHT_TOKENS",
+    "SCRATCH_FIELD_TYPE_BYTES",
+    "SCRATCH_GEOMETRY_TYPE_BYTES",
+    "SCRATCH_PLACEMENT",
+    "ChunkPlan",
     "DatasetView",
+    "DatasetViewPool",
+    "ScratchPlacement",
     "TempDatasetCopy",
     "add_index",
     "compress_dataset",
@@ -143,6 +195,7 @@ __all__ = [
     "create_dataset",
     "dataset_as_feature_set",
     "dataset_feature_count",
+    "dataset_signature",
     "delete_dataset",
     "is_valid_dataset",
     "remove_all_default_field_values",
@@ -195,6 +248,7 @@ __all__ = [
     "coordinate_distance",
     "geometry_axis_bound",
     "line_between_centroids",
+    "morton_code",
     # Geoset.
     "identity_features",
     "join_features_at_center",
@@ -202,9 +256,15 @@ __all__ = [
     # Managers.
     "Procedure",
     # Metadata.
+    "DOMAIN_REGISTRY",
+    "FEATURE_COUNT_CACHE",
+    "METADATA_CACHE",
     "Dataset",
     "Domain",
+    "DomainRegistry",
+    "FeatureCountCache",
     "Field",
+    "MetadataCache",
     "SpatialReference",
     "SpatialReferenceSourceItem",
     "Workspace",
@@ -212,14 +272,33 @@ __all__ = [
     "same_feature",
     "same_value",
     # Network.
+    "NetworkSession",
+    "NodeGraph",
+    "RoutingGraph",
     "build_network",
     "closest_facility_routes",
     "create_service_areas",
     "create_service_rings",
     "coordinates_node_map",
     "id_node_map",
+    "native_closest_facility_routes",
+    "od_cost_matrix",
     "update_fields_with_node_ids",
+    # Profiling.
+    "FIELD_ACCESS_LOG",
+    "FIELD_ACCESS_TYPES",
+    "CursorProfile",
+    "FieldAccessLog",
+    "Metric",
+    "ProfiledCursor",
+    "clear_metrics",
+    "cursor_profiling_enabled",
+    "metrics",
+    "profile_cursor",
+    "record_metric",
     # Proximity.
+    "AdjacencyIndex",
+    "NearestNeighborIndex",
     "adjacent_neighbors_map",
     "buffer_features",
     "clip_features",
@@ -228,9 +307,14 @@ __all__ = [
     "nearest_features",
     # Services.
     "service_features_as_dicts",
+    # Topology.
+    "TopologyReport",
+    "network_topology_report",
     # Tracking.
+    "TrackingIndex",
     "consolidate_tracking_rows",
     "update_tracking_rows",
+    "update_tracking_rows_multi",
     # Workspace.
     "Session",
     "build_locator",
@@ -0,0 +1,360 @@
+"""Index advice operations."""
+from collections import defaultdict
+from contextlib import ContextDecorator
+from dataclasses import dataclass, fields
+from logging import DEBUG, INFO, Logger, getLogger
+from os.path import abspath, normcase
+from pathlib import Path
+from re import compile as re_compile
+from types import TracebackType
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple, Type, TypeVar
+
+from arcpy import Exists, SetLogHistory
+
+from arcproc.dataset import add_index
+from arcproc.metadata import FEATURE_COUNT_CACHE, METADATA_CACHE, Dataset
+from arcproc.profiling import FIELD_ACCESS_LOG, metrics
+
+
+LOG: Logger = getLogger(__name__)
+"""Module-level logger."""
+
+SetLogHistory(False)
+
+INDEX_SCAN_SECONDS_PER_ROW: float = 0.000_002
+"""Default seconds to scan one row, if no cursor profile has measured it."""
+SQL_IDENTIFIER_PATTERN: Pattern = re_compile(r"[A-Za-z_][A-Za-z0-9_]*")
+"""Pattern for identifiers (e.g. field names) in an SQL where-clause."""
+SQL_STRING_LITERAL_PATTERN: Pattern = re_compile(r"'(?:[^']|'')*'")
+"""Pattern for string literals in an SQL where-clause."""
+
+# Py3.7: Can replace usage with `typing.Self` in Py3.11.
+TIndexAdvisor = TypeVar("TIndexAdvisor", bound="IndexAdvisor")
+"""Type variable to enable method return of self on IndexAdvisor."""
+
+
+@dataclass
+class IndexRecommendation:
+    """Representation of a recommended dataset index."""
+
+    dataset_path: Path
+    """Path to dataset."""
+    field_names: List[str]
+    """Names of fields to index, in index order."""
+    index_type: str
+    """Type of index: "attribute" or "spatial"."""
+    access_count: int
+    """Number of recorded accesses the index would serve."""
+    row_count: int
+    """Number of rows in dataset (estimated)."""
+    seconds_per_row: float
+    """Seconds to scan one row, measured by cursor profiles or default."""
+    estimated_seconds_saved: float
+    """Estimated scan time the index would have saved over the recorded accesses."""
+    applied: bool = False
+    """True if index exists on dataset after applying, False otherwise."""
+
+    @property
+    def as_dict(self) -> dict:
+        """Recommendation as dictionary."""
+        return dict(
+            (_field.name, getattr(self, _field.name)) for _field in fields(self)
+        )
+
+
+class IndexAdvisor(ContextDecorator):
+    """Context manager for index advice from recorded field-access patterns.
+
+    While an advisor is open, arcproc records the fields each dataset is accessed by
+    (where-clause subselections, ID & join keys, & spatial relationships) in
+    `FIELD_ACCESS_LOG`. Recommendations are made for frequently-accessed fields that
+    have no index, on datasets with enough rows for an index to matter.
+    """
+
+    min_access_count: int
+    """Minimum number of recorded accesses for a recommendation."""
+    min_row_count: int
+    """Minimum number of dataset rows for a recommendation."""
+    selectivity: float
+    """Assumed fraction of rows an indexed access reads, for estimating time saved."""
+
+    def __init__(
+        self,
+        *,
+        min_access_count: int = 2,
+        min_row_count: int = 10_000,
+        selectivity: float = 0.01,
+    ) -> None:
+        """Initialize instance.
+
+        Args:
+            min_access_count: Minimum number of recorded accesses for a recommendation.
+            min_row_count: Minimum number of dataset rows for a recommendation.
+            selectivity: Assumed fraction of rows an indexed access reads, for
+                estimating time saved.
+        """
+        self.min_access_count = min_access_count
+        self.min_row_count = min_row_count
+        self.selectivity = selectivity
+        self._is_open = False
+
+    def __enter__(self) -> TIndexAdvisor:
+        return self.open()
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """True if advisor is open (recording field accesses), False otherwise."""
+        return self._is_open
+
+    def apply(
+        self,
+        recommendations: Optional[Iterable[IndexRecommendation]] = None,
+        *,
+        log_level: int = INFO,
+    ) -> List[IndexRecommendation]:
+        """Add recommended indexes to datasets.
+
+        Datasets locked by other processes are skipped (logged as a warning).
+
+        Args:
+            recommendations: Recommendations to apply. If set to None, will apply all
+                current recommendations.
+            log_level: Level to log the function at.
+
+        Returns:
+            Applied recommendations, with `applied` set to True if the index now
+            exists.
+        """
+        LOG.log(log_level, "Start: Apply index recommendations.")
+        if recommendations is None:
+            recommendations = self.recommendations()
+        recommendations = list(recommendations)
+        for recommendation in recommendations:
+            add_index(
+                recommendation.dataset_path,
+                field_names=recommendation.field_names,
+                fail_on_lock_ok=True,
+                log_level=DEBUG,
+            )
+            recommendation.applied = _is_indexed(
+                recommendation.dataset_path,
+                recommendation.field_names,
+                spatial=(recommendation.index_type == "spatial"),
+            )
+            LOG.log(
+                log_level,
+                "%s %s index on `%s` (%s).",
+                "Added" if recommendation.applied else "Could not add",
+                recommendation.index_type,
+                recommendation.dataset_path,
+                ", ".join(recommendation.field_names),
+            )
+        LOG.log(log_level, "End: Apply.")
+        return recommendations
+
+    def close(self) -> None:
+        """Close advisor, stopping field-access recording."""
+        if self._is_open:
+            FIELD_ACCESS_LOG.stop()
+            self._is_open = False
+
+    def open(self) -> TIndexAdvisor:
+        """Open advisor, starting field-access recording."""
+        if not self._is_open:
+            FIELD_ACCESS_LOG.start()
+            self._is_open = True
+        return self
+
+    def recommendations(self) -> List[IndexRecommendation]:
+        """Return index recommendations from recorded field accesses.
+
+        Recommendations are sorted by estimated time saved, greatest first.
+        """
+        dataset_accesses = defaultdict(list)
+        for access_key, count in FIELD_ACCESS_LOG.counts.items():
+            dataset_accesses[normcase(abspath(str(access_key[0])))].append(
+                access_key + (count,)
+            )
+        seconds_per_row = _profiled_seconds_per_row()
+        recommendations = []
+        for key, accesses in dataset_accesses.items():
+            dataset_path = Path(accesses[0][0])
+            if not Exists(dataset_path):
+                continue
+
+            row_count = FEATURE_COUNT_CACHE.count(dataset_path, estimate=True)
+            if row_count < self.min_row_count:
+                continue
+
+            for (field_names, index_type), access_count in _index_access_counts(
+                dataset_path, accesses
+            ).items():
+                if access_count < self.min_access_count:
+                    continue
+
+                if _is_indexed(
+                    dataset_path, field_names, spatial=(index_type == "spatial")
+                ):
+                    continue
+
+                row_seconds = seconds_per_row.get(key, INDEX_SCAN_SECONDS_PER_ROW)
+                recommendations.append(
+                    IndexRecommendation(
+                        dataset_path=dataset_path,
+                        field_names=list(field_names),
+                        index_type=index_type,
+                        access_count=access_count,
+                        row_count=row_count,
+                        seconds_per_row=row_seconds,
+                        # Each unindexed access scans every row; indexed reads a part.
+                        estimated_seconds_saved=(
+                            access_count
+                            * row_count
+                            * row_seconds
+                            * (1.0 - self.selectivity)
+                        ),
+                    )
+                )
+        return sorted(
+            recommendations,
+            key=lambda recommendation: recommendation.estimated_seconds_saved,
+            reverse=True,
+        )
+
+    def report(
+        self, *, logger: Optional[Logger] = None, log_level: int = INFO
+    ) -> List[IndexRecommendation]:
+        """Log index recommendations.
+
+        Args:
+            logger: Logger to emit report loglines. If not specified, will use module-
+                level logger.
+            log_level: Level to log the report at.
+
+        Returns:
+            Index recommendations.
+        """
+        if not logger:
+            logger = LOG
+        recommendations = self.recommendations()
+        if not recommendations:
+            logger.log(log_level, "No indexes recommended.")
+        for recommendation in recommendations:
+            logger.log(
+                log_level,
+                "Recommend %s index on `%s` (%s): %s accesses over %s rows, ~%.1f sec"
+                " scan time saved.",
+                recommendation.index_type,
+                recommendation.dataset_path,
+                ", ".join(recommendation.field_names),
+                recommendation.access_count,
+                recommendation.row_count,
+                recommendation.estimated_seconds_saved,
+            )
+        return recommendations
+
+    def reset(self) -> None:
+        """Clear all recorded field accesses."""
+        FIELD_ACCESS_LOG.clear()
+
+
+def _index_access_counts(
+    dataset_path: Path, accesses: Iterable[Tuple]
+) -> Dict[Tuple[Tuple[str, ...], str], int]:
+    """Return mapping of candidate index to access count for dataset.
+
+    Candidate index is a tuple of (field names, index type). Object ID fields are
+    never candidates, as they are always indexed.
+
+    Args:
+        dataset_path: Path to dataset.
+        accesses: Recorded accesses on dataset, as (dataset path, access type, detail,
+            count) tuples.
+    """
+    dataset = Dataset(dataset_path)
+    name_field_name = {
+        field_name.lower(): field_name for field_name in dataset.user_field_names
+    }
+    access_counts = defaultdict(int)
+    for _, access_type, detail, count in accesses:
+        if access_type == "spatial":
+            if dataset.is_spatial:
+                access_counts[((dataset.geometry_field_name,), "spatial")] += count
+        elif access_type == "key":
+            field_names = tuple(
+                name_field_name[field_name.lower()]
+                for field_name in detail
+                if field_name.lower() in name_field_name
+            )
+            # Tokens (e.g. `OID@`) or missing fields make key unindexable as a whole.
+            if field_names and len(field_names) == len(detail):
+                access_counts[(field_names, "attribute")] += count
+        else:
+            for field_name in _where_sql_field_names(detail, name_field_name):
+                access_counts[((field_name,), "attribute")] += count
+    return access_counts
+
+
+def _is_indexed(
+    dataset_path: Path, field_names: Iterable[str], *, spatial: bool = False
+) -> bool:
+    """Return True if dataset has an index leading with the given fields.
+
+    Args:
+        dataset_path: Path to dataset.
+        field_names: Names of fields, in index order.
+        spatial: Check for a spatial index if True.
+    """
+    describe_object = METADATA_CACHE.describe(dataset_path)
+    if spatial:
+        return bool(getattr(describe_object, "hasSpatialIndex", False))
+
+    field_names = [field_name.lower() for field_name in field_names]
+    for index in getattr(describe_object, "indexes", []):
+        index_field_names = [_field.name.lower() for _field in index.fields]
+        if index_field_names[: len(field_names)] == field_names:
+            return True
+
+    return False
+
+
+def _profiled_seconds_per_row() -> Dict[str, float]:
+    """Return mapping of dataset path key to measured seconds to fetch one row.
+
+    Measurements come from recorded cursor profiles (see `profile_cursor`).
+    """
+    dataset_seconds = defaultdict(float)
+    dataset_rows = defaultdict(int)
+    for metric in metrics("cursor"):
+        key = normcase(abspath(str(metric.values["dataset_path"])))
+        dataset_seconds[key] += metric.values["fetch_seconds"]
+        dataset_rows[key] += metric.values["row_count"]
+    return {
+        key: dataset_seconds[key] / row_count
+        for key, row_count in dataset_rows.items()
+        if row_count
+    }
+
+
+def _where_sql_field_names(where_sql: str, name_field_name: Dict[str, str]) -> Set[str]:
+    """Return names of dataset fields referenced in SQL where-clause.
+
+    Args:
+        where_sql: SQL where-clause.
+        name_field_name: Mapping of lowercase field name to field name, for fields on
+            the dataset.
+    """
+    where_sql = SQL_STRING_LITERAL_PATTERN.sub("''", where_sql)
+    return {
+        name_field_name[identifier.lower()]
+        for identifier in SQL_IDENTIFIER_PATTERN.findall(where_sql)
+        if identifier.lower() in name_field_name
+    }
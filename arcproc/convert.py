@@ -27,8 +27,15 @@ from arcproc.dataset import (
 )
 from arcproc.features import insert_features_from_dataset
 from arcproc.field import add_field, delete_field, update_field_with_join
-from arcproc.metadata import Dataset, SpatialReference, SpatialReferenceSourceItem
+from arcproc.metadata import (
+    FEATURE_COUNT_CACHE,
+    METADATA_CACHE,
+    Dataset,
+    SpatialReference,
+    SpatialReferenceSourceItem,
+)
 from arcproc.misc import log_entity_states, unique_name
+from arcproc.profiling import profile_cursor
 
 
 LOG: Logger = getLogger(__name__)
@@ -66,7 +73,7 @@ def convert_lines_to_vertex_points(
         output_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     with view:
         FeatureVerticesToPoints(
@@ -75,8 +82,10 @@ def convert_lines_to_vertex_points(
             out_feature_class=str(output_path),
             point_location="ALL" if not endpoints_only else "BOTH_ENDS",
         )
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     delete_field(output_path, field_name="ORIG_FID", log_level=DEBUG)
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Convert.")
     return states
@@ -117,23 +126,35 @@ def convert_points_to_multipoints(
         template=str(dataset_path),
         spatial_reference=_dataset.spatial_reference.object,
     )
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     field_names = _dataset.user_field_names + ["SHAPE@"]
-    # ArcPy2.8.0: Convert Path to str.
-    multipoint_cursor = InsertCursor(in_table=str(output_path), field_names=field_names)
-    # ArcPy2.8.0: Convert Path to str.
-    point_cursor = SearchCursor(
-        in_table=str(dataset_path),
-        field_names=field_names,
-        where_clause=dataset_where_sql,
+    multipoint_cursor = profile_cursor(
+        # ArcPy2.8.0: Convert Path to str.
+        InsertCursor(in_table=str(output_path), field_names=field_names),
+        dataset_path=output_path,
+    )
+    point_cursor = profile_cursor(
+        # ArcPy2.8.0: Convert Path to str.
+        SearchCursor(
+            in_table=str(dataset_path),
+            field_names=field_names,
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
+    states["in output"] = 0
     with multipoint_cursor, point_cursor:
         for point_feature in point_cursor:
             multipoint_geometry = Multipoint(point_feature[-1].firstPoint)
             multipoint_feature = point_feature[:-1] + (multipoint_geometry,)
             multipoint_cursor.insertRow(multipoint_feature)
-    states["in output"] = dataset_feature_count(output_path)
+            states["in output"] += 1
+    # Output was created above, so insert count is its feature count.
+    FEATURE_COUNT_CACHE.record(output_path, states["in output"])
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Convert.")
     return states
@@ -166,7 +187,7 @@ def convert_points_to_thiessen_polygons(  # pylint: disable=invalid-name
         output_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     with view:
         # ArcPy2.8.0: Convert Path to str.
@@ -175,7 +196,9 @@ def convert_points_to_thiessen_polygons(  # pylint: disable=invalid-name
             out_feature_class=str(output_path),
             fields_to_copy="ALL",
         )
-    states["in output"] = dataset_feature_count(output_path)
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Convert.")
     return states
@@ -222,7 +245,7 @@ def convert_polygons_to_lines(
         output_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     with view:
         # ArcPy2.8.0: Convert Path to str.
@@ -233,6 +256,8 @@ def convert_polygons_to_lines(
                 "IDENTIFY_NEIGHBORS" if make_topological else "IGNORE_NEIGHBORS"
             ),
         )
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     if make_topological:
         _dataset = Dataset(dataset_path)
         for side in ["left", "right"]:
@@ -260,7 +285,7 @@ def convert_polygons_to_lines(
             delete_field(output_path, field_name=oid_key, log_level=DEBUG)
     else:
         delete_field(output_path, field_name="ORIG_FID", log_level=DEBUG)
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Convert.")
     return states
@@ -299,7 +324,7 @@ def convert_projection(
     )
     _dataset = Dataset(dataset_path)
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     # Project tool ignores view selections, so we create empty output & insert features.
     create_dataset(
         dataset_path=output_path,
@@ -315,7 +340,7 @@ def convert_projection(
         source_where_sql=dataset_where_sql,
         log_level=DEBUG,
     )
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Convert.")
     return states
@@ -410,7 +435,7 @@ def convert_table_to_points(
     )
     layer_name = unique_name()
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     MakeXYEventLayer(
         table=view.name,
@@ -422,7 +447,7 @@ def convert_table_to_points(
     )
     copy_dataset_features(layer_name, output_path=output_path, log_level=DEBUG)
     Delete(layer_name)
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Convert.")
     return states
@@ -462,14 +487,16 @@ def convert_to_planar_lines(
         output_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     with view:
         # ArcPy2.8.0: Convert Path to str.
         FeatureToLine(
             in_features=view.name, out_feature_class=str(output_path), attributes=True
         )
-    states["in output"] = dataset_feature_count(output_path)
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Convert.")
     return states
@@ -505,12 +532,14 @@ def split_lines_at_vertices(
         output_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     with view:
         # ArcPy2.8.0: Convert Path to str.
         SplitLine(in_features=view.name, out_feature_class=str(output_path))
-    states["in output"] = dataset_feature_count(output_path)
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Split.")
     return states
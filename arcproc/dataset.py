@@ -1,10 +1,29 @@
 """Dataset-level operations."""
+import atexit
+from collections import OrderedDict
 from contextlib import ContextDecorator
+from dataclasses import dataclass
 from functools import partial
 from logging import DEBUG, INFO, Logger, getLogger
+from operator import itemgetter
+from os.path import normcase
 from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
 from types import TracebackType
-from typing import Any, Iterable, Iterator, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from arcpy import ExecuteError, Exists, FeatureSet, FieldInfo, RecordSet, SetLogHistory
 from arcpy.conversion import FeatureClassToFeatureClass, TableToTable
@@ -18,6 +37,7 @@ from arcpy.management import (
     CopyFeatures,
     CopyRows,
     CreateFeatureclass,
+    CreateFileGDB,
     CreateTable,
     Delete,
     GetCount,
@@ -27,12 +47,15 @@ from arcpy.management import (
 )
 
 from arcproc.metadata import (
+    FEATURE_COUNT_CACHE,
+    METADATA_CACHE,
     Dataset,
     Field,
     SpatialReference,
     SpatialReferenceSourceItem,
 )
 from arcproc.misc import unique_name
+from arcproc.profiling import FIELD_ACCESS_LOG, profile_cursor
 
 
 LOG: Logger = getLogger(__name__)
@@ -44,9 +67,144 @@ SetLogHistory(False)
 TDatasetView = TypeVar("TDatasetView", bound="DatasetView")
 """Type variable to enable method return of self on DatasetView."""
 # Py3.7: Can replace usage with `typing.Self` in Py3.11.
+TDatasetViewPool = TypeVar("TDatasetViewPool", bound="DatasetViewPool")
+"""Type variable to enable method return of self on DatasetViewPool."""
+# Py3.7: Can replace usage with `typing.Self` in Py3.11.
 TTempDatasetCopy = TypeVar("TTempDatasetCopy", bound="TempDatasetCopy")
 """Type variable to enable method return of self on TempDatasetCopy."""
 
+CHUNK_WEIGHT_TOKENS: Dict[str, Optional[str]] = {
+    "bytes": "SHAPE@WKB",
+    "rows": None,
+    "vertices": "SHAPE@",
+}
+"""Mapping of chunk weight measure to cursor token the measure is derived from."""
+SCRATCH_FIELD_TYPE_BYTES: Dict[str, int] = {
+    "blob": 1024,
+    "date": 8,
+    "double": 8,
+    "globalid": 38,
+    "guid": 38,
+    "integer": 4,
+    "oid": 4,
+    "single": 4,
+    "smallinteger": 2,
+}
+"""Mapping of field type to estimated bytes per value. Text fields use their length."""
+SCRATCH_GEOMETRY_TYPE_BYTES: Dict[str, int] = {
+    "multipatch": 16384,
+    "multipoint": 1024,
+    "point": 32,
+    "polygon": 4096,
+    "polyline": 2048,
+}
+"""Mapping of geometry type to estimated bytes per geometry."""
+
+
+@dataclass
+class ChunkPlan:
+    """Plan of object ID ranges that split dataset features into chunks.
+
+    Chunks are contiguous object ID ranges, so each chunk can be selected with a
+    simple where-clause (e.g. in a worker process).
+    """
+
+    oid_field_name: str
+    """Name of the object ID field."""
+    oid_ranges: List[Tuple[int, int]]
+    """First & last object ID in each chunk."""
+    weights: List[float]
+    """Total weight of features in each chunk."""
+    dataset_where_sql: Optional[str] = None
+    """SQL where-clause for dataset subselection the plan covers."""
+
+    def __len__(self) -> int:
+        return len(self.oid_ranges)
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset_path: Union[Path, str],
+        *,
+        chunk_size: Union[float, int],
+        weight_by: str = "rows",
+        dataset_where_sql: Optional[str] = None,
+    ) -> "ChunkPlan":
+        """Return chunk plan for dataset.
+
+        Features are read once; chunk boundaries are then set in one pass over the
+        features in object ID order.
+
+        Args:
+            dataset_path: Path to dataset.
+            chunk_size: Maximum total weight of features in each chunk. A single
+                feature heavier than this will be a chunk on its own.
+            weight_by: Measure of feature weight: "rows" (each feature weighs 1),
+                "vertices" (geometry vertex count), or "bytes" (geometry WKB size).
+            dataset_where_sql: SQL where-clause for dataset subselection.
+
+        Raises:
+            ValueError: If `weight_by` is not a valid measure.
+        """
+        if weight_by not in CHUNK_WEIGHT_TOKENS:
+            raise ValueError(f"Invalid weight_by `{weight_by}`")
+
+        dataset_path = Path(dataset_path)
+        token = CHUNK_WEIGHT_TOKENS[weight_by]
+        cursor = profile_cursor(
+            SearchCursor(
+                # ArcPy2.8.0: Convert to str.
+                in_table=str(dataset_path),
+                field_names=["OID@", token] if token else ["OID@"],
+                where_clause=dataset_where_sql,
+            ),
+            dataset_path=dataset_path,
+            where_sql=dataset_where_sql,
+        )
+        with cursor:
+            if weight_by == "rows":
+                oid_weights = [(oid, 1) for oid, in cursor]
+            elif weight_by == "vertices":
+                oid_weights = [
+                    (oid, geometry.pointCount if geometry else 0)
+                    for oid, geometry in cursor
+                ]
+            else:
+                oid_weights = [(oid, len(wkb) if wkb else 0) for oid, wkb in cursor]
+        # Sorting is important: allows selection by ID range.
+        oid_weights.sort(key=itemgetter(0))
+        oid_ranges = []
+        weights = []
+        for oid, weight in oid_weights:
+            if oid_ranges and weights[-1] + weight <= chunk_size:
+                oid_ranges[-1] = (oid_ranges[-1][0], oid)
+                weights[-1] += weight
+            else:
+                oid_ranges.append((oid, oid))
+                weights.append(weight)
+        return cls(
+            oid_field_name=Dataset(dataset_path).oid_field_name,
+            oid_ranges=oid_ranges,
+            weights=weights,
+            dataset_where_sql=dataset_where_sql,
+        )
+
+    @property
+    def where_sqls(self) -> List[str]:
+        """SQL where-clauses for each chunk."""
+        # ArcPy where clauses cannot use `BETWEEN`.
+        where_sql_template = (
+            "{oid_field_name} >= {from_oid} AND {oid_field_name} <= {to_oid}"
+        )
+        if self.dataset_where_sql:
+            where_sql_template += f" AND ({self.dataset_where_sql})"
+        return [
+            where_sql_template.format(
+                oid_field_name=self.oid_field_name, from_oid=from_oid, to_oid=to_oid
+            )
+            for from_oid, to_oid in self.oid_ranges
+        ]
+
 
 class DatasetView(ContextDecorator):
     """Context manager for an ArcGIS dataset view (feature layer/table view)."""
@@ -89,6 +247,9 @@ class DatasetView(ContextDecorator):
         )
         self.is_spatial = self.dataset.is_spatial and not force_nonspatial
         self.name = name if name else unique_name("View")
+        # Only views with auto-generated names can use a pooled view.
+        self._poolable = not name
+        self._pool: Optional[DatasetViewPool] = None
 
     def __enter__(self) -> TDatasetView:
         return self.create()
@@ -116,6 +277,7 @@ class DatasetView(ContextDecorator):
 
     @dataset_where_sql.setter
     def dataset_where_sql(self, value: str) -> None:
+        FIELD_ACCESS_LOG.record(self.dataset_path, "where", value)
         if self.exists:
             SelectLayerByAttribute(
                 in_layer_or_view=self.name,
@@ -148,46 +310,55 @@ class DatasetView(ContextDecorator):
             field_info.addField(field_name, field_name, visible, split_rule)
         return field_info
 
-    def as_chunks(self, chunk_size: int) -> Iterator[TDatasetView]:
+    def as_chunks(
+        self, chunk_size: Union[float, int], *, weight_by: str = "rows"
+    ) -> Iterator[TDatasetView]:
         """Generate "chunks" of view features in new DatasetView.
 
         DatasetView yielded under context management, i.e. view will be discarded
         when generator moves to next chunk-view.
 
         Args:
-            chunk_size: Number of features in each chunk-view.
+            chunk_size: Maximum total weight of features in each chunk-view.
+            weight_by: Measure of feature weight: "rows" (each feature weighs 1),
+                "vertices" (geometry vertex count), or "bytes" (geometry WKB size).
         """
-        # ArcPy where clauses cannot use `BETWEEN`.
-        where_sql_template = (
-            "{oid_field_name} >= {from_oid} AND {oid_field_name} <= {to_oid}"
-        )
-        if self._dataset_where_sql:
-            where_sql_template += f" AND ({self._dataset_where_sql})"
-        # Get iterable of all object IDs in dataset.
-        # ArcPy2.8.0: Convert to str.
-        cursor = SearchCursor(
-            in_table=str(self.dataset_path),
-            field_names=["OID@"],
-            where_clause=self._dataset_where_sql,
-        )
-        with cursor:
-            # Sorting is important: allows selection by ID range.
-            oids = sorted(oid for oid, in cursor)
-        while oids:
-            chunk_where_sql = where_sql_template.format(
-                oid_field_name=self.dataset.oid_field_name,
-                from_oid=min(oids),
-                to_oid=max(oids[:chunk_size]),
-            )
+        for chunk_where_sql in self.chunk_plan(
+            chunk_size, weight_by=weight_by
+        ).where_sqls:
             chunk_view = DatasetView(self.name, dataset_where_sql=chunk_where_sql)
             with chunk_view:
                 yield chunk_view
 
-            # Remove chunk from set.
-            oids = oids[chunk_size:]
+    def chunk_plan(
+        self, chunk_size: Union[float, int], *, weight_by: str = "rows"
+    ) -> ChunkPlan:
+        """Return plan of object ID ranges that split view features into chunks.
 
-    def create(self) -> TDatasetView:
-        """Create view."""
+        Args:
+            chunk_size: Maximum total weight of features in each chunk.
+            weight_by: Measure of feature weight: "rows" (each feature weighs 1),
+                "vertices" (geometry vertex count), or "bytes" (geometry WKB size).
+        """
+        return ChunkPlan.from_dataset(
+            self.dataset_path,
+            chunk_size=chunk_size,
+            weight_by=weight_by,
+            dataset_where_sql=self._dataset_where_sql,
+        )
+
+    @property
+    def _pool_key(self) -> Tuple[Any]:
+        """Key identifying views that are interchangeable in a view pool."""
+        return (
+            normcase(str(self.dataset_path)),
+            tuple(name.lower() for name in self.field_names),
+            self._dataset_where_sql,
+            self.is_spatial,
+        )
+
+    def _make(self) -> None:
+        """Make view layer with current name."""
         kwargs = {
             "where_clause": self.dataset_where_sql,
             # ArcPy2.8.0: Convert to str.
@@ -208,19 +379,367 @@ class DatasetView(ContextDecorator):
                 out_view=self.name,
                 **kwargs,
             )
+
+    def create(self) -> TDatasetView:
+        """Create view.
+
+        If a view pool is open, view will be taken from the pool where possible.
+        """
+        FIELD_ACCESS_LOG.record(self.dataset_path, "where", self.dataset_where_sql)
+        pool = DatasetViewPool.current()
+        if pool and self._poolable:
+            self._pool = pool
+            pool.acquire(self)
+        else:
+            self._make()
         return self
 
     def discard(self) -> bool:
         """Discard view.
 
+        If view was taken from a view pool, it is returned to the pool instead.
+
         Returns:
             True if view discarded, False otherwise.
         """
+        if self._pool:
+            self._pool.release(self.name)
+            self._pool = None
+            return True
+
         if self.exists:
             Delete(self.name)
+            METADATA_CACHE.invalidate(self.name)
         return not self.exists
 
 
+class DatasetViewPool(ContextDecorator):
+    """Context manager for a pool of reusable dataset views.
+
+    While a pool is open, DatasetView instances with auto-generated names take an idle
+    pooled view with the same dataset, fields, where-clause, & spatial flag instead of
+    making a new one, & are returned to the pool when discarded. Returned views have
+    their selection cleared before reuse. Views in use are never shared.
+    """
+
+    _open_pools: List["DatasetViewPool"] = []
+    """Open pools, most recently opened last."""
+
+    hits: int
+    """Number of views taken from the pool."""
+    max_idle: int
+    """Maximum number of idle views kept. Least-recently-used idle views past this are
+    discarded.
+    """
+    misses: int
+    """Number of views made for the pool."""
+
+    def __init__(self, *, max_idle: int = 32) -> None:
+        """Initialize instance.
+
+        Args:
+            max_idle: Maximum number of idle views kept.
+        """
+        self.max_idle = max_idle
+        self.hits = self.misses = 0
+        self._idle: "OrderedDict[str, Tuple[Any]]" = OrderedDict()
+        self._in_use: Dict[str, Tuple[Any]] = {}
+        self._stale: Set[str] = set()
+
+    def __enter__(self) -> TDatasetViewPool:
+        return self.open()
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
+        self.close()
+
+    @classmethod
+    def current(cls) -> Optional["DatasetViewPool"]:
+        """Return most recently opened pool. None if no pool is open."""
+        return cls._open_pools[-1] if cls._open_pools else None
+
+    @classmethod
+    def discard_dataset_views(cls, dataset_path: Union[Path, str]) -> None:
+        """Discard pooled views of dataset in all open pools.
+
+        Pooled views can hold locks on their dataset, so this should be called before
+        changing the dataset schema or deleting the dataset.
+
+        Args:
+            dataset_path: Path to dataset.
+        """
+        for pool in cls._open_pools:
+            pool.invalidate(dataset_path)
+
+    @property
+    def is_open(self) -> bool:
+        """True if pool is open, False otherwise."""
+        return self in self._open_pools
+
+    def _delete_view(self, name: str) -> None:
+        """Delete pooled view.
+
+        Args:
+            name: Name of view.
+        """
+        if Exists(name):
+            Delete(name)
+        METADATA_CACHE.invalidate(name)
+
+    def acquire(self, view: DatasetView) -> str:
+        """Take idle pooled view matching view, or make one, & assign its name to view.
+
+        Args:
+            view: Dataset view to assign pooled view to.
+
+        Returns:
+            Name of pooled view.
+        """
+        key = view._pool_key  # pylint: disable=protected-access
+        for name, idle_key in reversed(self._idle.items()):
+            if idle_key == key:
+                del self._idle[name]
+                view.name = name
+                SelectLayerByAttribute(
+                    in_layer_or_view=name, selection_type="CLEAR_SELECTION"
+                )
+                self.hits += 1
+                break
+
+        else:
+            view.name = unique_name("View")
+            view._make()  # pylint: disable=protected-access
+            self.misses += 1
+        self._in_use[view.name] = key
+        return view.name
+
+    def close(self) -> None:
+        """Close pool & discard all pooled views, including views still in use."""
+        if self.is_open:
+            self._open_pools.remove(self)
+        for name in list(self._idle) + list(self._in_use):
+            self._delete_view(name)
+        self._idle.clear()
+        self._in_use.clear()
+        self._stale.clear()
+        LOG.debug("View pool closed: %s hits, %s misses.", self.hits, self.misses)
+
+    def invalidate(self, dataset_path: Union[Path, str]) -> None:
+        """Discard idle pooled views of dataset, & views in use once returned.
+
+        Args:
+            dataset_path: Path to dataset.
+        """
+        path_key = normcase(str(Path(dataset_path)))
+        for name, key in list(self._idle.items()):
+            if key[0] == path_key:
+                del self._idle[name]
+                self._delete_view(name)
+        self._stale.update(
+            name for name, key in self._in_use.items() if key[0] == path_key
+        )
+
+    def open(self) -> TDatasetViewPool:
+        """Open pool, making it the current pool for new views."""
+        if not self.is_open:
+            self._open_pools.append(self)
+        return self
+
+    def release(self, name: str) -> None:
+        """Return pooled view to pool.
+
+        Args:
+            name: Name of view.
+        """
+        key = self._in_use.pop(name, None)
+        if key is None:
+            return
+
+        if name in self._stale or not self.is_open:
+            self._stale.discard(name)
+            self._delete_view(name)
+            return
+
+        self._idle[name] = key
+        while len(self._idle) > self.max_idle:
+            idle_name, _ = self._idle.popitem(last=False)
+            self._delete_view(idle_name)
+
+
+class ScratchPlacement:
+    """Placement policy for scratch (temporary) datasets.
+
+    Scratch datasets go in the `memory` workspace while their estimated size fits the
+    memory budget, & in a local scratch file geodatabase otherwise. All datasets
+    placed by the policy are deleted at process exit, along with the scratch
+    geodatabase.
+    """
+
+    memory_budget: int
+    """Maximum estimated bytes of scratch datasets to keep in the `memory`
+    workspace at once.
+    """
+
+    def __init__(self, *, memory_budget: int = 512 * 1024**2) -> None:
+        """Initialize instance.
+
+        Args:
+            memory_budget: Maximum estimated bytes of scratch datasets to keep in the
+                `memory` workspace at once.
+        """
+        self.memory_budget = memory_budget
+        self._folder_path: Optional[Path] = None
+        self._memory_bytes: Dict[Path, int] = {}
+        self._paths: Set[Path] = set()
+        atexit.register(self.cleanup)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated bytes of placed scratch datasets in the `memory` workspace."""
+        return sum(self._memory_bytes.values())
+
+    @property
+    def scratch_geodatabase_path(self) -> Path:
+        """Path to local scratch file geodatabase. Created on first access."""
+        if self._folder_path is None:
+            self._folder_path = Path(mkdtemp(prefix="arcproc"))
+            # ArcPy2.8.0: Convert to str.
+            CreateFileGDB(out_folder_path=str(self._folder_path), out_name="scratch")
+        return self._folder_path / "scratch.gdb"
+
+    def cleanup(self) -> None:
+        """Delete all placed scratch datasets & the scratch geodatabase."""
+        for dataset_path in self._paths:
+            if Exists(dataset_path):
+                # ArcPy2.8.0: Convert to str.
+                Delete(str(dataset_path))
+                FEATURE_COUNT_CACHE.invalidate(dataset_path)
+                METADATA_CACHE.invalidate(dataset_path)
+        self._memory_bytes.clear()
+        self._paths.clear()
+        if self._folder_path is not None:
+            # ArcPy2.8.0: Convert to str.
+            Delete(str(self._folder_path / "scratch.gdb"))
+            rmtree(self._folder_path, ignore_errors=True)
+            self._folder_path = None
+
+    def dataset_path(
+        self,
+        prefix: str = "",
+        suffix: str = "",
+        *,
+        unique_length: int = 4,
+        estimated_bytes: int = 0,
+    ) -> Path:
+        """Return unique path for a scratch dataset, placed by its estimated size.
+
+        Args:
+            prefix: Prefix insert before the unique part of the name.
+            suffix: Suffix to append after the unique part of the name.
+            unique_length: Number of unique characters to include in the name.
+            estimated_bytes: Estimated size of the scratch dataset.
+        """
+        in_memory = self.memory_bytes + estimated_bytes <= self.memory_budget
+        dataset_path = unique_dataset_path(
+            prefix,
+            suffix,
+            unique_length=unique_length,
+            workspace_path=(
+                Path("memory") if in_memory else self.scratch_geodatabase_path
+            ),
+        )
+        self._paths.add(dataset_path)
+        if in_memory:
+            self._memory_bytes[dataset_path] = estimated_bytes
+        LOG.debug(
+            "Placed scratch dataset `%s` (~%s bytes).", dataset_path, estimated_bytes
+        )
+        return dataset_path
+
+    def discard(self, dataset_path: Union[Path, str]) -> None:
+        """Delete scratch dataset & release its placement.
+
+        Args:
+            dataset_path: Path to scratch dataset.
+        """
+        dataset_path = Path(dataset_path)
+        if Exists(dataset_path):
+            # ArcPy2.8.0: Convert to str.
+            Delete(str(dataset_path))
+            FEATURE_COUNT_CACHE.invalidate(dataset_path)
+            METADATA_CACHE.invalidate(dataset_path)
+        self.release(dataset_path)
+
+    @staticmethod
+    def estimate_bytes(
+        dataset_path: Union[Path, str],
+        *,
+        field_names: Optional[Iterable[str]] = None,
+        dataset_where_sql: Optional[str] = None,
+        feature_count: Optional[int] = None,
+        force_nonspatial: bool = False,
+    ) -> int:
+        """Return estimated bytes for a copy of the dataset.
+
+        Estimate is the feature count times the estimated bytes per row, from the field
+        types & geometry type.
+
+        Args:
+            dataset_path: Path to dataset.
+            field_names: Collection of field names to include in copy. If set to None,
+                all fields will be included.
+            dataset_where_sql: SQL where-clause property for dataset subselection.
+            feature_count: Number of features in copy. If set to None, will use the
+                estimated feature count of the dataset subselection.
+            force_nonspatial: Estimate without geometry if True.
+        """
+        dataset = Dataset(dataset_path)
+        if field_names is not None:
+            field_names = {field_name.lower() for field_name in field_names}
+        row_bytes = 0
+        for field in dataset.fields:
+            if field.type.lower() == "geometry":
+                continue
+
+            if field.type.lower() != "oid" and not (
+                field_names is None or field.name.lower() in field_names
+            ):
+                continue
+
+            row_bytes += (
+                field.length
+                if field.type.lower() == "string"
+                else SCRATCH_FIELD_TYPE_BYTES.get(field.type.lower(), 8)
+            )
+        if dataset.is_spatial and not force_nonspatial:
+            row_bytes += SCRATCH_GEOMETRY_TYPE_BYTES.get(
+                dataset.geometry_type.lower(), 4096
+            )
+        if feature_count is None:
+            feature_count = dataset_feature_count(
+                dataset_path, dataset_where_sql=dataset_where_sql, estimate=True
+            )
+        return feature_count * row_bytes
+
+    def release(self, dataset_path: Union[Path, str]) -> None:
+        """Release placement of scratch dataset, without deleting it.
+
+        Args:
+            dataset_path: Path to scratch dataset.
+        """
+        dataset_path = Path(dataset_path)
+        self._memory_bytes.pop(dataset_path, None)
+        self._paths.discard(dataset_path)
+
+
+SCRATCH_PLACEMENT: ScratchPlacement = ScratchPlacement()
+"""Process-wide placement policy for scratch datasets."""
+
+
 class TempDatasetCopy(ContextDecorator):
     """Context manager for a temporary copy of a dataset."""
 
@@ -255,16 +774,13 @@ class TempDatasetCopy(ContextDecorator):
         Args:
             dataset_path: Path to original dataset.
             copy_path: Path to copy dataset. If set to None, path will be auto-
-                generated.
+                generated & placed by `SCRATCH_PLACEMENT` from the estimated copy size.
             field_names: Collection of field names to include in copy. If set to None,
                 all fields will be included.
             dataset_where_sql: SQL where-clause property for original dataset
                 subselection.
             force_nonspatial: Forces view to be nonspatial if True.
         """
-        self.copy_path = (
-            Path(copy_path) if copy_path else unique_dataset_path("TempCopy")
-        )
         self.dataset = Dataset(path=dataset_path)
         self.dataset_path = Path(dataset_path)
         self.dataset_where_sql = dataset_where_sql
@@ -272,6 +788,19 @@ class TempDatasetCopy(ContextDecorator):
             self.dataset.field_names if field_names is None else list(field_names)
         )
         self.is_spatial = self.dataset.is_spatial and not force_nonspatial
+        self._placed = not copy_path
+        if copy_path:
+            self.copy_path = Path(copy_path)
+        else:
+            self.copy_path = SCRATCH_PLACEMENT.dataset_path(
+                "TempCopy",
+                estimated_bytes=SCRATCH_PLACEMENT.estimate_bytes(
+                    self.dataset_path,
+                    field_names=self.field_names,
+                    dataset_where_sql=self.dataset_where_sql,
+                    force_nonspatial=(not self.is_spatial),
+                ),
+            )
 
     def __enter__(self) -> TTempDatasetCopy:
         return self.create()
@@ -306,6 +835,7 @@ class TempDatasetCopy(ContextDecorator):
             else:
                 # ArcPy2.8.0: Convert to str.
                 CopyRows(in_rows=view.name, out_table=str(self.copy_path))
+        FEATURE_COUNT_CACHE.invalidate(self.copy_path)
         return self
 
     def discard(self) -> bool:
@@ -317,6 +847,10 @@ class TempDatasetCopy(ContextDecorator):
         if self.exists:
             # ArcPy2.8.0: Convert to str.
             Delete(str(self.copy_path))
+            FEATURE_COUNT_CACHE.invalidate(self.copy_path)
+            METADATA_CACHE.invalidate(self.copy_path)
+        if self._placed:
+            SCRATCH_PLACEMENT.release(self.copy_path)
         return not self.exists
 
 
@@ -389,6 +923,7 @@ def add_index(
             if not fail_on_lock_ok:
                 raise
 
+    METADATA_CACHE.invalidate(dataset_path)
     LOG.log(log_level, "End: Add.")
     return [Field(dataset_path, field_name) for field_name in field_names]
 
@@ -496,6 +1031,8 @@ def copy_dataset(
         else:
             raise ValueError(f"`{dataset_path}` unsupported dataset type.")
 
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     LOG.log(log_level, "End: Copy.")
     return Dataset(output_path)
 
@@ -553,6 +1090,8 @@ def copy_dataset_features(
         else:
             raise ValueError(f"`{dataset_path}` unsupported dataset type.")
 
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     LOG.log(log_level, "End: Copy.")
     return Dataset(output_path)
 
@@ -611,6 +1150,8 @@ def create_dataset(
                 field_is_nullable=field_metadata.get("is_nullable", True),
                 field_is_required=field_metadata.get("is_required", False),
             )
+    FEATURE_COUNT_CACHE.record(dataset_path, 0)
+    METADATA_CACHE.invalidate(dataset_path)
     LOG.log(log_level, "End: Create.")
     return Dataset(dataset_path)
 
@@ -646,18 +1187,85 @@ def dataset_as_feature_set(
 
 
 def dataset_feature_count(
-    dataset_path: Union[Path, str], *, dataset_where_sql: Optional[str] = None
+    dataset_path: Union[Path, str],
+    *,
+    dataset_where_sql: Optional[str] = None,
+    estimate: bool = False,
+    refresh: bool = False,
 ) -> int:
     """Return number of features in dataset.
 
+    Counts are cached in `FEATURE_COUNT_CACHE`.
+
     Args:
         dataset_path: Path to dataset.
         dataset_where_sql: SQL where-clause property for dataset subselection.
+        estimate: If True, may return an expired cached count, or a count from dataset
+            file metadata (whole dataset only), instead of counting features.
+        refresh: If True, will count features even if a current count is cached. Use
+            for counts reported as results, which must not miss outside edits.
     """
     dataset_path = Path(dataset_path)
-    view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
-    with view:
-        return view.feature_count
+    if not dataset_where_sql:
+        return FEATURE_COUNT_CACHE.count(
+            dataset_path, estimate=estimate, refresh=refresh
+        )
+
+    count = None
+    if not refresh:
+        count = FEATURE_COUNT_CACHE.lookup(
+            dataset_path, dataset_where_sql=dataset_where_sql, estimate=estimate
+        )
+    if count is None:
+        view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
+        with view:
+            count = view.feature_count
+        FEATURE_COUNT_CACHE.record(
+            dataset_path, count, dataset_where_sql=dataset_where_sql
+        )
+    return count
+
+
+def dataset_signature(
+    dataset_path: Union[Path, str], *, refresh_count: bool = False
+) -> Tuple[int, Optional[float]]:
+    """Return signature that changes when the dataset changes.
+
+    Signature is the feature count & the latest modified-time of the files storing the
+    dataset. For file geodatabases, the modified-time is geodatabase-wide: it is the
+    latest for any file in the geodatabase, so a change to any dataset in it changes
+    the signature for all of them. Workspaces not stored as local files (e.g.
+    enterprise geodatabases) only have the feature count in the signature, so
+    same-count edits will not register.
+
+    Args:
+        dataset_path: Path to dataset.
+        refresh_count: Count features even if the count is cached, if True. If
+            False, a cached count is used where the signature has a modified-time
+            (which registers changes made outside arcproc); without one, the count is
+            always refreshed.
+    """
+    dataset_path = Path(dataset_path)
+    workspace_path = Path(Dataset(dataset_path).workspace_path)
+    # Feature dataset "workspace" is not a real folder; use the geodatabase.
+    geodatabase_paths = [
+        path
+        for path in [workspace_path] + list(workspace_path.parents)
+        if path.suffix.lower() == ".gdb"
+    ]
+    if geodatabase_paths and geodatabase_paths[0].is_dir():
+        file_paths = geodatabase_paths[0].iterdir()
+    elif workspace_path.is_dir():
+        file_paths = workspace_path.glob(f"{dataset_path.stem}.*")
+    else:
+        file_paths = []
+    modified_times = [path.stat().st_mtime for path in file_paths if path.is_file()]
+    return (
+        FEATURE_COUNT_CACHE.count(
+            dataset_path, refresh=(refresh_count or not modified_times)
+        ),
+        max(modified_times) if modified_times else None,
+    )
 
 
 def delete_dataset(dataset_path: Union[Path, str], *, log_level: int = INFO) -> Dataset:
@@ -673,8 +1281,12 @@ def delete_dataset(dataset_path: Union[Path, str], *, log_level: int = INFO) ->
     dataset_path = Path(dataset_path)
     LOG.log(log_level, "Start: Delete dataset `%s`.", dataset_path)
     _dataset = Dataset(dataset_path)
+    DatasetViewPool.discard_dataset_views(dataset_path)
     # ArcPy2.8.0: Convert to str.
     Delete(in_data=str(dataset_path))
+    FEATURE_COUNT_CACHE.invalidate(dataset_path)
+    METADATA_CACHE.invalidate(dataset_path)
+    SCRATCH_PLACEMENT.release(dataset_path)
     LOG.log(log_level, "End: Delete.")
     return _dataset
 
@@ -788,7 +1400,8 @@ def unique_dataset_path(
     suffix: str = "",
     *,
     unique_length: int = 4,
-    workspace_path: Union[Path, str] = Path("memory"),
+    workspace_path: Optional[Union[Path, str]] = Path("memory"),
+    estimated_bytes: Optional[int] = None,
 ) -> Path:
     """Return unique dataset path in the given workspace.
 
@@ -796,9 +1409,20 @@ def unique_dataset_path(
         prefix: Prefix insert before the unique part of the name.
         suffix: Suffix to append after the unique part of the name.
         unique_length: Number of unique characters to include in the name.
-        workspace_path: Path of workspace to create the dataset in.
+        workspace_path: Path of workspace to create the dataset in. If set to None,
+            will be placed as a scratch dataset by `SCRATCH_PLACEMENT`.
+        estimated_bytes: Estimated size of the dataset. If set, will be placed as a
+            scratch dataset by `SCRATCH_PLACEMENT`, overriding `workspace_path`.
     """
-    workspace_path = Path(workspace_path) if workspace_path else Path("memory")
+    if workspace_path is None or estimated_bytes is not None:
+        return SCRATCH_PLACEMENT.dataset_path(
+            prefix,
+            suffix,
+            unique_length=unique_length,
+            estimated_bytes=(estimated_bytes or 0),
+        )
+
+    workspace_path = Path(workspace_path)
     name = unique_name(
         prefix, suffix, unique_length=unique_length, allow_initial_digit=False
     )
@@ -22,9 +22,15 @@ from arcpy.da import InsertCursor, SearchCursor, UpdateCursor
 from arcpy.management import Append, DeleteRows, SelectLayerByLocation
 from pint import UnitRegistry
 
-from arcproc.dataset import DatasetView, dataset_feature_count
-from arcproc.metadata import Dataset, SpatialReference, SpatialReferenceSourceItem
+from arcproc.dataset import DatasetView
+from arcproc.metadata import (
+    FEATURE_COUNT_CACHE,
+    Dataset,
+    SpatialReference,
+    SpatialReferenceSourceItem,
+)
 from arcproc.misc import freeze_values, log_entity_states, same_feature, unique_name
+from arcproc.profiling import FIELD_ACCESS_LOG, profile_cursor
 from arcproc.workspace import Session
 
 
@@ -65,7 +71,9 @@ def delete_features(
     with view, session:
         states["deleted"] = view.feature_count
         DeleteRows(in_rows=view.name)
-        states["remaining"] = dataset_feature_count(dataset_path)
+        FEATURE_COUNT_CACHE.adjust(dataset_path, -states["deleted"])
+        # Cached count may predate outside edits: recount the reported result.
+        states["remaining"] = FEATURE_COUNT_CACHE.count(dataset_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Delete.")
     return states
@@ -107,20 +115,29 @@ def delete_features_with_ids(
         else:
             ids.add((_id,))
     states = Counter()
+    FIELD_ACCESS_LOG.record(dataset_path, "key", id_field_names)
     if ids:
         # ArcPy2.8.0: Convert Path to str.
-        cursor = UpdateCursor(str(dataset_path), field_names=id_field_names)
+        cursor = profile_cursor(
+            UpdateCursor(str(dataset_path), field_names=id_field_names),
+            dataset_path=dataset_path,
+        )
         session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
+        feature_count = 0
         with session, cursor:
             for row in cursor:
+                feature_count += 1
                 _id = tuple(row)
                 if _id in ids:
                     cursor.deleteRow()
                     states["deleted"] += 1
+        # Cursor passed over every feature: remaining count is known.
+        states["unchanged"] = feature_count - states["deleted"]
+        FEATURE_COUNT_CACHE.record(dataset_path, states["unchanged"])
     else:
         LOG.log(log_level, "No IDs provided.")
         states["deleted"] = 0
-    states["unchanged"] = dataset_feature_count(dataset_path)
+        states["unchanged"] = FEATURE_COUNT_CACHE.count(dataset_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Delete.")
     return states
@@ -155,11 +172,15 @@ def densify_features(
     if _dataset.spatial_reference.linear_unit != "Meter":
         distance_unit = getattr(UNIT, _dataset.spatial_reference.linear_unit.lower())
         distance_with_unit = (distance * distance_unit).to(UNIT.meter) / UNIT.meter
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert Path to str.
-        in_table=str(dataset_path),
-        field_names=["SHAPE@"],
-        where_clause=dataset_where_sql,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert Path to str.
+            in_table=str(dataset_path),
+            field_names=["SHAPE@"],
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(_dataset.workspace_path, use_edit_session)
     states = Counter()
@@ -201,11 +222,15 @@ def eliminate_feature_inner_rings(
     """
     dataset_path = Path(dataset_path)
     LOG.log(log_level, "Start: Eliminate feature inner rings in `%s`.", dataset_path)
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert Path to str.
-        in_table=str(dataset_path),
-        field_names=["SHAPE@"],
-        where_clause=dataset_where_sql,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert Path to str.
+            in_table=str(dataset_path),
+            field_names=["SHAPE@"],
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     _dataset = Dataset(dataset_path)
     session = Session(_dataset.workspace_path, use_edit_session)
@@ -242,6 +267,7 @@ def features_as_dicts(
     *,
     dataset_where_sql: Optional[str] = None,
     spatial_reference_item: SpatialReferenceSourceItem = None,
+    order_by_field_names: Optional[Iterable[str]] = None,
 ) -> Iterator[Dict[str, Any]]:
     """Generate features as dictionaries of attribute name to value.
 
@@ -257,23 +283,42 @@ def features_as_dicts(
         spatial_reference_item: Item from which the spatial reference for any geometry
             properties will be set to. If set to None, will use spatial reference of
             the dataset.
+        order_by_field_names: Names of fields to order features by, ascending. Not
+            supported for datasets outside of databases (e.g. shapefiles). If set to
+            None, features will be in arbitrary order.
     """
     dataset_path = Path(dataset_path)
     if field_names:
         field_names = list(field_names)
     else:
         field_names = Dataset(dataset_path).field_names_tokenized
-    cursor = SearchCursor(
-        # ArcPy2.8.0: Convert Path to str.
-        in_table=str(dataset_path),
-        field_names=field_names,
-        where_clause=dataset_where_sql,
-        spatial_reference=SpatialReference(spatial_reference_item).object,
+    cursor = profile_cursor(
+        SearchCursor(
+            # ArcPy2.8.0: Convert Path to str.
+            in_table=str(dataset_path),
+            field_names=field_names,
+            where_clause=dataset_where_sql,
+            spatial_reference=SpatialReference(spatial_reference_item).object,
+            sql_clause=(
+                None,
+                f"ORDER BY {', '.join(order_by_field_names)}"
+                if order_by_field_names
+                else None,
+            ),
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
+    feature_count = 0
     with cursor:
         for feature in cursor:
+            feature_count += 1
             yield dict(zip(cursor.fields, feature))
 
+    FEATURE_COUNT_CACHE.record(
+        dataset_path, feature_count, dataset_where_sql=dataset_where_sql
+    )
+
 
 def features_as_tuples(
     dataset_path: Union[Path, str],
@@ -281,6 +326,7 @@ def features_as_tuples(
     *,
     dataset_where_sql: Optional[str] = None,
     spatial_reference_item: SpatialReferenceSourceItem = None,
+    order_by_field_names: Optional[Iterable[str]] = None,
 ) -> Iterator[Tuple[Any]]:
     """Generate features as tuples of attribute values.
 
@@ -295,18 +341,38 @@ def features_as_tuples(
         spatial_reference_item: Item from which the spatial reference for any geometry
             properties will be set to. If set to None, will use spatial reference of
             the dataset.
+        order_by_field_names: Names of fields to order features by, ascending. Not
+            supported for datasets outside of databases (e.g. shapefiles). If set to
+            None, features will be in arbitrary order.
     """
     field_names = list(field_names)
     dataset_path = Path(dataset_path)
-    cursor = SearchCursor(
-        # ArcPy2.8.0: Convert Path to str.
-        in_table=str(dataset_path),
-        field_names=field_names,
-        where_clause=dataset_where_sql,
-        spatial_reference=SpatialReference(spatial_reference_item).object,
+    cursor = profile_cursor(
+        SearchCursor(
+            # ArcPy2.8.0: Convert Path to str.
+            in_table=str(dataset_path),
+            field_names=field_names,
+            where_clause=dataset_where_sql,
+            spatial_reference=SpatialReference(spatial_reference_item).object,
+            sql_clause=(
+                None,
+                f"ORDER BY {', '.join(order_by_field_names)}"
+                if order_by_field_names
+                else None,
+            ),
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
+    feature_count = 0
     with cursor:
-        yield from cursor
+        for feature in cursor:
+            feature_count += 1
+            yield feature
+
+    FEATURE_COUNT_CACHE.record(
+        dataset_path, feature_count, dataset_where_sql=dataset_where_sql
+    )
 
 
 def insert_features_from_dataset(
@@ -385,6 +451,7 @@ def insert_features_from_dataset(
             field_mapping=field_mapping,
         )
         states["inserted"] = view.feature_count
+    FEATURE_COUNT_CACHE.adjust(dataset_path, states["inserted"])
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Insert.")
     return states
@@ -458,13 +525,17 @@ def insert_features_from_sequences(
     if isgeneratorfunction(source_features):
         source_features = source_features()
     # ArcPy2.8.0: Convert Path to str.
-    cursor = InsertCursor(in_table=str(dataset_path), field_names=field_names)
+    cursor = profile_cursor(
+        InsertCursor(in_table=str(dataset_path), field_names=field_names),
+        dataset_path=dataset_path,
+    )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
     with session, cursor:
         for row in source_features:
             cursor.insertRow(tuple(row))
             states["inserted"] += 1
+    FEATURE_COUNT_CACHE.adjust(dataset_path, states["inserted"])
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Insert.")
     return states
@@ -504,6 +575,8 @@ def keep_features_within_location(
     states = Counter()
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     location_view = DatasetView(location_path, dataset_where_sql=location_where_sql)
+    FIELD_ACCESS_LOG.record(dataset_path, "spatial")
+    FIELD_ACCESS_LOG.record(location_path, "spatial")
     with session, view, location_view:
         SelectLayerByLocation(
             in_layer=view.name,
@@ -513,6 +586,7 @@ def keep_features_within_location(
         )
         SelectLayerByLocation(in_layer=view.name, selection_type="SWITCH_SELECTION")
         states["deleted"] = delete_features(view.name, log_level=DEBUG)["deleted"]
+    FEATURE_COUNT_CACHE.adjust(dataset_path, -states["deleted"])
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Keep.")
     return states
@@ -545,11 +619,15 @@ def replace_feature_true_curves(
         dataset_path,
     )
     _dataset = Dataset(dataset_path)
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert Path to str.
-        in_table=str(dataset_path),
-        field_names=["SHAPE@"],
-        where_clause=dataset_where_sql,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert Path to str.
+            in_table=str(dataset_path),
+            field_names=["SHAPE@"],
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(_dataset.workspace_path, use_edit_session)
     states = Counter()
@@ -740,6 +818,7 @@ def update_features_from_sequences(
 
     if isgeneratorfunction(source_features):
         source_features = source_features()
+    FIELD_ACCESS_LOG.record(dataset_path, "key", id_field_names)
     dataset_ids = {
         tuple(freeze_values(*_id))
         for _id in features_as_tuples(dataset_path, id_field_names)
@@ -763,7 +842,10 @@ def update_features_from_sequences(
     states = Counter()
     if delete_ids or id_feature:
         # ArcPy2.8.0: Convert Path to str.
-        cursor = UpdateCursor(in_table=str(dataset_path), field_names=field_names)
+        cursor = profile_cursor(
+            UpdateCursor(in_table=str(dataset_path), field_names=field_names),
+            dataset_path=dataset_path,
+        )
         with session, cursor:
             for feature in cursor:
                 _id = tuple(
@@ -793,10 +875,13 @@ def update_features_from_sequences(
                 else:
                     states["unchanged"] += 1
     if insert_features:
-        cursor = InsertCursor(
-            # ArcPy2.8.0: Convert Path to str.
-            in_table=str(dataset_path),
-            field_names=field_names,
+        cursor = profile_cursor(
+            InsertCursor(
+                # ArcPy2.8.0: Convert Path to str.
+                in_table=str(dataset_path),
+                field_names=field_names,
+            ),
+            dataset_path=dataset_path,
         )
         with session, cursor:
             for new_feature in insert_features:
@@ -808,6 +893,7 @@ def update_features_from_sequences(
                     ) from error
 
                 states["inserted"] += 1
+    FEATURE_COUNT_CACHE.adjust(dataset_path, states["inserted"] - states["deleted"])
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Update.")
     return states
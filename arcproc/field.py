@@ -10,10 +10,16 @@ from typing import Any, Iterable, Iterator, Mapping, Optional, Union
 from arcpy import ListFields, SetLogHistory
 from arcpy.analysis import Identity, SpatialJoin
 from arcpy.da import SearchCursor, UpdateCursor
-from arcpy.management import AddField, AlterField, CalculateField, Delete, DeleteField
+from arcpy.management import AddField, AlterField, CalculateField, DeleteField
 
-from arcproc.dataset import DatasetView, unique_dataset_path
+from arcproc.dataset import (
+    SCRATCH_PLACEMENT,
+    DatasetView,
+    DatasetViewPool,
+    dataset_feature_count,
+)
 from arcproc.metadata import (
+    METADATA_CACHE,
     Dataset,
     Domain,
     Field,
@@ -27,6 +33,7 @@ from arcproc.misc import (
     same_value,
     unique_ids,
 )
+from arcproc.profiling import FIELD_ACCESS_LOG, profile_cursor
 from arcproc.workspace import Session
 
 
@@ -36,6 +43,37 @@ LOG: Logger = getLogger(__name__)
 SetLogHistory(False)
 
 
+def _overlay_output_bytes(
+    dataset_path: Path,
+    *,
+    overlay_dataset_path: Path,
+    overlay_field_names: Iterable[str],
+    dataset_where_sql: Optional[str] = None,
+) -> int:
+    """Return estimated bytes for overlay-tool output on dataset subselection.
+
+    Output rows carry the target geometry & OID plus the overlay fields copied in. The
+    overlay OID stands in for the key field the tool adds (TARGET_FID or FID_*).
+
+    Args:
+        dataset_path: Path to target dataset.
+        overlay_dataset_path: Path to overlay-dataset.
+        overlay_field_names: Names of overlay-fields copied into the output.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+    """
+    feature_count = dataset_feature_count(
+        dataset_path, dataset_where_sql=dataset_where_sql, estimate=True
+    )
+    return SCRATCH_PLACEMENT.estimate_bytes(
+        dataset_path, field_names=[], feature_count=feature_count
+    ) + SCRATCH_PLACEMENT.estimate_bytes(
+        overlay_dataset_path,
+        field_names=overlay_field_names,
+        feature_count=feature_count,
+        force_nonspatial=True,
+    )
+
+
 def add_field(
     dataset_path: Union[Path, str],
     *,
@@ -80,6 +118,7 @@ def add_field(
             raise RuntimeError("Cannot add existing field (exist_ok=False).")
 
     else:
+        DatasetViewPool.discard_dataset_views(dataset_path)
         # ArcPy2.8.0: Convert to str.
         AddField(
             in_table=str(dataset_path),
@@ -92,6 +131,7 @@ def add_field(
             field_is_nullable=is_nullable,
             field_is_required=is_required,
         )
+        METADATA_CACHE.invalidate(dataset_path)
     LOG.log(log_level, "End: Add.")
     return Field(dataset_path, name)
 
@@ -153,8 +193,10 @@ def delete_field(
         log_level, "Start: Delete field `%s` on dataset `%s`.", field_name, dataset_path
     )
     field = Field(dataset_path, name=field_name)
+    DatasetViewPool.discard_dataset_views(dataset_path)
     # ArcPy2.8.0: Convert to str.
     DeleteField(in_table=str(dataset_path), drop_field=field_name)
+    METADATA_CACHE.invalidate(dataset_path)
     LOG.log(log_level, "End: Delete.")
     return field
 
@@ -211,12 +253,16 @@ def field_values(
             the dataset.
     """
     dataset_path = Path(dataset_path)
-    cursor = SearchCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=[field_name],
-        where_clause=dataset_where_sql,
-        spatial_reference=SpatialReference(spatial_reference_item).object,
+    cursor = profile_cursor(
+        SearchCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(dataset_path),
+            field_names=[field_name],
+            where_clause=dataset_where_sql,
+            spatial_reference=SpatialReference(spatial_reference_item).object,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     with cursor:
         for (value,) in cursor:
@@ -249,10 +295,12 @@ def rename_field(
         dataset_path,
         new_field_name,
     )
+    DatasetViewPool.discard_dataset_views(dataset_path)
     # ArcPy2.8.0: Convert Path to str.
     AlterField(
         in_table=str(dataset_path), field=field_name, new_field_name=new_field_name
     )
+    METADATA_CACHE.invalidate(dataset_path)
     LOG.log(log_level, "End: Rename.")
     return Field(dataset_path, name=new_field_name)
 
@@ -310,8 +358,19 @@ def update_field_with_central_overlay(  # pylint: disable=invalid-name
         field_names=[overlay_field_name],
         dataset_where_sql=overlay_where_sql,
     )
+    FIELD_ACCESS_LOG.record(dataset_path, "spatial")
+    FIELD_ACCESS_LOG.record(overlay_dataset_path, "spatial")
     with view, overlay_view:
-        temp_output_path = unique_dataset_path("output")
+        # One-to-one keep-all join: a row per target feature, with the overlay-field.
+        temp_output_path = SCRATCH_PLACEMENT.dataset_path(
+            "output",
+            estimated_bytes=_overlay_output_bytes(
+                dataset_path,
+                overlay_dataset_path=overlay_dataset_path,
+                overlay_field_names=[overlay_field_name],
+                dataset_where_sql=dataset_where_sql,
+            ),
+        )
         SpatialJoin(
             target_features=view.name,
             join_features=overlay_view.name,
@@ -339,8 +398,7 @@ def update_field_with_central_overlay(  # pylint: disable=invalid-name
         use_edit_session=use_edit_session,
         log_level=DEBUG,
     )
-    # ArcPy2.8.0: Convert to str.
-    Delete(str(temp_output_path))
+    SCRATCH_PLACEMENT.discard(temp_output_path)
     log_entity_states("attributes", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Update.")
     return states
@@ -394,8 +452,20 @@ def update_field_with_dominant_overlay(  # pylint: disable=invalid-name
         field_names=[overlay_field_name],
         dataset_where_sql=overlay_where_sql,
     )
+    FIELD_ACCESS_LOG.record(dataset_path, "spatial")
+    FIELD_ACCESS_LOG.record(overlay_dataset_path, "spatial")
     with view, overlay_view:
-        temp_output_path = unique_dataset_path("output")
+        # Identity splits target features on overlay edges, so the output can have more
+        # rows than the target count estimated here.
+        temp_output_path = SCRATCH_PLACEMENT.dataset_path(
+            "output",
+            estimated_bytes=_overlay_output_bytes(
+                dataset_path,
+                overlay_dataset_path=overlay_dataset_path,
+                overlay_field_names=[overlay_field_name],
+                dataset_where_sql=dataset_where_sql,
+            ),
+        )
         Identity(
             in_features=view.name,
             identity_features=overlay_view.name,
@@ -410,10 +480,13 @@ def update_field_with_dominant_overlay(  # pylint: disable=invalid-name
         if field_name.startswith("FID_")
     ]
     oid_value_area = {}
-    cursor = SearchCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(temp_output_path),
-        field_names=oid_field_names + [overlay_field_name, "SHAPE@AREA"],
+    cursor = profile_cursor(
+        SearchCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(temp_output_path),
+            field_names=oid_field_names + [overlay_field_name, "SHAPE@AREA"],
+        ),
+        dataset_path=temp_output_path,
     )
     with cursor:
         for oid, overlay_oid, value, area in cursor:
@@ -426,8 +499,7 @@ def update_field_with_dominant_overlay(  # pylint: disable=invalid-name
             if oid not in oid_value_area:
                 oid_value_area[oid] = defaultdict(float)
             oid_value_area[oid][value] += area
-    # ArcPy2.8.0: Convert to str.
-    Delete(str(temp_output_path))
+    SCRATCH_PLACEMENT.discard(temp_output_path)
     oid_dominant_value = {
         oid: max(value_area.items(), key=itemgetter(1))[0]
         for oid, value_area in oid_value_area.items()
@@ -589,12 +661,16 @@ def update_field_with_field(
         field_name,
         source_field_name,
     )
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=[field_name, source_field_name],
-        where_clause=dataset_where_sql,
-        spatial_reference=SpatialReference(spatial_reference_item).object,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(dataset_path),
+            field_names=[field_name, source_field_name],
+            where_clause=dataset_where_sql,
+            spatial_reference=SpatialReference(spatial_reference_item).object,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
@@ -666,12 +742,16 @@ def update_field_with_function(
     )
     arg_field_names = list(arg_field_names)
     kwarg_field_names = list(kwarg_field_names)
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=arg_field_names + kwarg_field_names + [field_name],
-        where_clause=dataset_where_sql,
-        spatial_reference=SpatialReference(spatial_reference_item).object,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(dataset_path),
+            field_names=arg_field_names + kwarg_field_names + [field_name],
+            where_clause=dataset_where_sql,
+            spatial_reference=SpatialReference(spatial_reference_item).object,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
@@ -751,19 +831,30 @@ def update_field_with_join(
     if len(key_field_names) != len(join_key_field_names):
         raise AttributeError("key_field_names & join_key_field_names not same length.")
 
-    cursor = SearchCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(join_dataset_path),
-        field_names=join_key_field_names + [join_field_name],
-        where_clause=join_dataset_where_sql,
+    FIELD_ACCESS_LOG.record(dataset_path, "key", key_field_names)
+    FIELD_ACCESS_LOG.record(join_dataset_path, "key", join_key_field_names)
+
+    cursor = profile_cursor(
+        SearchCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(join_dataset_path),
+            field_names=join_key_field_names + [join_field_name],
+            where_clause=join_dataset_where_sql,
+        ),
+        dataset_path=join_dataset_path,
+        where_sql=join_dataset_where_sql,
     )
     with cursor:
         id_join_value = {feature[:-1]: feature[-1] for feature in cursor}
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=key_field_names + [field_name],
-        where_clause=dataset_where_sql,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(dataset_path),
+            field_names=key_field_names + [field_name],
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
@@ -826,11 +917,15 @@ def update_field_with_mapping(
     )
     if isinstance(mapping, EXECUTABLE_TYPES):
         mapping = mapping()
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=key_field_names + [field_name],
-        where_clause=dataset_where_sql,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(dataset_path),
+            field_names=key_field_names + [field_name],
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
@@ -899,8 +994,19 @@ def update_field_with_overlay_count(
     overlay_view = DatasetView(
         overlay_dataset_path, field_names=[], dataset_where_sql=overlay_where_sql
     )
+    FIELD_ACCESS_LOG.record(dataset_path, "spatial")
+    FIELD_ACCESS_LOG.record(overlay_dataset_path, "spatial")
     with view, overlay_view:
-        temp_output_path = unique_dataset_path("output")
+        # Keep-common join: at most a row per target feature, with no overlay-fields.
+        temp_output_path = SCRATCH_PLACEMENT.dataset_path(
+            "output",
+            estimated_bytes=_overlay_output_bytes(
+                dataset_path,
+                overlay_dataset_path=overlay_dataset_path,
+                overlay_field_names=[],
+                dataset_where_sql=dataset_where_sql,
+            ),
+        )
         SpatialJoin(
             target_features=view.name,
             join_features=overlay_view.name,
@@ -910,20 +1016,26 @@ def update_field_with_overlay_count(
             join_type="KEEP_COMMON",
             match_option="INTERSECT",
         )
-    cursor = SearchCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(temp_output_path),
-        field_names=["TARGET_FID", "Join_Count"],
+    cursor = profile_cursor(
+        SearchCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(temp_output_path),
+            field_names=["TARGET_FID", "Join_Count"],
+        ),
+        dataset_path=temp_output_path,
     )
     with cursor:
         oid_overlay_count = dict(cursor)
-    # ArcPy2.8.0: Convert to str.
-    Delete(str(temp_output_path))
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=["OID@", field_name],
-        where_clause=dataset_where_sql,
+    SCRATCH_PLACEMENT.discard(temp_output_path)
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(dataset_path),
+            field_names=["OID@", field_name],
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
@@ -986,11 +1098,15 @@ def update_field_with_unique_id(
         dataset_path,
         field_name,
     )
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=[field_name],
-        where_clause=dataset_where_sql,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(dataset_path),
+            field_names=[field_name],
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     # First run will clear duplicate IDs & gather used IDs.
@@ -1066,11 +1182,15 @@ def update_field_with_value(
         dataset_path,
         field_name,
     )
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=[field_name],
-        where_clause=dataset_where_sql,
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert to str.
+            in_table=str(dataset_path),
+            field_names=[field_name],
+            where_clause=dataset_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=dataset_where_sql,
     )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
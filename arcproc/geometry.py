@@ -159,3 +159,28 @@ def line_between_centroids(*geometries: Geometry) -> Polyline:
     points = [geometry.centroid for geometry in geometries]
     line = Polyline(Array(points), geometries[0].spatialReference)
     return line
+
+
+def morton_code(x: float, y: float, *, extent: Sequence[float], bits: int = 16) -> int:
+    """Return Morton (Z-order) code for coordinates within an extent.
+
+    Sorting by Morton code keeps coordinates that are near each other mostly near each
+    other in order, which makes for spatially clustered chunks.
+
+    Args:
+        x: X-coordinate.
+        y: Y-coordinate.
+        extent: Extent coordinates, as (x-minimum, y-minimum, x-maximum, y-maximum).
+        bits: Number of bits of precision for each axis.
+    """
+    x_min, y_min, x_max, y_max = extent
+    scale = (1 << bits) - 1
+    cells = [
+        int(scale * (value - _min) / (_max - _min)) if _max > _min else 0
+        for value, _min, _max in [(x, x_min, x_max), (y, y_min, y_max)]
+    ]
+    code = 0
+    for bit in range(bits):
+        code |= ((cells[0] >> bit) & 1) << (2 * bit)
+        code |= ((cells[1] >> bit) & 1) << (2 * bit + 1)
+    return code
@@ -10,8 +10,9 @@ from arcpy.analysis import Identity, SpatialJoin, Union
 
 from arcproc.dataset import DatasetView, dataset_feature_count
 from arcproc.field import delete_field, update_field_with_join, update_field_with_value
-from arcproc.metadata import Dataset
+from arcproc.metadata import FEATURE_COUNT_CACHE, METADATA_CACHE, Dataset
 from arcproc.misc import log_entity_states
+from arcproc.profiling import FIELD_ACCESS_LOG
 
 
 LOG: Logger = getLogger(__name__)
@@ -62,12 +63,14 @@ def identity_features(
         identity_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     # Do not include any field names - we do not want them added to output.
     identity_view = DatasetView(
         identity_path, field_names=[], dataset_where_sql=identity_where_sql
     )
+    FIELD_ACCESS_LOG.record(dataset_path, "spatial")
+    FIELD_ACCESS_LOG.record(identity_path, "spatial")
     with view, identity_view:
         # ArcPy2.8.0: Convert Path to str.
         Identity(
@@ -77,6 +80,8 @@ def identity_features(
             join_attributes="ALL",
             relationship=False,
         )
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     fid_field_names = [
         name for name in Dataset(output_path).field_names if name.startswith("FID_")
     ]
@@ -109,7 +114,7 @@ def identity_features(
     )
     for name in fid_field_names:
         delete_field(output_path, field_name=name, log_level=DEBUG)
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Identity.")
     return states
@@ -156,10 +161,12 @@ def join_features_at_center(
         join_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     # Do not include any field names - we do not want them added to output.
     join_view = DatasetView(join_path, field_names=[], dataset_where_sql=join_where_sql)
+    FIELD_ACCESS_LOG.record(dataset_path, "spatial")
+    FIELD_ACCESS_LOG.record(join_path, "spatial")
     with view, join_view:
         # ArcPy2.8.0: Convert Path to str.
         SpatialJoin(
@@ -170,6 +177,8 @@ def join_features_at_center(
             join_type="KEEP_ALL",
             match_option="HAVE_THEIR_CENTER_IN",
         )
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     if replacement_value is not None:
         update_field_with_value(
             output_path,
@@ -199,7 +208,7 @@ def join_features_at_center(
     )
     for name in ["Join_Count", "TARGET_FID", "JOIN_FID"]:
         delete_field(output_path, field_name=name, log_level=DEBUG)
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Join.")
     return states
@@ -245,7 +254,7 @@ def union_features(
         union_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     # Do not include any field names - we do not want them added to output.
     union_view = DatasetView(
@@ -258,6 +267,8 @@ def union_features(
             out_feature_class=str(output_path),
             join_attributes="ALL",
         )
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     fid_field_names = [
         name for name in Dataset(output_path).field_names if name.startswith("FID_")
     ]
@@ -290,7 +301,7 @@ def union_features(
     )
     for name in fid_field_names:
         delete_field(output_path, field_name=name, log_level=DEBUG)
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Union.")
     return states
@@ -11,6 +11,7 @@ from typing import Any, Iterable, Optional, Type, TypeVar, Union
 from arcpy import SetLogHistory
 
 from arcproc.dataset import (
+    DatasetViewPool,
     copy_dataset_features,
     create_dataset,
     delete_dataset,
@@ -48,6 +49,10 @@ class Procedure(ContextDecorator):
     """Timestamp for when procedure started."""
     transform_path: Path = None
     """Path to current transformation dataset."""
+    view_pool: Optional[DatasetViewPool] = None
+    """Pool of reusable dataset views, open for the life of the procedure. If None,
+    views are not pooled.
+    """
     workspace_path: Path = "memory"
     """Path to workspace for transformation datasets."""
 
@@ -56,18 +61,22 @@ class Procedure(ContextDecorator):
         name: Optional[str] = None,
         *,
         workspace_path: Optional[Union[Path, str]] = None,
+        pool_views: bool = False,
     ) -> None:
         """Initialize instance.
 
         Args:
             name: Procedure name.
             workspace_path: Path to workspace for transformation datasets.
+            pool_views: Reuse dataset views across operations in the procedure if True.
         """
         self.time_started = _datetime.now()
         if name:
             self.name = name
         if workspace_path:
             self.workspace_path = Path(workspace_path)
+        if pool_views:
+            self.view_pool = DatasetViewPool().open()
         LOG.info("""Starting procedure for "%s".""", self.name)
 
     def __enter__(self) -> TProcedure:
@@ -96,6 +105,9 @@ class Procedure(ContextDecorator):
     def close(self) -> None:
         """Clean up instance."""
         LOG.info("""Ending procedure for "%s".""", self.name)
+        if self.view_pool:
+            self.view_pool.close()
+            self.view_pool = None
         if not self.keep_transforms:
             if self.transform_path and is_valid_dataset(self.transform_path):
                 delete_dataset(self.transform_path, log_level=DEBUG)
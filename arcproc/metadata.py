@@ -1,12 +1,16 @@
 """Metadata objects."""
+from collections import OrderedDict
 from dataclasses import dataclass, field, fields
 from logging import Logger, getLogger
+from os.path import abspath, normcase, sep
 from pathlib import Path
+from threading import Lock
+from time import monotonic
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from arcpy import Describe, Exists
 from arcpy import Field as ArcField
-from arcpy import Geometry, ListFields, SetLogHistory
+from arcpy import Geometry, SetLogHistory
 from arcpy import SpatialReference as ArcSpatialReference
 from arcpy.da import Domain as ArcDomain
 from arcpy.da import ListDomains, SearchCursor
@@ -28,6 +32,453 @@ LOG: Logger = getLogger(__name__)
 SetLogHistory(False)
 
 
+class DomainRegistry:
+    """Process-wide registry of geodatabase domains, indexed by name.
+
+    Domains for a geodatabase are listed once, on first lookup, & shared by all
+    Domain & Workspace instances for it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize instance."""
+        self._geodatabase_domains: Dict[str, Dict[str, ArcDomain]] = {}
+        self._lock = Lock()
+
+    def domain(self, geodatabase_path: Union[Path, str], name: str) -> ArcDomain:
+        """Return ArcPy domain object.
+
+        Args:
+            geodatabase_path: Path to geodatabase the domain resides within.
+            name: Name of the domain. Case-insensitive.
+
+        Raises:
+            DomainNotFoundError: If domain not in geodatabase.
+        """
+        try:
+            return self.domains(geodatabase_path)[name.lower()]
+
+        except KeyError as error:
+            raise DomainNotFoundError(geodatabase_path, name) from error
+
+    def domains(self, geodatabase_path: Union[Path, str]) -> Dict[str, ArcDomain]:
+        """Return mapping of lowercase domain name to ArcPy domain object.
+
+        Args:
+            geodatabase_path: Path to geodatabase.
+        """
+        key = _path_key(geodatabase_path)
+        with self._lock:
+            if key not in self._geodatabase_domains:
+                # ArcPy2.8.0: Convert to str.
+                self._geodatabase_domains[key] = {
+                    domain.name.lower(): domain
+                    for domain in ListDomains(str(geodatabase_path))
+                }
+            return self._geodatabase_domains[key]
+
+    def invalidate(self, geodatabase_path: Optional[Union[Path, str]] = None) -> None:
+        """Drop listed domains for geodatabase.
+
+        Args:
+            geodatabase_path: Path to geodatabase. If set to None, will drop domains for
+                all geodatabases.
+        """
+        with self._lock:
+            if geodatabase_path is None:
+                self._geodatabase_domains.clear()
+            else:
+                self._geodatabase_domains.pop(_path_key(geodatabase_path), None)
+
+
+class FeatureCountCache:
+    """Process-wide cache of dataset feature counts, keyed on normalized path &
+    subselection where-clause.
+
+    Entries expire after a time-to-live, & the least-recently-used entry is evicted
+    when the cache is full. Operations in arcproc that add or remove features update
+    or invalidate the entries for that dataset; changes made outside arcproc are only
+    seen once the entry expires (or is invalidated directly). Counts for bare names
+    (views & layers) are never cached, as their selections can change.
+    """
+
+    max_size: int
+    """Maximum number of entries. Set to 0 to disable caching."""
+    ttl: Optional[float]
+    """Seconds an entry stays valid. If None, entries do not expire."""
+    hits: int
+    """Number of lookups answered from cache."""
+    misses: int
+    """Number of lookups not answered from cache."""
+    estimates: int
+    """Number of lookups answered by an estimate."""
+
+    def __init__(self, *, max_size: int = 1024, ttl: Optional[float] = 60.0) -> None:
+        """Initialize instance.
+
+        Args:
+            max_size: Maximum number of entries. Set to 0 to disable caching.
+            ttl: Seconds an entry stays valid. If set to None, entries do not expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Tuple[float, int]]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+        self.hits = self.misses = self.estimates = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Mapping of statistic name to count."""
+        return {
+            "entries": len(self),
+            "estimates": self.estimates,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def adjust(self, dataset_path: Union[Path, str], delta: int) -> None:
+        """Shift cached count for dataset by number of features added or removed.
+
+        Subselection counts for the dataset are dropped, as the change in them is
+        unknown.
+
+        Args:
+            dataset_path: Path to dataset.
+            delta: Number of features added (negative if removed).
+        """
+        if not _countable(dataset_path):
+            return
+
+        key = _path_key(dataset_path)
+        with self._lock:
+            for entry_key in list(self._entries):
+                if entry_key[0] == key and entry_key[1] is not None:
+                    del self._entries[entry_key]
+            if (key, None) in self._entries:
+                counted_time, count = self._entries[(key, None)]
+                self._entries[(key, None)] = (counted_time, max(count + delta, 0))
+
+    def count(
+        self,
+        dataset_path: Union[Path, str],
+        *,
+        estimate: bool = False,
+        refresh: bool = False,
+    ) -> int:
+        """Return number of features in dataset, from cache if current.
+
+        Args:
+            dataset_path: Path to dataset.
+            estimate: If True, will return an expired count, or a count from dataset
+                file metadata (e.g. shapefile header), before counting features. Such
+                counts may be out of date or include deleted features.
+            refresh: If True, will count features even if a current count is cached.
+        """
+        if not refresh:
+            count = self.lookup(dataset_path, estimate=estimate)
+            if count is None and estimate:
+                count = _metadata_feature_count(dataset_path)
+                if count is not None:
+                    self.estimates += 1
+            if count is not None:
+                return count
+
+        # ArcPy2.8.0: Convert to str.
+        count = int(GetCount(str(dataset_path)).getOutput(0))
+        self.record(dataset_path, count)
+        return count
+
+    def invalidate(self, dataset_path: Optional[Union[Path, str]] = None) -> None:
+        """Drop entries for dataset, & entries for anything within it.
+
+        Args:
+            dataset_path: Path to dataset or workspace. If set to None, will drop all
+                entries.
+        """
+        with self._lock:
+            if dataset_path is None:
+                self._entries.clear()
+                return
+
+            key = _path_key(dataset_path)
+            for entry_key in list(self._entries):
+                if entry_key[0] == key or entry_key[0].startswith(key + sep):
+                    del self._entries[entry_key]
+
+    def lookup(
+        self,
+        dataset_path: Union[Path, str],
+        *,
+        dataset_where_sql: Optional[str] = None,
+        estimate: bool = False,
+    ) -> Optional[int]:
+        """Return cached number of features in dataset, or None if not cached.
+
+        Args:
+            dataset_path: Path to dataset.
+            dataset_where_sql: SQL where-clause for dataset subselection.
+            estimate: If True, will return an expired count instead of None.
+        """
+        if not _countable(dataset_path):
+            return None
+
+        key = (_path_key(dataset_path), dataset_where_sql)
+        with self._lock:
+            if key in self._entries:
+                counted_time, count = self._entries[key]
+                if self.ttl is None or monotonic() - counted_time <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return count
+
+                if estimate:
+                    self.estimates += 1
+                    return count
+
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def record(
+        self,
+        dataset_path: Union[Path, str],
+        count: int,
+        *,
+        dataset_where_sql: Optional[str] = None,
+    ) -> None:
+        """Record number of features in dataset, e.g. from a full cursor pass.
+
+        Args:
+            dataset_path: Path to dataset.
+            count: Number of features.
+            dataset_where_sql: SQL where-clause for dataset subselection.
+        """
+        if not _countable(dataset_path) or self.max_size <= 0:
+            return
+
+        key = (_path_key(dataset_path), dataset_where_sql)
+        with self._lock:
+            self._entries[key] = (monotonic(), count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def reset_stats(self) -> None:
+        """Reset statistic counts to zero."""
+        self.hits = self.misses = self.estimates = 0
+
+
+class MetadataCache:
+    """Process-wide cache of ArcPy describe-objects, keyed on normalized path.
+
+    Entries expire after a time-to-live, & the least-recently-used entry is evicted
+    when the cache is full. Operations in arcproc that change a dataset schema
+    invalidate the entry for that dataset; changes made outside arcproc are only seen
+    once the entry expires (or is invalidated directly).
+    """
+
+    max_size: int
+    """Maximum number of entries. Set to 0 to disable caching."""
+    ttl: Optional[float]
+    """Seconds an entry stays valid. If None, entries do not expire."""
+    hits: int
+    """Number of lookups answered from cache."""
+    misses: int
+    """Number of lookups that required a describe."""
+    evictions: int
+    """Number of entries evicted to make room."""
+    expirations: int
+    """Number of entries dropped for exceeding time-to-live."""
+
+    def __init__(self, *, max_size: int = 256, ttl: Optional[float] = 60.0) -> None:
+        """Initialize instance.
+
+        Args:
+            max_size: Maximum number of entries. Set to 0 to disable caching.
+            ttl: Seconds an entry stays valid. If set to None, entries do not expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Mapping of statistic name to count."""
+        return {
+            "entries": len(self),
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def describe(self, path: Union[Path, str]) -> Any:
+        """Return describe-object for path, from cache if current.
+
+        Args:
+            path: Path to dataset, workspace, or view name.
+        """
+        describe_object = self.lookup(path)
+        if describe_object is not None:
+            return describe_object
+
+        key = _path_key(path)
+        with self._lock:
+            self.misses += 1
+        # ArcPy2.8.0: Convert to str.
+        describe_object = Describe(str(path))
+        with self._lock:
+            if self.max_size > 0:
+                self._entries[key] = (monotonic(), describe_object)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return describe_object
+
+    def lookup(self, path: Union[Path, str]) -> Optional[Any]:
+        """Return cached describe-object for path, or None if not cached & current.
+
+        Args:
+            path: Path to dataset, workspace, or view name.
+        """
+        key = _path_key(path)
+        with self._lock:
+            if key in self._entries:
+                described_time, describe_object = self._entries[key]
+                if self.ttl is None or monotonic() - described_time <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return describe_object
+
+                del self._entries[key]
+                self.expirations += 1
+        return None
+
+    def invalidate(self, path: Optional[Union[Path, str]] = None) -> None:
+        """Drop entry for path, & entries for anything within it.
+
+        Args:
+            path: Path to dataset, workspace, or view name. If set to None, will drop
+                all entries.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+
+            key = _path_key(path)
+            for entry_key in list(self._entries):
+                if entry_key == key or entry_key.startswith(key + sep):
+                    del self._entries[entry_key]
+
+    def reset_stats(self) -> None:
+        """Reset statistic counts to zero."""
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+
+DOMAIN_REGISTRY: DomainRegistry = DomainRegistry()
+"""Process-wide registry of domains used by metadata instances."""
+FEATURE_COUNT_CACHE: FeatureCountCache = FeatureCountCache()
+"""Process-wide cache of feature counts used by metadata instances."""
+METADATA_CACHE: MetadataCache = MetadataCache()
+"""Process-wide cache of describe-objects used by metadata instances."""
+
+
+def _countable(dataset_path: Union[Path, str]) -> bool:
+    """Return True if feature count for dataset path can be cached.
+
+    Bare names (views & layers) are not cached, as their selections can change.
+
+    Args:
+        dataset_path: Path to dataset, or view name.
+    """
+    return len(Path(dataset_path).parts) > 1
+
+
+def _metadata_feature_count(dataset_path: Union[Path, str]) -> Optional[int]:
+    """Return number of features from dataset file metadata, or None if unavailable.
+
+    Only shapefiles & dBASE tables have a record count in their file header. That count
+    includes records marked as deleted.
+
+    Args:
+        dataset_path: Path to dataset.
+    """
+    dataset_path = Path(dataset_path)
+    if dataset_path.suffix.lower() not in [".dbf", ".shp"]:
+        return None
+
+    try:
+        with dataset_path.with_suffix(".dbf").open("rb") as dbf_file:
+            header = dbf_file.read(8)
+    except OSError:
+        return None
+
+    return int.from_bytes(header[4:8], "little") if len(header) == 8 else None
+
+
+def _path_key(path: Union[Path, str]) -> str:
+    """Return normalized path, for use as a cache key.
+
+    Args:
+        path: Path to dataset, workspace, or view name.
+    """
+    return normcase(abspath(str(path)))
+
+
+def _factory_alias_key(
+    spatial_reference_object: ArcSpatialReference,
+) -> Optional[Tuple[Any]]:
+    """Return alias key for shared spatial reference, or None if no factory code.
+
+    Key is the factory code (WKID) plus the settings WKT carries beyond it, so it is
+    cheap to build but still tells apart references that share a WKID.
+
+    Args:
+        spatial_reference_object: ArcPy spatial reference object.
+    """
+    if not spatial_reference_object.factoryCode:
+        return None
+
+    vcs = getattr(spatial_reference_object, "VCS", None)
+    return (
+        ("factory", spatial_reference_object.factoryCode)
+        + tuple(
+            getattr(spatial_reference_object, attr_name, None)
+            for attr_name in [
+                "XYResolution",
+                "XYTolerance",
+                "ZResolution",
+                "ZTolerance",
+                "MResolution",
+                "MTolerance",
+            ]
+        )
+        + (getattr(vcs, "factoryCode", None), getattr(vcs, "name", None))
+    )
+
+
+def _spatial_reference_from_wkt(wkt: str) -> "SpatialReference":
+    """Return spatial reference metadata instance for well-known text (WKT).
+
+    Args:
+        wkt: Spatial reference as exported WKT string.
+    """
+    _object = ArcSpatialReference()
+    _object.loadFromString(wkt)
+    return SpatialReference(_object)
+
+
 @dataclass
 class Domain:
     """Representation of geodatabase domain information."""
@@ -63,13 +514,7 @@ class Domain:
             raise AttributeError("Must provide `geodatabase_path` + `name` or `object`")
 
         self.geodatabase_path = Path(self.geodatabase_path)
-        for domain in ListDomains(self.geodatabase_path):
-            if domain.name.lower() == self.name.lower():
-                self.object = domain
-                break
-
-        else:
-            raise DomainNotFoundError(self.geodatabase_path, self.name)
+        self.object = DOMAIN_REGISTRY.domain(self.geodatabase_path, self.name)
 
         # To ensure property uses internal casing.
         self.name = self.object.name
@@ -127,7 +572,7 @@ class Field:
 
         if self.dataset_path and self.name:
             self.dataset_path = Path(self.dataset_path)
-            _fields = ListFields(self.dataset_path, wild_card=self.name)
+            _fields = getattr(METADATA_CACHE.describe(self.dataset_path), "fields", [])
             _fields = cast(List[ArcField], _fields)
             for _field in _fields:
                 if _field.name.lower() == self.name.lower():
@@ -174,60 +619,167 @@ class Field:
         return {name: getattr(self, name) for name in attribute_names}
 
 
-@dataclass
 class SpatialReference:
-    """Representation of spatial reference information."""
+    """Representation of spatial reference information.
+
+    Instances are shared: constructing from an item that resolves to the same
+    spatial reference returns the same immutable instance. Spatial references are the
+    same if their exported well-known text (WKT) is the same, so references that
+    share a WKID but differ in tolerance, resolution, or vertical coordinate system
+    are not shared.
+    """
+
+    # Py3.7: Can replace slots with `@dataclass(slots=True)` in Py3.10.
+    __slots__ = (
+        "source_item",
+        "object",
+        "name",
+        "wkid",
+        "angular_unit",
+        "linear_unit",
+        "_wkt",
+    )
+
+    _instances: Dict[Tuple[Any], "SpatialReference"] = {}
+    """Mapping of resolved source key to shared instance.
+
+    Instances are keyed on exported WKT. Cheaper alias keys are checked first: the
+    WKID or coordinate system name an instance was constructed from, & the factory
+    code plus resolution & tolerance settings of the spatial reference object.
+    """
+    _path_instances: Dict[str, Tuple[Any, "SpatialReference"]] = {}
+    """Mapping of normalized dataset path to describe-object & shared instance.
+
+    Entry is only used while the describe-object is the one in `METADATA_CACHE`, so
+    a changed or re-described dataset resolves its spatial reference again.
+    """
+    _lock: Lock = Lock()
+    """Lock for access to shared instances."""
 
     source_item: Union[int, Geometry, ArcSpatialReference, Path, str, None]
-    """Source item to construct spatial reference object from."""
+    """Source item the spatial reference object was constructed from."""
 
-    object: ArcSpatialReference = field(init=False)
+    object: ArcSpatialReference
     """ArcPy spatial reference object."""
-    name: str = field(init=False)
+    name: str
     """Name of the spatial reference."""
-    wkid: Union[int, None] = field(init=False)
+    wkid: Union[int, None]
     """Well-known ID (WKID) for the spatial reference."""
-    wkt: str = field(init=False)
-    """Spatial reference as well-known text (WKT)."""
-    angular_unit: str = field(init=False)
+    angular_unit: str
     """Angular unit for the spatial reference."""
-    linear_unit: str = field(init=False)
+    linear_unit: str
     """Linear unit for the spatial reference."""
 
-    def __post_init__(self) -> None:
-        if isinstance(self.source_item, SpatialReference):
-            self.object = self.source_item.object
+    def __new__(
+        cls,
+        source_item: Union[
+            "SpatialReference", int, Geometry, ArcSpatialReference, Path, str, None
+        ],
+    ) -> "SpatialReference":
+        """Return shared instance for source item, creating it if needed.
+
+        Args:
+            source_item: Source item to construct spatial reference object from.
+        """
+        if isinstance(source_item, SpatialReference):
+            return source_item
+
+        _object = None
+        alias_key = None
+        path_key = describe_object = None
         # WKID/factory code.
-        elif isinstance(self.source_item, int):
-            self.object = ArcSpatialReference(self.source_item)
-        elif isinstance(self.source_item, Geometry):
-            self.object = self.source_item.spatialReference
-        elif isinstance(self.source_item, ArcSpatialReference):
-            self.object = self.source_item
-        elif isinstance(self.source_item, (Path, str)):
+        if isinstance(source_item, int):
+            alias_key = ("wkid", source_item)
+        elif isinstance(source_item, (Geometry, ArcSpatialReference)):
+            _object = (
+                source_item.spatialReference
+                if isinstance(source_item, Geometry)
+                else source_item
+            )
+            alias_key = _factory_alias_key(_object)
+        elif isinstance(source_item, (Path, str)):
+            describe_object = METADATA_CACHE.lookup(source_item)
+            if describe_object is None and Exists(source_item):
+                describe_object = METADATA_CACHE.describe(source_item)
             # Describe-able object. spatialReference != ArcSpatialReference.
-            if Exists(self.source_item):
-                self.object = ArcSpatialReference(
-                    # ArcPy2.8.0: Convert Path to str.
-                    Describe(str(self.source_item)).spatialReference.factoryCode
+            if describe_object is not None:
+                path_key = _path_key(source_item)
+                with cls._lock:
+                    path_entry = cls._path_instances.get(path_key)
+                if path_entry and path_entry[0] is describe_object:
+                    return path_entry[1]
+
+                _object = ArcSpatialReference()
+                _object.loadFromString(
+                    describe_object.spatialReference.exportToString()
                 )
+                alias_key = _factory_alias_key(_object)
             # Likely a coordinate system name.
             else:
-                self.object = ArcSpatialReference(self.source_item)
+                alias_key = ("name", str(source_item))
         # Allowing NoneType objects just tells ArcPy SR arguments to use dataset SR.
-        if self.source_item is None:
-            self.object = None
+        else:
+            alias_key = ("none",)
+        with cls._lock:
+            if alias_key in cls._instances:
+                instance = cls._instances[alias_key]
+                if path_key is not None:
+                    cls._path_instances[path_key] = (describe_object, instance)
+                return instance
+
+        if _object is None and alias_key[0] != "none":
+            _object = ArcSpatialReference(alias_key[1])
+        wkt = _object.exportToString() if _object is not None else None
+        key = ("wkt", wkt) if wkt is not None else alias_key
+        with cls._lock:
+            if key in cls._instances:
+                instance = cls._instances[key]
+            else:
+                instance = super().__new__(cls)
+                for attr_name, value in [
+                    ("source_item", source_item),
+                    ("object", _object),
+                    ("name", getattr(_object, "name", "")),
+                    ("wkid", getattr(_object, "factoryCode", None)),
+                    ("angular_unit", getattr(_object, "angularUnitName", "")),
+                    ("linear_unit", getattr(_object, "linearUnitName", "")),
+                    ("_wkt", wkt),
+                ]:
+                    object.__setattr__(instance, attr_name, value)
+                cls._instances[key] = instance
+            if alias_key is not None:
+                cls._instances[alias_key] = instance
+            if path_key is not None:
+                cls._path_instances[path_key] = (describe_object, instance)
+        return instance
+
+    def __reduce__(self) -> Tuple[Any]:
+        if self.object is None:
+            return (self.__class__, (None,))
+
+        return (_spatial_reference_from_wkt, (self.wkt,))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(wkid={self.wkid!r}, name={self.name!r})"
 
-        self.name = getattr(self.object, "name", "")
-        self.wkid = getattr(self.object, "factoryCode", None)
-        self.wkt = getattr(self.object, "exportToString", str)()
-        self.angular_unit = getattr(self.object, "angularUnitName", "")
-        self.linear_unit = getattr(self.object, "linearUnitName", "")
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} instances are immutable")
 
     @property
     def as_dict(self) -> dict:
         """Metadata as dictionary."""
-        return dict((field.name, getattr(self, field.name)) for field in fields(self))
+        return {
+            name.lstrip("_"): getattr(self, name.lstrip("_")) for name in self.__slots__
+        }
+
+    @property
+    def wkt(self) -> str:
+        """Spatial reference as well-known text (WKT)."""
+        if self._wkt is None:
+            object.__setattr__(
+                self, "_wkt", getattr(self.object, "exportToString", str)()
+            )
+        return self._wkt
 
 
 @dataclass
@@ -278,8 +830,7 @@ class Workspace:
             raise AttributeError("Must provide `path` or `object`")
 
         if self.path:
-            # ArcPy 2.8.0: Convert to str.
-            self.object = Describe(str(self.path))
+            self.object = METADATA_CACHE.describe(self.path)
 
         self.can_copy = self.can_move = self.object.workspaceType in [
             "FileSystem",
@@ -317,73 +868,93 @@ class Workspace:
 # Metadata classes that reference above classes.
 
 
-@dataclass
 class Dataset:
-    """Representation of dataset information."""
+    """Representation of dataset information.
+
+    Only describe-level attributes are set on construction. Field & spatial reference
+    metadata are built on first access, then kept.
+    """
 
-    path: Optional[Path] = None
+    # Py3.7: Can replace slots with `@dataclass(slots=True)` in Py3.10.
+    __slots__ = (
+        "path",
+        "object",
+        "area_field_name",
+        "geometry_field_name",
+        "geometry_type",
+        "is_spatial",
+        "is_table",
+        "is_versioned",
+        "length_field_name",
+        "name",
+        "oid_field_name",
+        "workspace_path",
+        "_area_field",
+        "_field_name_token",
+        "_field_names",
+        "_field_names_tokenized",
+        "_fields",
+        "_geometry_field",
+        "_length_field",
+        "_oid_field",
+        "_spatial_reference",
+        "_user_field_names",
+        "_user_fields",
+    )
+
+    path: Path
     """Path to dataset."""
-    object: Optional[Any] = None
+    object: Any
     """ArcPy workspace describe-object.
 
     Type is `Any` because ArcPy describe-objects are not exposed for reference.
     """
 
-    area_field: Union[Field, None] = field(init=False)
-    """Geometry area field on dataset."""
-    area_field_name: str = field(init=False)
+    area_field_name: str
     """Name of geometry area field on dataset."""
-    field_name_token: Dict[str, str] = field(default_factory=dict, init=False)
-    """Mapping of field name on the dataset to appropriate token."""
-    field_names: List[str] = field(default_factory=list, init=False)
-    """Names of fields on the dataset."""
-    field_names_tokenized: "list[str]" = field(default_factory=list, init=False)
-    """Names of fields on the dataset, tokenized where relevant."""
-    fields: List[Field] = field(default_factory=list, init=False)
-    """Metadata instances for fields on the dataset."""
-    geometry_field: Union[Field, None] = field(init=False)
-    """Geometry field on dataset."""
-    geometry_field_name: str = field(init=False)
+    geometry_field_name: str
     """Name of geometry field on dataset."""
-    geometry_type: str = field(init=False)
+    geometry_type: str
     """Type of geometry represented."""
-    is_spatial: bool = field(init=False)
+    is_spatial: bool
     """The dataset is spatial if True."""
-    is_table: bool = field(init=False)
+    is_table: bool
     """The dataset is considered a table if True."""
-    is_versioned: bool = field(init=False)
+    is_versioned: bool
     """The dataset is versioned if True."""
-    length_field: Union[Field, None] = field(init=False)
-    """Geoemtry length field on dataset."""
-    length_field_name: str = field(init=False)
+    length_field_name: str
     """Name of geometry length field on dataset."""
-    name: str = field(init=False)
+    name: str
     """Name of the dataset."""
-    oid_field: Union[Field, None] = field(init=False)
-    """Object ID field on dataset."""
-    oid_field_name: str = field(init=False)
+    oid_field_name: str
     """Name of object ID field on dataset."""
-    spatial_reference: SpatialReference = field(init=False)
-    """Spatial reference metadata instance for dataset."""
-    user_field_names: "list[str]" = field(default_factory=list, init=False)
-    """Names of user-defined fields on the dataset."""
-    user_fields: "list[Field]" = field(default_factory=list, init=False)
-    """Metadata instances for user-defined fields on the dataset."""
-    workspace_path: Union[Path, str] = field(init=False)
+    workspace_path: Union[Path, str]
     """Path to workspace for the dataset resides within."""
 
-    def __post_init__(self) -> None:
-        if not any([self.path, self.object]):
+    def __init__(
+        self,
+        path: Optional[Union[Path, str]] = None,
+        object: Optional[Any] = None,  # pylint: disable=redefined-builtin
+    ) -> None:
+        """Initialize instance.
+
+        Args:
+            path: Path to dataset.
+            object: ArcPy describe-object for dataset. Ignored if path is provided.
+
+        Raises:
+            AttributeError: If neither path nor object provided.
+            DatasetNotFoundError: If dataset at path does not exist.
+        """
+        if not any([path, object]):
             raise AttributeError("Must provide `path` or `object`")
 
-        if self.path:
-            if not Exists(self.path):
-                raise DatasetNotFoundError(self.path)
+        if path:
+            if not Exists(path):
+                raise DatasetNotFoundError(path)
 
-            # ArcPy2.8.0: Convert to str.
-            self.object = Describe(str(self.path))
-        self.object = cast(Any, self.object)
-        self.path = cast(Path, self.path)
+            object = METADATA_CACHE.describe(path)
+        self.object = cast(Any, object)
         self.area_field_name = getattr(self.object, "areaFieldName", "")
         self.geometry_field_name = getattr(self.object, "shapeFieldName", "")
         self.geometry_type = getattr(self.object, "shapeType", "")
@@ -395,46 +966,103 @@ class Dataset:
         self.oid_field_name = getattr(self.object, "OIDFieldName", "")
         # To ensure property uses internal casing & resolution.
         self.path = Path(self.object.catalogPath)
-        self.spatial_reference = SpatialReference(
-            getattr(getattr(self.object, "spatialReference", None), "factoryCode", None)
-        )
         self.workspace_path = Path(self.object.path)
+        self._fields = None
+        self._spatial_reference = None
 
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def _load_fields(self) -> None:
+        """Build field metadata & derived name collections."""
+        self._area_field = self._geometry_field = None
+        self._length_field = self._oid_field = None
+        self._field_name_token = {}
+        self._field_names = []
+        self._field_names_tokenized = []
+        self._user_field_names = []
+        self._user_fields = []
+        _fields = []
         for field_object in getattr(self.object, "fields", []):
             _field = Field(object=field_object)
-            self.field_names.append(_field.name)
-            self.fields.append(_field)
+            self._field_names.append(_field.name)
+            _fields.append(_field)
             if _field.name == self.area_field_name:
-                self.area_field = _field
-                self.field_name_token[_field.name] = "SHAPE@AREA"
-                self.field_names_tokenized.append("SHAPE@AREA")
+                self._area_field = _field
+                self._field_name_token[_field.name] = "SHAPE@AREA"
+                self._field_names_tokenized.append("SHAPE@AREA")
             elif _field.name == self.geometry_field_name:
-                self.geometry_field = _field
-                self.field_name_token[_field.name] = "SHAPE@"
-                self.field_names_tokenized.append("SHAPE@")
+                self._geometry_field = _field
+                self._field_name_token[_field.name] = "SHAPE@"
+                self._field_names_tokenized.append("SHAPE@")
             elif _field.name == self.length_field_name:
-                self.length_field = _field
-                self.field_name_token[_field.name] = "SHAPE@LENGTH"
-                self.field_names_tokenized.append("SHAPE@LENGTH")
+                self._length_field = _field
+                self._field_name_token[_field.name] = "SHAPE@LENGTH"
+                self._field_names_tokenized.append("SHAPE@LENGTH")
             elif _field.name == self.oid_field_name:
-                self.oid_field = _field
-                self.field_name_token[_field.name] = "OID@"
-                self.field_names_tokenized.append("OID@")
+                self._oid_field = _field
+                self._field_name_token[_field.name] = "OID@"
+                self._field_names_tokenized.append("OID@")
             else:
-                self.field_names_tokenized.append(_field.name)
-                self.user_field_names.append(_field.name)
-                self.user_fields.append(_field)
+                self._field_names_tokenized.append(_field.name)
+                self._user_field_names.append(_field.name)
+                self._user_fields.append(_field)
+        # Set last: marks the field attributes as loaded.
+        self._fields = _fields
+
+    @property
+    def area_field(self) -> Union[Field, None]:
+        """Geometry area field on dataset."""
+        if self._fields is None:
+            self._load_fields()
+        return self._area_field
 
     @property
     def as_dict(self) -> dict:
         """Metadata as dictionary."""
-        return dict((field.name, getattr(self, field.name)) for field in fields(self))
+        return {
+            name.lstrip("_"): getattr(self, name.lstrip("_")) for name in self.__slots__
+        }
 
     @property
     def feature_count(self) -> int:
         """Number of features in dataset."""
-        # ArcPy2.8.0: Convert to str.
-        return int(GetCount(str(self.path)).getOutput(0))
+        return FEATURE_COUNT_CACHE.count(self.path)
+
+    @property
+    def field_name_token(self) -> Dict[str, str]:
+        """Mapping of field name on the dataset to appropriate token."""
+        if self._fields is None:
+            self._load_fields()
+        return self._field_name_token
+
+    @property
+    def field_names(self) -> List[str]:
+        """Names of fields on the dataset."""
+        if self._fields is None:
+            self._load_fields()
+        return self._field_names
+
+    @property
+    def field_names_tokenized(self) -> List[str]:
+        """Names of fields on the dataset, tokenized where relevant."""
+        if self._fields is None:
+            self._load_fields()
+        return self._field_names_tokenized
+
+    @property
+    def fields(self) -> List[Field]:
+        """Metadata instances for fields on the dataset."""
+        if self._fields is None:
+            self._load_fields()
+        return self._fields
+
+    @property
+    def geometry_field(self) -> Union[Field, None]:
+        """Geometry field on dataset."""
+        if self._fields is None:
+            self._load_fields()
+        return self._geometry_field
 
     @property
     def has_true_curves(self) -> bool:
@@ -448,6 +1076,45 @@ class Dataset:
 
         return False
 
+    @property
+    def length_field(self) -> Union[Field, None]:
+        """Geometry length field on dataset."""
+        if self._fields is None:
+            self._load_fields()
+        return self._length_field
+
+    @property
+    def oid_field(self) -> Union[Field, None]:
+        """Object ID field on dataset."""
+        if self._fields is None:
+            self._load_fields()
+        return self._oid_field
+
+    @property
+    def spatial_reference(self) -> SpatialReference:
+        """Spatial reference metadata instance for dataset."""
+        if self._spatial_reference is None:
+            self._spatial_reference = SpatialReference(
+                getattr(
+                    getattr(self.object, "spatialReference", None), "factoryCode", None
+                )
+            )
+        return self._spatial_reference
+
+    @property
+    def user_field_names(self) -> List[str]:
+        """Names of user-defined fields on the dataset."""
+        if self._fields is None:
+            self._load_fields()
+        return self._user_field_names
+
+    @property
+    def user_fields(self) -> List[Field]:
+        """Metadata instances for user-defined fields on the dataset."""
+        if self._fields is None:
+            self._load_fields()
+        return self._user_fields
+
 
 # Type aliases.
 
@@ -1,19 +1,23 @@
 """Internal module helper objects."""
 from collections import Counter
+from datetime import date
 from datetime import datetime as _datetime
 from datetime import timedelta
 from functools import partial
 from logging import INFO, Logger, getLogger
 from math import isclose
+from pathlib import Path
 from random import choice
 from string import ascii_letters, digits, punctuation, whitespace
 from types import BuiltinFunctionType, BuiltinMethodType, FunctionType, MethodType
-from typing import Any, Iterator, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
 from uuid import UUID, uuid4
 
 from arcpy import Geometry, Point, SetLogHistory
 from more_itertools import pairwise
 
+from arcproc.metadata import METADATA_CACHE
+
 
 LOG: Logger = getLogger(__name__)
 """Module-level logger."""
@@ -28,6 +32,19 @@ EXECUTABLE_TYPES: Tuple[type] = (
     partial,
 )
 """Executable object types. Useful for determining if an object can be executed."""
+SQL_DATETIME_LITERAL_FORMATS: Dict[str, str] = {
+    # Folder (shapefile & dBASE) date fields hold no time.
+    "": "date '%Y-%m-%d'",
+    "AccessWorkspace": "#%m-%d-%Y %H:%M:%S#",
+    "ColumnaDBWorkspace": "date '%Y-%m-%d %H:%M:%S'",
+    "FileGDBWorkspace": "date '%Y-%m-%d %H:%M:%S'",
+    "InMemoryWorkspace": "date '%Y-%m-%d %H:%M:%S'",
+}
+"""Mapping of workspace factory prog ID to SQL datetime literal format.
+
+Workspaces not listed (e.g. enterprise geodatabases, where the syntax depends on the
+database) have no supported datetime literal.
+"""
 
 
 def time_elapsed(
@@ -72,6 +89,71 @@ def freeze_values(*values: Any) -> Iterator[Any]:
             yield val
 
 
+def _datetime_literal_format(dataset_path: Union[Path, str]) -> str:
+    """Return SQL datetime literal format for the workspace of dataset.
+
+    Args:
+        dataset_path: Path to dataset.
+
+    Raises:
+        ValueError: If workspace has no supported datetime literal.
+    """
+    workspace_path = METADATA_CACHE.describe(dataset_path).path
+    # Feature dataset is not a workspace; use the geodatabase.
+    if METADATA_CACHE.describe(workspace_path).dataType == "FeatureDataset":
+        workspace_path = METADATA_CACHE.describe(workspace_path).path
+    factory_prog_id = METADATA_CACHE.describe(workspace_path).workspaceFactoryProgID
+    for prog_id, _format in SQL_DATETIME_LITERAL_FORMATS.items():
+        if (prog_id in factory_prog_id) if prog_id else not factory_prog_id:
+            return _format
+
+    raise ValueError(f"`{workspace_path}` unsupported workspace for datetime literals")
+
+
+def ids_where_sql(
+    id_field_names: Sequence[str],
+    ids: Iterable[Sequence[Any]],
+    *,
+    chunk_size: int = 500,
+    dataset_path: Optional[Union[Path, str]] = None,
+) -> Iterator[str]:
+    """Generate SQL where-clauses that subselect features with the given IDs.
+
+    IDs are split into chunks so that no single where-clause gets unwieldy.
+
+    Args:
+        id_field_names: Names of the feature ID fields.
+        ids: ID sequences, in the same order as `id_field_names`.
+        chunk_size: Maximum number of IDs to include in each where-clause.
+        dataset_path: Path to dataset the where-clauses are for. Sets the syntax for
+            datetime literals (see `sql_value_literal`).
+    """
+    ids = list(ids)
+    for i in range(0, len(ids), chunk_size):
+        chunk = ids[i : i + chunk_size]
+        if len(id_field_names) == 1 and None not in (_id[0] for _id in chunk):
+            values = ", ".join(
+                sql_value_literal(_id[0], dataset_path=dataset_path) for _id in chunk
+            )
+            yield f"{id_field_names[0]} IN ({values})"
+
+        else:
+            yield " OR ".join(
+                "("
+                + " AND ".join(
+                    f"{field_name} IS NULL"
+                    if value is None
+                    else (
+                        f"{field_name} = "
+                        + sql_value_literal(value, dataset_path=dataset_path)
+                    )
+                    for field_name, value in zip(id_field_names, _id)
+                )
+                + ")"
+                for _id in chunk
+            )
+
+
 def log_entity_states(
     entity_label: str,
     states: Counter,
@@ -206,6 +288,42 @@ def slugify(text: str, *, separator: str = "-", force_lowercase: bool = True) ->
     return slug
 
 
+def sql_value_literal(
+    value: Any, *, dataset_path: Optional[Union[Path, str]] = None
+) -> str:
+    """Return value as a literal for an SQL where-clause.
+
+    Notes:
+        Date & datetime literals use the syntax for the workspace of the dataset (see
+            `SQL_DATETIME_LITERAL_FORMATS`), or the file geodatabase syntax if no
+            dataset is given.
+
+    Args:
+        value: Value to represent.
+        dataset_path: Path to dataset the where-clause is for.
+
+    Raises:
+        ValueError: If value is a date or datetime & dataset workspace has no supported
+            datetime literal.
+    """
+    if value is None:
+        literal = "NULL"
+    elif isinstance(value, bool):
+        literal = str(int(value))
+    elif isinstance(value, (float, int)):
+        literal = repr(value)
+    # Datetime is a subclass of date.
+    elif isinstance(value, date):
+        literal = value.strftime(
+            _datetime_literal_format(dataset_path)
+            if dataset_path is not None
+            else SQL_DATETIME_LITERAL_FORMATS["FileGDBWorkspace"]
+        )
+    else:
+        literal = "'" + str(value).replace("'", "''") + "'"
+    return literal
+
+
 def unique_ids(
     data_type: Any = UUID, *, string_length: int = 4, initial_number: int = 1
 ) -> Union[float, int, str, UUID]:
@@ -1,14 +1,40 @@
 """Network analysis operations."""
-from collections import Counter
-from copy import copy, deepcopy
+import pickle
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ContextDecorator
+from dataclasses import dataclass, field
+from heapq import heapify, heappop, heappush
+from itertools import count
 from logging import DEBUG, INFO, Logger, getLogger
+from math import floor, hypot
+from operator import itemgetter
 from pathlib import Path
-from types import FunctionType
-from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import perf_counter
+from types import FunctionType, TracebackType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from arcpy import SetLogHistory
+import numpy
+from arcpy import Array, Exists, FromWKB, Polyline, SetLogHistory
+from arcpy import SpatialReference as ArcSpatialReference
 from arcpy.da import UpdateCursor
-from arcpy.management import Delete
+from arcpy.management import Delete, Merge
 from arcpy.na import AddLocations, MakeServiceAreaLayer, Solve
 from arcpy.nax import (
     BuildNetwork,
@@ -17,27 +43,34 @@ from arcpy.nax import (
     ClosestFacilityOutputDataType,
     DistanceUnits,
     GetTravelModes,
+    MakeNetworkDatasetLayer,
     MessageSeverity,
     TravelDirection,
 )
+from more_itertools import pairwise
 
-from arcproc.dataset import DatasetView, copy_dataset_features
+from arcproc.dataset import DatasetView, copy_dataset_features, dataset_signature
 from arcproc.features import features_as_dicts, features_as_tuples
 from arcproc.field import add_field, update_field_with_function
-from arcproc.geometry import UNIT_PLURAL
+from arcproc.geometry import UNIT_PLURAL, morton_code
 from arcproc.metadata import (
+    FEATURE_COUNT_CACHE,
+    METADATA_CACHE,
     Dataset,
     Field,
     SpatialReference,
     SpatialReferenceSourceItem,
 )
 from arcproc.misc import (
+    ids_where_sql,
     log_entity_states,
     python_type_constructor,
     same_feature,
     unique_ids,
+    unique_name,
 )
-from arcproc.workspace import Session
+from arcproc.profiling import profile_cursor, record_metric
+from arcproc.workspace import Session, create_file_geodatabase, delete_workspace
 
 
 LOG: Logger = getLogger(__name__)
@@ -55,6 +88,879 @@ FIELD_TYPE_EXTRACTOR_MAP: Dict[str, FunctionType] = {
 }
 """Mapping of ArcGIS field type to ID extract function for network solution layer."""
 
+# Py3.7: Can replace usage with `typing.Self` in Py3.11.
+TNetworkSession = TypeVar("TNetworkSession", bound="NetworkSession")
+"""Type variable to enable method return of self on NetworkSession."""
+
+
+class NetworkSession(ContextDecorator):
+    """Context manager for reusing network analysis setup across many solves.
+
+    The network dataset layer & travel modes are opened once. Solver objects & service
+    area layers are kept alive for the session, & facility loads are skipped when the
+    facility dataset is unchanged (by `dataset_signature`) since the last load.
+    """
+
+    layer_name: str
+    """Name of network dataset layer."""
+    network_path: Path
+    """Path to network dataset."""
+    travel_modes: Dict[str, Any]
+    """Mapping of travel mode name to travel mode object for network."""
+
+    def __init__(self, network_path: Union[Path, str]) -> None:
+        """Initialize instance.
+
+        Args:
+            network_path: Path to network dataset.
+        """
+        self.layer_name = unique_name("Network")
+        self.network_path = Path(network_path)
+        self.travel_modes = {}
+        self._analysis_facility_load = {}
+        self._closest_facility_analyses = {}
+        self._service_area_layers = {}
+
+    def __enter__(self) -> TNetworkSession:
+        return self.open()
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """True if session is open, False otherwise."""
+        return Exists(self.layer_name)
+
+    def close(self) -> bool:
+        """Close session, deleting layers & dropping solver objects.
+
+        Returns:
+            True if session closed, False if session was not open.
+        """
+        for layer_name in self._service_area_layers.values():
+            if Exists(layer_name):
+                Delete(layer_name)
+        self._analysis_facility_load.clear()
+        self._closest_facility_analyses.clear()
+        self._service_area_layers.clear()
+        self.travel_modes = {}
+        if not self.is_open:
+            return False
+
+        Delete(self.layer_name)
+        return True
+
+    def closest_facility_analysis(
+        self,
+        *,
+        facility_path: Path,
+        facility_id_field_name: str,
+        facility_where_sql: Optional[str],
+        incident_field_description: List[Any],
+        travel_mode: str,
+        distance_units: str,
+        travel_from_facility: bool,
+    ) -> ClosestFacility:
+        """Return closest facility solver object, with facilities loaded.
+
+        Args:
+            facility_path: Path to facility dataset.
+            facility_id_field_name: Name of facility dataset ID field.
+            facility_where_sql: SQL where-clause for the facility dataset subselection.
+            incident_field_description: Field description for incident source ID.
+            travel_mode: Name of the network travel mode to use.
+            distance_units: Name of distance units for analysis, e.g. "Feet".
+            travel_from_facility: Perform the analysis travelling from the facility if
+                True.
+        """
+        facility_field_description = _source_id_field_description(
+            facility_path, facility_id_field_name
+        )
+        key = (
+            "closest_facility",
+            travel_mode,
+            distance_units,
+            travel_from_facility,
+            tuple(facility_field_description),
+            tuple(incident_field_description),
+        )
+        if key not in self._closest_facility_analyses:
+            analysis = _closest_facility_analysis(
+                self.layer_name,
+                travel_mode=self.travel_modes[travel_mode],
+                distance_units=distance_units,
+                travel_from_facility=travel_from_facility,
+            )
+            analysis.addFields(
+                ClosestFacilityInputDataType.Facilities, [facility_field_description]
+            )
+            analysis.addFields(
+                ClosestFacilityInputDataType.Incidents, [incident_field_description]
+            )
+            self._closest_facility_analyses[key] = analysis
+        analysis = self._closest_facility_analyses[key]
+        facility_load = (
+            str(facility_path),
+            facility_id_field_name,
+            facility_where_sql,
+            dataset_signature(facility_path),
+        )
+        if self._analysis_facility_load.get(key) != facility_load:
+            _load_analysis_features(
+                analysis,
+                ClosestFacilityInputDataType.Facilities,
+                dataset_path=facility_path,
+                id_field_name=facility_id_field_name,
+                dataset_where_sql=facility_where_sql,
+            )
+            self._analysis_facility_load[key] = facility_load
+        return analysis
+
+    def load_service_area_facilities(
+        self,
+        layer_name: str,
+        *,
+        dataset_path: Path,
+        id_field_name: str,
+        dataset_where_sql: Optional[str],
+        max_distance: Union[float, int],
+    ) -> bool:
+        """Load facilities into service area layer, unless unchanged since last load.
+
+        Args:
+            layer_name: Name of service area analysis layer.
+            dataset_path: Path to facility dataset.
+            id_field_name: Name of dataset ID field.
+            dataset_where_sql: SQL where-clause for dataset subselection.
+            max_distance: Search tolerance for locating facilities on network.
+
+        Returns:
+            True if facilities were loaded, False if already loaded.
+        """
+        facility_load = (
+            str(dataset_path),
+            id_field_name,
+            dataset_where_sql,
+            max_distance,
+            dataset_signature(dataset_path),
+        )
+        if self._analysis_facility_load.get(layer_name) == facility_load:
+            return False
+
+        _service_area_facilities_load(
+            layer_name,
+            dataset_path=dataset_path,
+            id_field_name=id_field_name,
+            dataset_where_sql=dataset_where_sql,
+            max_distance=max_distance,
+        )
+        self._analysis_facility_load[layer_name] = facility_load
+        return True
+
+    def open(self) -> TNetworkSession:
+        """Open session.
+
+        Returns:
+            Reference to instance.
+        """
+        if not self.is_open:
+            # ArcPy2.8.0: Convert Path to str.
+            MakeNetworkDatasetLayer(
+                in_network_dataset=str(self.network_path),
+                out_network_dataset_layer=self.layer_name,
+            )
+        self.travel_modes = GetTravelModes(self.layer_name)
+        return self
+
+    def service_area_layer(self, **layer_kwargs: Any) -> str:
+        """Return name of service area layer for parameters, creating if needed.
+
+        Args:
+            **layer_kwargs: Keyword arguments for `MakeServiceAreaLayer`, other than
+                network & layer name.
+        """
+        key = tuple(
+            sorted(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in layer_kwargs.items()
+            )
+        )
+        if key not in self._service_area_layers:
+            layer_name = unique_name("ServiceArea")
+            MakeServiceAreaLayer(
+                in_network_dataset=self.layer_name,
+                out_network_analysis_layer=layer_name,
+                **layer_kwargs,
+            )
+            self._service_area_layers[key] = layer_name
+        return self._service_area_layers[key]
+
+
+@dataclass(eq=False)
+class NodeGraph:
+    """Compact node graph for line features, backed by NumPy arrays.
+
+    Line endpoints within the snap tolerance of each other share a node. Feature
+    incidence for each node is stored in compressed sparse row (CSR) arrays: features
+    starting at node `i` are `from_features[from_offsets[i] : from_offsets[i + 1]]`
+    (likewise for `to_*`).
+    """
+
+    tolerance: float
+    """Snap tolerance for merging endpoints into nodes, in dataset units."""
+    node_coordinates: numpy.ndarray
+    """Coordinates for each node, as (node count, 2) array."""
+    node_ids: List[Any]
+    """Node ID for each node. None if node has no ID."""
+    feature_ids: List[Tuple[Any]]
+    """Feature ID for each feature."""
+    feature_from_nodes: numpy.ndarray
+    """From-node index for each feature."""
+    feature_to_nodes: numpy.ndarray
+    """To-node index for each feature."""
+    feature_lengths: numpy.ndarray
+    """Geometry length for each feature."""
+    id_field_names: List[str] = field(default_factory=lambda: ["OID@"])
+    """Names of the feature ID fields."""
+    from_offsets: numpy.ndarray = field(init=False)
+    """CSR offsets into `from_features` for each node."""
+    from_features: numpy.ndarray = field(init=False)
+    """Feature indices ordered by from-node."""
+    to_offsets: numpy.ndarray = field(init=False)
+    """CSR offsets into `to_features` for each node."""
+    to_features: numpy.ndarray = field(init=False)
+    """Feature indices ordered by to-node."""
+
+    def __post_init__(self) -> None:
+        self.from_offsets, self.from_features = _csr_incidence(
+            self.feature_from_nodes, self.node_count
+        )
+        self.to_offsets, self.to_features = _csr_incidence(
+            self.feature_to_nodes, self.node_count
+        )
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset_path: Union[Path, str],
+        *,
+        from_id_field_name: Optional[str] = None,
+        to_id_field_name: Optional[str] = None,
+        id_field_names: Iterable[str] = ("OID@",),
+        dataset_where_sql: Optional[str] = None,
+        tolerance: float = 0.0,
+        spatial_reference_item: SpatialReferenceSourceItem = None,
+    ) -> "NodeGraph":
+        """Return node graph built from line dataset.
+
+        Args:
+            dataset_path: Path to dataset.
+            from_id_field_name: Name of from-node ID field. If set to None, nodes will
+                not have IDs.
+            to_id_field_name: Name of to-node ID field. If set to None, nodes will not
+                have IDs.
+            id_field_names: Names of the feature ID fields.
+            dataset_where_sql: SQL where-clause for dataset subselection.
+            tolerance: Snap tolerance for merging endpoints into nodes, in dataset
+                units. If set to 0, only endpoints with identical coordinates merge.
+            spatial_reference_item: Item from which the spatial reference for any
+                geometry properties will be set to. If set to None, will use spatial
+                reference of the dataset.
+        """
+        dataset_path = Path(dataset_path)
+        id_field_names = list(id_field_names)
+        node_id_field_names = (
+            [from_id_field_name, to_id_field_name]
+            if from_id_field_name and to_id_field_name
+            else []
+        )
+        snapper = _NodeSnapper(tolerance)
+        node_ids = []
+        feature_ids = []
+        feature_nodes = []
+        feature_lengths = []
+        for feature in features_as_tuples(
+            dataset_path,
+            field_names=id_field_names + node_id_field_names + ["SHAPE@"],
+            dataset_where_sql=dataset_where_sql,
+            spatial_reference_item=spatial_reference_item,
+        ):
+            geometry = feature[-1]
+            if geometry is None:
+                continue
+
+            feature_ids.append(tuple(feature[: len(id_field_names)]))
+            node_indices = []
+            for i, point in enumerate([geometry.firstPoint, geometry.lastPoint]):
+                node_index = snapper.node_index(point.X, point.Y)
+                if node_index == len(node_ids):
+                    node_ids.append(None)
+                if node_id_field_names:
+                    node_id = feature[len(id_field_names) + i]
+                    # Assign lower node ID if newer is different than current.
+                    if node_ids[node_index] is None:
+                        node_ids[node_index] = node_id
+                    elif node_id is not None:
+                        node_ids[node_index] = min(node_ids[node_index], node_id)
+                node_indices.append(node_index)
+            feature_nodes.append(node_indices)
+            feature_lengths.append(geometry.length)
+        feature_nodes = numpy.array(feature_nodes, dtype=numpy.int64).reshape(-1, 2)
+        return cls(
+            tolerance=tolerance,
+            node_coordinates=numpy.array(
+                snapper.coordinates, dtype=numpy.float64
+            ).reshape(-1, 2),
+            node_ids=node_ids,
+            feature_ids=feature_ids,
+            feature_from_nodes=feature_nodes[:, 0],
+            feature_to_nodes=feature_nodes[:, 1],
+            feature_lengths=numpy.array(feature_lengths, dtype=numpy.float64),
+            id_field_names=id_field_names,
+        )
+
+    @property
+    def feature_count(self) -> int:
+        """Number of features in graph."""
+        return len(self.feature_ids)
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in graph."""
+        return len(self.node_coordinates)
+
+    def as_coordinates_node_map(self) -> Dict[Tuple[float], Dict[str, Any]]:
+        """Return graph as mapping of coordinates to node info mapping.
+
+        Notes:
+            Output format is the same as `coordinates_node_map`:
+                `{(x, y): {"node_id": Any, "feature_ids": {"from": set, "to": set}}}`
+        """
+        return {
+            tuple(coordinates): {
+                "node_id": self.node_ids[i],
+                "feature_ids": {
+                    "from": {self.feature_ids[j] for j in self.from_feature_indices(i)},
+                    "to": {self.feature_ids[j] for j in self.to_feature_indices(i)},
+                },
+            }
+            for i, coordinates in enumerate(self.node_coordinates.tolist())
+        }
+
+    def from_feature_indices(self, node_index: int) -> numpy.ndarray:
+        """Return indices of features starting at node.
+
+        Args:
+            node_index: Index of node.
+        """
+        return self.from_features[
+            self.from_offsets[node_index] : self.from_offsets[node_index + 1]
+        ]
+
+    def node_feature_counts(self) -> numpy.ndarray:
+        """Return number of distinct features incident to each node."""
+        from_counts = numpy.bincount(self.feature_from_nodes, minlength=self.node_count)
+        to_counts = numpy.bincount(self.feature_to_nodes, minlength=self.node_count)
+        # Loop features start & end at the same node; count only once.
+        loop_counts = numpy.bincount(
+            self.feature_from_nodes[self.feature_from_nodes == self.feature_to_nodes],
+            minlength=self.node_count,
+        )
+        return from_counts + to_counts - loop_counts
+
+    def node_feature_count(self, node_index: int) -> int:
+        """Return number of distinct features incident to node.
+
+        Args:
+            node_index: Index of node.
+        """
+        return len(
+            set(self.from_feature_indices(node_index).tolist()).union(
+                self.to_feature_indices(node_index).tolist()
+            )
+        )
+
+    def update_node_ids(
+        self, *, node_id_data_type: Any = int, node_id_max_length: int = 4
+    ) -> Dict[int, Any]:
+        """Assign new IDs in-place to nodes missing an ID or sharing another node's ID.
+
+        Where nodes share an ID, the node with the most features keeps it (ties go to
+        the lowest coordinates).
+
+        Args:
+            node_id_data_type: Value type for node ID.
+            node_id_max_length: Maximum length for node ID, if ID data type is string.
+
+        Returns:
+            Mapping of node index to new node ID, for changed nodes only.
+        """
+        reassignments = _node_id_reassignments(
+            self.node_ids,
+            feature_counts=self.node_feature_counts().tolist(),
+            coordinates=[tuple(xy) for xy in self.node_coordinates.tolist()],
+            node_id_data_type=node_id_data_type,
+            node_id_max_length=node_id_max_length,
+        )
+        for i, node_id in reassignments.items():
+            self.node_ids[i] = node_id
+        return reassignments
+
+    def to_feature_indices(self, node_index: int) -> numpy.ndarray:
+        """Return indices of features ending at node.
+
+        Args:
+            node_index: Index of node.
+        """
+        return self.to_features[
+            self.to_offsets[node_index] : self.to_offsets[node_index + 1]
+        ]
+
+
+@dataclass(eq=False)
+class RoutingGraph:
+    """Directed, costed graph over a node graph, for in-process shortest-path routing.
+
+    Each line feature becomes up to two directed edges (along & against digitized
+    direction). Outgoing & incoming edges for each node are stored in CSR arrays.
+    """
+
+    node_graph: NodeGraph
+    """Node graph the routing graph is built over."""
+    edge_sources: numpy.ndarray
+    """Source node index for each edge."""
+    edge_targets: numpy.ndarray
+    """Target node index for each edge."""
+    edge_costs: numpy.ndarray
+    """Traversal cost for each edge."""
+    edge_features: numpy.ndarray
+    """Feature index for each edge."""
+    edge_along: numpy.ndarray
+    """True for each edge traversing its feature in digitized direction."""
+    out_offsets: numpy.ndarray = field(init=False)
+    """CSR offsets into `out_edges` for each node."""
+    out_edges: numpy.ndarray = field(init=False)
+    """Edge indices ordered by source node."""
+    in_offsets: numpy.ndarray = field(init=False)
+    """CSR offsets into `in_edges` for each node."""
+    in_edges: numpy.ndarray = field(init=False)
+    """Edge indices ordered by target node."""
+
+    def __post_init__(self) -> None:
+        self.out_offsets, self.out_edges = _csr_incidence(
+            self.edge_sources, self.node_graph.node_count
+        )
+        self.in_offsets, self.in_edges = _csr_incidence(
+            self.edge_targets, self.node_graph.node_count
+        )
+        self._node_grid = None
+        # Lists index faster than arrays in the search loop; convert once, not per search.
+        self._search_adjacency = {
+            False: (
+                self.out_offsets.tolist(),
+                self.out_edges.tolist(),
+                self.edge_targets.tolist(),
+            ),
+            True: (
+                self.in_offsets.tolist(),
+                self.in_edges.tolist(),
+                self.edge_sources.tolist(),
+            ),
+        }
+        self._search_edge_costs = self.edge_costs.tolist()
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset_path: Union[Path, str],
+        *,
+        cost_field_name: Optional[str] = None,
+        reverse_cost_field_name: Optional[str] = None,
+        id_field_names: Iterable[str] = ("OID@",),
+        dataset_where_sql: Optional[str] = None,
+        tolerance: float = 0.0,
+        spatial_reference_item: SpatialReferenceSourceItem = None,
+    ) -> "RoutingGraph":
+        """Return routing graph built from line dataset.
+
+        Args:
+            dataset_path: Path to dataset.
+            cost_field_name: Name of field with cost to traverse feature in digitized
+                direction. If set to None, cost will be the feature length.
+            reverse_cost_field_name: Name of field with cost to traverse feature
+                against digitized direction. If set to None, will use same cost as
+                digitized direction. Null or negative costs make a direction
+                untraversable.
+            id_field_names: Names of the feature ID fields.
+            dataset_where_sql: SQL where-clause for dataset subselection.
+            tolerance: Snap tolerance for merging endpoints into nodes, in dataset
+                units.
+            spatial_reference_item: Item from which the spatial reference for any
+                geometry properties will be set to. If set to None, will use spatial
+                reference of the dataset.
+        """
+        dataset_path = Path(dataset_path)
+        id_field_names = list(id_field_names)
+        node_graph = NodeGraph.from_dataset(
+            dataset_path,
+            id_field_names=id_field_names,
+            dataset_where_sql=dataset_where_sql,
+            tolerance=tolerance,
+            spatial_reference_item=spatial_reference_item,
+        )
+        cost_field_names = [
+            name for name in [cost_field_name, reverse_cost_field_name] if name
+        ]
+        if cost_field_names:
+            id_costs = {
+                tuple(feature[: len(id_field_names)]): feature[len(id_field_names) :]
+                for feature in features_as_tuples(
+                    dataset_path,
+                    field_names=id_field_names + cost_field_names,
+                    dataset_where_sql=dataset_where_sql,
+                )
+            }
+        edges = []
+        for i, feature_id in enumerate(node_graph.feature_ids):
+            length = float(node_graph.feature_lengths[i])
+            costs = id_costs[feature_id] if cost_field_names else ()
+            cost = costs[0] if cost_field_name else length
+            reverse_cost = costs[-1] if reverse_cost_field_name else cost
+            from_node = int(node_graph.feature_from_nodes[i])
+            to_node = int(node_graph.feature_to_nodes[i])
+            if cost is not None and cost >= 0:
+                edges.append((from_node, to_node, cost, i, True))
+            if reverse_cost is not None and reverse_cost >= 0:
+                edges.append((to_node, from_node, reverse_cost, i, False))
+        sources, targets, costs, features, along = (
+            zip(*edges) if edges else ([], [], [], [], [])
+        )
+        return cls(
+            node_graph=node_graph,
+            edge_sources=numpy.array(sources, dtype=numpy.int64),
+            edge_targets=numpy.array(targets, dtype=numpy.int64),
+            edge_costs=numpy.array(costs, dtype=numpy.float64),
+            edge_features=numpy.array(features, dtype=numpy.int64),
+            edge_along=numpy.array(along, dtype=bool),
+        )
+
+    def nearest_node(self, x: float, y: float) -> int:
+        """Return index of node nearest to coordinates.
+
+        Node grid index is built on first call & reused for later calls.
+
+        Args:
+            x: X-coordinate.
+            y: Y-coordinate.
+
+        Raises:
+            ValueError: If graph has no nodes.
+        """
+        if self._node_grid is None:
+            self._node_grid = _NodeGrid(self.node_graph.node_coordinates)
+        return self._node_grid.nearest(x, y)
+
+    def route_edges(
+        self,
+        predecessors: Mapping[Tuple[int, Any], int],
+        *,
+        node_index: int,
+        source_label: Any,
+        reverse: bool = False,
+    ) -> List[int]:
+        """Return edge indices for route from search source to node, in travel order.
+
+        Args:
+            predecessors: Mapping of (node index, source label) to predecessor edge
+                index, from `search`.
+            node_index: Index of node to route to (or from, if search was reversed).
+            source_label: Label of search source the route belongs to.
+            reverse: True if search was reversed.
+        """
+        edges = []
+        while (node_index, source_label) in predecessors:
+            edge = predecessors[(node_index, source_label)]
+            edges.append(edge)
+            node_index = int(
+                self.edge_targets[edge] if reverse else self.edge_sources[edge]
+            )
+        # Forward search walks back from route end; reversed walks from route start.
+        if not reverse:
+            edges.reverse()
+        return edges
+
+    def route_geometry(
+        self,
+        edges: Sequence[int],
+        *,
+        feature_geometries: Mapping[int, Polyline],
+        spatial_reference: Optional[ArcSpatialReference] = None,
+    ) -> Optional[Polyline]:
+        """Return route geometry for edges.
+
+        Args:
+            edges: Edge indices for route, in travel order.
+            feature_geometries: Mapping of feature index to geometry, for features on
+                route.
+            spatial_reference: Spatial reference for geometry.
+
+        Returns:
+            Route geometry. None if route has no edges.
+        """
+        if not edges:
+            return None
+
+        points = []
+        for edge in edges:
+            geometry = feature_geometries[int(self.edge_features[edge])]
+            edge_points = [point for part in geometry for point in part if point]
+            if not self.edge_along[edge]:
+                edge_points.reverse()
+            points.extend(edge_points[1:] if points else edge_points)
+        return Polyline(Array(points), spatial_reference)
+
+    def search(
+        self,
+        source_label_nodes: Iterable[Tuple[Any, int]],
+        *,
+        max_cost: Optional[float] = None,
+        source_count: int = 1,
+        reverse: bool = False,
+        stop_node_indices: Optional[Iterable[int]] = None,
+    ) -> Tuple[Dict[int, List[Tuple[float, Any]]], Dict[Tuple[int, Any], int]]:
+        """Run multi-source Dijkstra search over graph.
+
+        Each node is settled for up to `source_count` distinct sources, closest first.
+
+        Args:
+            source_label_nodes: Pairs of (source label, node index) to search from.
+            max_cost: Maximum cost to search to. If set to None, no maximum.
+            source_count: Number of closest sources to settle each node for.
+            reverse: Search against edge direction if True (i.e. find costs from each
+                node to sources, rather than from sources to each node).
+            stop_node_indices: Stop search once all these nodes are settled for
+                `source_count` sources. If set to None, search whole graph.
+
+        Returns:
+            Mapping of node index to list of (cost, source label), closest first; &
+            mapping of (node index, source label) to predecessor edge index.
+        """
+        offsets, node_edges, next_nodes = self._search_adjacency[bool(reverse)]
+        edge_costs = self._search_edge_costs
+        remaining = set(stop_node_indices) if stop_node_indices is not None else None
+        order = count()
+        heap = [
+            (0.0, next(order), node_index, label, None)
+            for label, node_index in source_label_nodes
+        ]
+        heapify(heap)
+        node_costs = defaultdict(list)
+        node_labels = defaultdict(set)
+        predecessors = {}
+        while heap:
+            cost, _, node_index, label, edge = heappop(heap)
+            if max_cost is not None and cost > max_cost:
+                break
+
+            if (
+                label in node_labels[node_index]
+                or len(node_labels[node_index]) >= source_count
+            ):
+                continue
+
+            node_labels[node_index].add(label)
+            node_costs[node_index].append((cost, label))
+            if edge is not None:
+                predecessors[(node_index, label)] = edge
+            if remaining is not None and len(node_labels[node_index]) == source_count:
+                remaining.discard(node_index)
+                if not remaining:
+                    break
+
+            for i in range(offsets[node_index], offsets[node_index + 1]):
+                edge = node_edges[i]
+                next_node = next_nodes[edge]
+                next_cost = cost + edge_costs[edge]
+                # Do not queue nodes beyond maximum cost: they can never settle.
+                if max_cost is not None and next_cost > max_cost:
+                    continue
+
+                if len(node_labels[next_node]) < source_count:
+                    heappush(heap, (next_cost, next(order), next_node, label, edge))
+        return dict(node_costs), predecessors
+
+
+class _NodeGrid:
+    """Uniform-grid index for nearest-node lookup over node coordinates."""
+
+    cell_size: float
+    """Width & height of grid cells."""
+    coordinates: numpy.ndarray
+    """Coordinates for each node, as (node count, 2) array."""
+
+    def __init__(self, coordinates: numpy.ndarray) -> None:
+        """Initialize instance.
+
+        Cell size is chosen for roughly one node per cell over the node extent.
+
+        Args:
+            coordinates: Coordinates for each node, as (node count, 2) array.
+        """
+        self.coordinates = numpy.asarray(coordinates, dtype=numpy.float64)
+        if len(self.coordinates):
+            self._origin = self.coordinates.min(axis=0)
+            width, height = self.coordinates.max(axis=0) - self._origin
+            self.cell_size = (
+                (width * height / len(self.coordinates)) ** 0.5
+                or max(width, height) / len(self.coordinates)
+                or 1.0
+            )
+            cells = numpy.floor(
+                (self.coordinates - self._origin) / self.cell_size
+            ).astype(numpy.int64)
+            self._max_cell = cells.max(axis=0)
+        else:
+            self.cell_size = 1.0
+            cells = numpy.empty((0, 2), dtype=numpy.int64)
+        self._cell_node_indices = defaultdict(list)
+        for node_index, cell in enumerate(map(tuple, cells.tolist())):
+            self._cell_node_indices[cell].append(node_index)
+        self._cell_node_indices = {
+            cell: numpy.array(node_indices, dtype=numpy.int64)
+            for cell, node_indices in self._cell_node_indices.items()
+        }
+
+    def _ring_cells(self, cell: Tuple[int, int], ring: int) -> Iterator[Tuple[int]]:
+        """Generate grid cells at Chebyshev distance `ring` from cell, within grid."""
+        max_x, max_y = self._max_cell.tolist()
+        x_range = range(max(cell[0] - ring, 0), min(cell[0] + ring, max_x) + 1)
+        for y in {cell[1] - ring, cell[1] + ring}:
+            if 0 <= y <= max_y:
+                for x in x_range:
+                    yield (x, y)
+        y_range = range(max(cell[1] - ring + 1, 0), min(cell[1] + ring - 1, max_y) + 1)
+        for x in {cell[0] - ring, cell[0] + ring} if ring else set():
+            if 0 <= x <= max_x:
+                for y in y_range:
+                    yield (x, y)
+
+    def nearest(self, x: float, y: float) -> int:
+        """Return index of node nearest to coordinates.
+
+        Args:
+            x: X-coordinate.
+            y: Y-coordinate.
+
+        Raises:
+            ValueError: If grid has no nodes.
+        """
+        if not len(self.coordinates):
+            raise ValueError("Grid has no nodes")
+
+        cell = tuple(
+            int(value)
+            for value in numpy.floor(((x, y) - self._origin) / self.cell_size)
+        )
+        max_x, max_y = self._max_cell.tolist()
+        # Rings before the first reach no cells in grid; rings after the last, none.
+        first_ring = max(-cell[0], cell[0] - max_x, -cell[1], cell[1] - max_y, 0)
+        last_ring = max(cell[0], max_x - cell[0], cell[1], max_y - cell[1])
+        nearest_index, nearest_distance = None, None
+        for ring in range(first_ring, last_ring + 1):
+            # Nodes in this ring & beyond are at least this far.
+            if (
+                nearest_distance is not None
+                and nearest_distance <= (ring - 1) * self.cell_size
+            ):
+                break
+
+            for _cell in self._ring_cells(cell, ring):
+                node_indices = self._cell_node_indices.get(_cell)
+                if node_indices is None:
+                    continue
+
+                offsets = self.coordinates[node_indices] - (x, y)
+                distances = numpy.hypot(offsets[:, 0], offsets[:, 1])
+                i = int(numpy.argmin(distances))
+                if nearest_distance is None or distances[i] < nearest_distance:
+                    nearest_index = int(node_indices[i])
+                    nearest_distance = float(distances[i])
+        return nearest_index
+
+
+class _NodeSnapper:
+    """Hash-grid lookup assigning node indices to snapped endpoint coordinates."""
+
+    coordinates: List[Tuple[float, float]]
+    """Coordinates for each node index, as first seen."""
+    tolerance: float
+    """Snap tolerance for merging endpoints into nodes."""
+
+    def __init__(self, tolerance: float) -> None:
+        """Initialize instance.
+
+        Args:
+            tolerance: Snap tolerance for merging endpoints into nodes.
+        """
+        self.coordinates = []
+        self.tolerance = tolerance
+        self._cell_node_indices = defaultdict(list)
+
+    def _cell(self, x: float, y: float) -> Tuple[Union[float, int]]:
+        """Return grid cell key for coordinates."""
+        if self.tolerance <= 0:
+            return (x, y)
+
+        return (floor(x / self.tolerance), floor(y / self.tolerance))
+
+    def node_index(self, x: float, y: float) -> int:
+        """Return node index for coordinates, adding new node if none within tolerance.
+
+        Args:
+            x: X-coordinate.
+            y: Y-coordinate.
+        """
+        cell = self._cell(x, y)
+        if self.tolerance <= 0:
+            cells = [cell]
+        else:
+            cells = [
+                (cell[0] + x_offset, cell[1] + y_offset)
+                for x_offset in (-1, 0, 1)
+                for y_offset in (-1, 0, 1)
+            ]
+        for _cell in cells:
+            for node_index in self._cell_node_indices.get(_cell, []):
+                node_x, node_y = self.coordinates[node_index]
+                if hypot(x - node_x, y - node_y) <= self.tolerance:
+                    return node_index
+
+        node_index = len(self.coordinates)
+        self.coordinates.append((x, y))
+        self._cell_node_indices[cell].append(node_index)
+        return node_index
+
+
+def _csr_incidence(
+    feature_nodes: numpy.ndarray, node_count: int
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Return CSR offsets & feature indices for feature-node incidence.
+
+    Args:
+        feature_nodes: Node index for each feature.
+        node_count: Number of nodes.
+    """
+    features = numpy.argsort(feature_nodes, kind="stable")
+    offsets = numpy.zeros(node_count + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(feature_nodes, minlength=node_count), out=offsets[1:])
+    return offsets, features
+
 
 def build_network(network_path: Union[Path, str], *, log_level: int = INFO) -> Dataset:
     """Build network.
@@ -74,6 +980,541 @@ def build_network(network_path: Union[Path, str], *, log_level: int = INFO) -> D
     return Dataset(network_path)
 
 
+def _closest_facility_chunk_routes(
+    chunk_index: int,
+    *,
+    dataset_path: Path,
+    id_field_name: str,
+    incidents: Sequence[Tuple[Any, bytes]],
+    facility_path: Path,
+    facility_id_field_name: str,
+    facilities: Sequence[Tuple[Any, bytes]],
+    **solve_kwargs: Any,
+) -> Tuple[int, List[Dict[str, Any]], float, Optional[str]]:
+    """Return closest facility routes for a chunk of incidents.
+
+    Geometry goes in & out as WKB, so that this can run in a worker process. Route
+    geometry is in the solver output spatial reference (that of the network), which
+    is returned alongside as a string.
+
+    Args:
+        chunk_index: Index of chunk.
+        dataset_path: Path to dataset.
+        id_field_name: Name of dataset ID field.
+        incidents: Incidents in chunk, as (ID, geometry WKB).
+        facility_path: Path to facility dataset.
+        facility_id_field_name: Name of facility dataset ID field.
+        facilities: Facilities, as (ID, geometry WKB).
+        **solve_kwargs: Keyword arguments for `_closest_facility_solve`.
+
+    Returns:
+        Chunk index, routes (geometry as WKB), seconds taken to solve chunk, & route
+        spatial reference as string (None if chunk has no route geometry).
+    """
+    start_time = perf_counter()
+    incident_spatial_reference = SpatialReference(dataset_path).object
+    facility_spatial_reference = SpatialReference(facility_path).object
+    routes = []
+    route_spatial_reference = None
+    for route in _closest_facility_solve(
+        incident_field_description=_source_id_field_description(
+            dataset_path, id_field_name
+        ),
+        incidents=[
+            (_id, FromWKB(wkb, incident_spatial_reference)) for _id, wkb in incidents
+        ],
+        facility_field_description=_source_id_field_description(
+            facility_path, facility_id_field_name
+        ),
+        facilities=[
+            (_id, FromWKB(wkb, facility_spatial_reference)) for _id, wkb in facilities
+        ],
+        **solve_kwargs,
+    ):
+        if route["geometry"] is not None:
+            if route_spatial_reference is None:
+                route_spatial_reference = route[
+                    "geometry"
+                ].spatialReference.exportToString()
+            route["geometry"] = bytes(route["geometry"].WKB)
+        routes.append(route)
+    return chunk_index, routes, perf_counter() - start_time, route_spatial_reference
+
+
+def _closest_facility_analysis(
+    network: Union[Path, str],
+    *,
+    travel_mode: Any,
+    distance_units: str,
+    travel_from_facility: bool,
+) -> ClosestFacility:
+    """Return closest facility analysis solver object.
+
+    Args:
+        network: Path to network dataset, or name of network dataset layer.
+        travel_mode: Network travel mode object to use.
+        distance_units: Name of distance units for analysis, e.g. "Feet".
+        travel_from_facility: Perform the analysis travelling from the facility if True.
+    """
+    analysis = ClosestFacility(network)
+    analysis.distanceUnits = getattr(DistanceUnits, distance_units)
+    analysis.ignoreInvalidLocations = True
+    if travel_from_facility:
+        analysis.travelDirection = TravelDirection.FromFacility
+    analysis.travelMode = travel_mode
+    return analysis
+
+
+def _closest_facility_results(
+    analysis: ClosestFacility, *, distance_units: str
+) -> Iterator[Dict[str, Any]]:
+    """Generate closest facility routes from solving analysis.
+
+    Args:
+        analysis: Closest facility analysis solver object, with inputs loaded.
+        distance_units: Name of distance units for analysis, e.g. "Feet".
+
+    Raises:
+        RuntimeError: When analysis fails.
+    """
+    result = analysis.solve()
+    if not result.solveSucceeded:
+        for message in result.solverMessages(MessageSeverity.All):
+            LOG.error(message)
+        raise RuntimeError("Closest facility analysis failed")
+
+    facility_oid_id = dict(
+        result.searchCursor(
+            output_type=getattr(ClosestFacilityOutputDataType, "Facilities"),
+            field_names=["FacilityOID", "source_id"],
+        )
+    )
+    location_oid_id = dict(
+        result.searchCursor(
+            output_type=getattr(ClosestFacilityOutputDataType, "Incidents"),
+            field_names=["IncidentOID", "source_id"],
+        )
+    )
+    keys = ["FacilityOID", "IncidentOID", f"Total_{distance_units}", "SHAPE@"]
+    cursor = result.searchCursor(
+        output_type=ClosestFacilityOutputDataType.Routes, field_names=keys
+    )
+    with cursor:
+        for row in cursor:
+            route = dict(zip(keys, row))
+            yield {
+                "dataset_id": location_oid_id[route["IncidentOID"]],
+                "facility_id": facility_oid_id[route["FacilityOID"]],
+                "cost": route[f"Total_{distance_units}"],
+                "geometry": route["SHAPE@"],
+            }
+
+
+def _closest_facility_solve(
+    *,
+    network_path: Path,
+    travel_mode: str,
+    distance_units: str,
+    max_cost: Optional[Union[float, int]],
+    travel_from_facility: bool,
+    incident_field_description: List[Any],
+    incidents: Iterable[Sequence[Any]],
+    facility_field_description: List[Any],
+    facilities: Iterable[Sequence[Any]],
+) -> Iterator[Dict[str, Any]]:
+    """Generate closest facility routes from a single analysis solve.
+
+    Args:
+        network_path: Path to network dataset.
+        travel_mode: Name of the network travel mode to use.
+        distance_units: Name of distance units for analysis, e.g. "Feet".
+        max_cost: Maximum travel cost the search will allow.
+        travel_from_facility: Perform the analysis travelling from the facility if True.
+        incident_field_description: Field description for incident source ID.
+        incidents: Incidents, as (ID, geometry).
+        facility_field_description: Field description for facility source ID.
+        facilities: Facilities, as (ID, geometry).
+
+    Raises:
+        RuntimeError: When analysis fails.
+    """
+    analysis = _closest_facility_analysis(
+        network_path,
+        travel_mode=GetTravelModes(network_path)[travel_mode],
+        distance_units=distance_units,
+        travel_from_facility=travel_from_facility,
+    )
+    analysis.defaultImpedanceCutoff = max_cost
+    for input_type, field_description, features in [
+        (
+            ClosestFacilityInputDataType.Facilities,
+            facility_field_description,
+            facilities,
+        ),
+        (
+            ClosestFacilityInputDataType.Incidents,
+            incident_field_description,
+            incidents,
+        ),
+    ]:
+        analysis.addFields(input_type, [field_description])
+        cursor = analysis.insertCursor(input_type, field_names=["source_id", "SHAPE@"])
+        with cursor:
+            for feature in features:
+                cursor.insertRow(feature)
+    yield from _closest_facility_results(analysis, distance_units=distance_units)
+
+
+def _load_analysis_features(
+    analysis: Any,
+    input_type: Any,
+    *,
+    dataset_path: Path,
+    id_field_name: str,
+    dataset_where_sql: Optional[str] = None,
+) -> None:
+    """Load dataset features into analysis input, replacing any loaded before.
+
+    Analysis input must already have a `source_id` field.
+
+    Args:
+        analysis: Network analysis solver object.
+        input_type: Analysis input data type to load into.
+        dataset_path: Path to dataset.
+        id_field_name: Name of dataset ID field, mapped to `source_id`.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+    """
+    field_mappings = analysis.fieldMappings(input_type)
+    field_mappings["source_id"].mappedFieldName = (
+        Dataset(dataset_path).oid_field_name
+        if id_field_name.upper() == "OID@"
+        else id_field_name
+    )
+    view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
+    with view:
+        analysis.load(input_type, view.name, field_mappings, append=False)
+
+
+def _service_area_facilities_load(
+    layer_name: str,
+    *,
+    dataset_path: Path,
+    id_field_name: str,
+    dataset_where_sql: Optional[str],
+    max_distance: Union[float, int],
+) -> None:
+    """Load dataset features as facilities into service area layer.
+
+    Args:
+        layer_name: Name of service area analysis layer.
+        dataset_path: Path to dataset.
+        id_field_name: Name of dataset ID field.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+        max_distance: Search tolerance for locating facilities on network.
+    """
+    view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
+    with view:
+        AddLocations(
+            in_network_analysis_layer=layer_name,
+            sub_layer="Facilities",
+            in_table=view.name,
+            field_mappings=f"Name {id_field_name} #",
+            search_tolerance=max_distance,
+            match_type="MATCH_TO_CLOSEST",
+            append="CLEAR",
+            snap_to_position_along_network="NO_SNAP",
+            exclude_restricted_elements=True,
+        )
+
+
+def _service_area_partition_polygons(
+    partition_index: int,
+    *,
+    dataset_path: Path,
+    id_field_name: str,
+    dataset_where_sql: Optional[str],
+    network_path: Path,
+    max_distance: Union[float, int],
+    scratch_path: Path,
+    layer_kwargs: Dict[str, Any],
+) -> Tuple[int, Path, float]:
+    """Solve service area for a partition of facilities into a scratch geodatabase.
+
+    Each partition has its own layer name & scratch workspace, so that this can run in
+    a worker process alongside other partitions.
+
+    Args:
+        partition_index: Index of partition.
+        dataset_path: Path to facility dataset.
+        id_field_name: Name of dataset ID field.
+        dataset_where_sql: SQL where-clause for partition subselection.
+        network_path: Path to network dataset.
+        max_distance: Search tolerance for locating facilities on network.
+        scratch_path: Path to folder to create scratch geodatabase in.
+        layer_kwargs: Keyword arguments for `MakeServiceAreaLayer`, other than network
+            & layer name.
+
+    Returns:
+        Partition index, path to partition polygons, & seconds taken to solve.
+    """
+    start_time = perf_counter()
+    workspace_path = scratch_path / f"partition{partition_index}.gdb"
+    create_file_geodatabase(workspace_path, log_level=DEBUG)
+    layer_name = unique_name(f"ServiceArea{partition_index}_")
+    # ArcPy2.8.0: Convert Path to str.
+    MakeServiceAreaLayer(
+        in_network_dataset=str(network_path),
+        out_network_analysis_layer=layer_name,
+        **layer_kwargs,
+    )
+    _service_area_facilities_load(
+        layer_name,
+        dataset_path=dataset_path,
+        id_field_name=id_field_name,
+        dataset_where_sql=dataset_where_sql,
+        max_distance=max_distance,
+    )
+    Solve(
+        in_network_analysis_layer=layer_name,
+        ignore_invalids=True,
+        terminate_on_solve_error=True,
+    )
+    polygons_path = workspace_path / "polygons"
+    copy_dataset_features(
+        f"{layer_name}/Polygons", output_path=polygons_path, log_level=DEBUG
+    )
+    Delete(layer_name)
+    return partition_index, polygons_path, perf_counter() - start_time
+
+
+def _service_area_solve(
+    dataset_path: Path,
+    *,
+    id_field_name: str,
+    network_path: Path,
+    dataset_where_sql: Optional[str],
+    output_path: Path,
+    max_distance: Union[float, int],
+    session: Optional[NetworkSession],
+    partition_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    **layer_kwargs: Any,
+) -> None:
+    """Solve service area & write polygons to output dataset.
+
+    Args:
+        dataset_path: Path to facility dataset.
+        id_field_name: Name of dataset ID field.
+        network_path: Path to network dataset.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+        output_path: Path to output dataset.
+        max_distance: Search tolerance for locating facilities on network.
+        session: Network session to reuse layers & facility loads from. If set to None,
+            layer is created & deleted for this solve. Ignored if partitioned.
+        partition_size: Maximum number of facilities to solve together. If set to None,
+            all facilities will be solved together in-process.
+        max_workers: Maximum number of worker processes for solving partitions. If set
+            to None, will use the number of processors. Set to 1 to solve partitions
+            in-process.
+        **layer_kwargs: Keyword arguments for `MakeServiceAreaLayer`, other than
+            network & layer name.
+    """
+    if partition_size is not None:
+        _service_area_partitioned_solve(
+            dataset_path,
+            id_field_name=id_field_name,
+            network_path=network_path,
+            dataset_where_sql=dataset_where_sql,
+            output_path=output_path,
+            max_distance=max_distance,
+            partition_size=partition_size,
+            max_workers=max_workers,
+            layer_kwargs=layer_kwargs,
+        )
+    else:
+        if session is not None:
+            layer_name = session.service_area_layer(**layer_kwargs)
+            session.load_service_area_facilities(
+                layer_name,
+                dataset_path=dataset_path,
+                id_field_name=id_field_name,
+                dataset_where_sql=dataset_where_sql,
+                max_distance=max_distance,
+            )
+        else:
+            layer_name = "service_area"
+            # ArcPy2.8.0: Convert Path to str.
+            MakeServiceAreaLayer(
+                in_network_dataset=str(network_path),
+                out_network_analysis_layer=layer_name,
+                **layer_kwargs,
+            )
+            _service_area_facilities_load(
+                layer_name,
+                dataset_path=dataset_path,
+                id_field_name=id_field_name,
+                dataset_where_sql=dataset_where_sql,
+                max_distance=max_distance,
+            )
+        Solve(
+            in_network_analysis_layer=layer_name,
+            ignore_invalids=True,
+            terminate_on_solve_error=True,
+        )
+        copy_dataset_features(
+            f"{layer_name}/Polygons", output_path=output_path, log_level=DEBUG
+        )
+        if session is None:
+            Delete(layer_name)
+    id_field = Field(dataset_path, id_field_name)
+    add_field(output_path, log_level=DEBUG, **id_field.field_as_dict)
+    update_field_with_function(
+        output_path,
+        field_name=id_field.name,
+        function=FIELD_TYPE_EXTRACTOR_MAP[id_field.type.lower()],
+        field_as_first_arg=False,
+        arg_field_names=["Name"],
+        log_level=DEBUG,
+    )
+
+
+def _service_area_partitioned_solve(
+    dataset_path: Path,
+    *,
+    id_field_name: str,
+    network_path: Path,
+    dataset_where_sql: Optional[str],
+    output_path: Path,
+    max_distance: Union[float, int],
+    partition_size: int,
+    max_workers: Optional[int],
+    layer_kwargs: Dict[str, Any],
+) -> None:
+    """Solve service area in facility partitions & merge polygons to output dataset.
+
+    Facilities are partitioned into spatially clustered groups (by Morton code).
+
+    Args:
+        dataset_path: Path to facility dataset.
+        id_field_name: Name of dataset ID field.
+        network_path: Path to network dataset.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+        output_path: Path to output dataset.
+        max_distance: Search tolerance for locating facilities on network.
+        partition_size: Maximum number of facilities to solve together.
+        max_workers: Maximum number of worker processes for solving partitions. If set
+            to None, will use the number of processors. Set to 1 to solve partitions
+            in-process.
+        layer_kwargs: Keyword arguments for `MakeServiceAreaLayer`, other than network
+            & layer name.
+    """
+    if layer_kwargs.get("restriction_attribute_name") is not None:
+        layer_kwargs["restriction_attribute_name"] = list(
+            layer_kwargs["restriction_attribute_name"]
+        )
+    oid_xys = [
+        (oid, xy)
+        for oid, xy in features_as_tuples(
+            dataset_path,
+            field_names=["OID@", "SHAPE@XY"],
+            dataset_where_sql=dataset_where_sql,
+        )
+        if xy is not None
+    ]
+    if oid_xys:
+        extent = (
+            min(x for _, (x, _) in oid_xys),
+            min(y for _, (_, y) in oid_xys),
+            max(x for _, (x, _) in oid_xys),
+            max(y for _, (_, y) in oid_xys),
+        )
+        oid_xys.sort(key=lambda oid_xy: morton_code(*oid_xy[1], extent=extent))
+    partition_where_sqls = [
+        f"({dataset_where_sql}) AND ({where_sql})" if dataset_where_sql else where_sql
+        for where_sql in ids_where_sql(
+            [Dataset(dataset_path).oid_field_name],
+            [(oid,) for oid, _ in oid_xys],
+            chunk_size=partition_size,
+        )
+    ]
+    # No facilities: solve as a single (empty) partition, same as unpartitioned.
+    if not partition_where_sqls:
+        partition_where_sqls = [dataset_where_sql]
+    scratch_path = Path(mkdtemp(prefix="arcproc"))
+    partition_kwargs = [
+        {
+            "partition_index": partition_index,
+            "dataset_path": dataset_path,
+            "id_field_name": id_field_name,
+            "dataset_where_sql": where_sql,
+            "network_path": network_path,
+            "max_distance": max_distance,
+            "scratch_path": scratch_path,
+            "layer_kwargs": layer_kwargs,
+        }
+        for partition_index, where_sql in enumerate(partition_where_sqls)
+    ]
+    LOG.debug("Solving %s partitions of service areas.", len(partition_kwargs))
+    results = []
+    try:
+        if max_workers == 1:
+            results = [
+                _service_area_partition_polygons(**kwargs)
+                for kwargs in partition_kwargs
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = [
+                    future.result()
+                    for future in as_completed(
+                        executor.submit(_service_area_partition_polygons, **kwargs)
+                        for kwargs in partition_kwargs
+                    )
+                ]
+        results.sort(key=itemgetter(0))
+        for partition_index, _, seconds in results:
+            record_metric(
+                "service_area_partition",
+                dataset_path=dataset_path,
+                partition_index=partition_index,
+                seconds=seconds,
+            )
+        # ArcPy2.8.0: Convert Path to str.
+        Merge(
+            inputs=[str(polygons_path) for _, polygons_path, _ in results],
+            output=str(output_path),
+        )
+        FEATURE_COUNT_CACHE.invalidate(output_path)
+        METADATA_CACHE.invalidate(output_path)
+    finally:
+        for _, polygons_path, _ in results:
+            delete_workspace(polygons_path.parent, log_level=DEBUG)
+        rmtree(scratch_path, ignore_errors=True)
+
+
+def _source_id_field_description(dataset_path: Path, id_field_name: str) -> List[Any]:
+    """Return field description for analysis source ID field, matching ID field.
+
+    Args:
+        dataset_path: Path to dataset.
+        id_field_name: Name of dataset ID field.
+    """
+    field = Field(
+        dataset_path,
+        Dataset(dataset_path).oid_field_name
+        if id_field_name.upper() == "OID@"
+        else id_field_name,
+    )
+    return [
+        "source_id",
+        field.type if field.type != "OID" else "LONG",
+        "#",
+        field.length,
+        "#",
+        "#",
+    ]
+
+
 def closest_facility_routes(
     dataset_path: Union[Path, str],
     *,
@@ -86,9 +1527,17 @@ def closest_facility_routes(
     max_cost: Optional[Union[float, int]] = None,
     travel_from_facility: bool = False,
     travel_mode: str,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    session: Optional[NetworkSession] = None,
 ) -> Iterator[Dict[str, Any]]:
     """Generate routes for the closest facility to each location feature.
 
+    If `chunk_size` is set, locations are sorted into spatially clustered chunks (by
+    Morton code), & each chunk is solved against all facilities in a worker process.
+    Routes are generated as each chunk finishes, so order will vary between runs.
+    Chunk timings are recorded as "closest_facility_chunk" metrics.
+
     Args:
         dataset_path: Path to dataset.
         id_field_name: Name of dataset ID field.
@@ -103,6 +1552,13 @@ def closest_facility_routes(
             rather than toward the facility.
         travel_mode: Name of the network travel mode to use. Travel mode must exist in
             the network dataset.
+        chunk_size: Maximum number of locations to solve together. If set to None, all
+            locations will be solved together in-process.
+        max_workers: Maximum number of worker processes for solving chunks. If set to
+            None, will use the number of processors. Set to 1 to solve chunks
+            in-process. Ignored if chunk_size is None.
+        session: Network session to reuse network layer, solver & facility loads from.
+            Ignored if chunk_size is set (chunks solve in worker processes).
 
     Yields:
         Closest facility route details.
@@ -114,107 +1570,150 @@ def closest_facility_routes(
 
     Raises:
         RuntimeError: When analysis fails.
+        ValueError: If session is for a different network.
     """
     dataset_path = Path(dataset_path)
     facility_path = Path(facility_path)
     network_path = Path(network_path)
-    analysis = ClosestFacility(network_path)
-    analysis.defaultImpedanceCutoff = max_cost
-    distance_units = UNIT_PLURAL[SpatialReference(dataset_path).linear_unit]
-    analysis.distanceUnits = getattr(DistanceUnits, distance_units)
-    analysis.ignoreInvalidLocations = True
-    if travel_from_facility:
-        analysis.travelDirection = TravelDirection.FromFacility
-    # ArcPy2.8.0: Convert Path to str.
-    analysis.travelMode = GetTravelModes(network_path)[travel_mode]
-    # Load facilities.
-    field = Field(
-        facility_path,
-        Dataset(facility_path).oid_field_name
-        if facility_id_field_name.upper() == "OID@"
-        else facility_id_field_name,
-    )
-    field_description = [
-        "source_id",
-        field.type if field.type != "OID" else "LONG",
-        "#",
-        field.length,
-        "#",
-        "#",
+    if session is not None and session.network_path != network_path:
+        raise ValueError("Session is for a different network")
+
+    solve_kwargs = {
+        "network_path": network_path,
+        "travel_mode": travel_mode,
+        "distance_units": UNIT_PLURAL[SpatialReference(dataset_path).linear_unit],
+        "max_cost": max_cost,
+        "travel_from_facility": travel_from_facility,
+    }
+    if chunk_size is None and session is not None:
+        analysis = session.closest_facility_analysis(
+            facility_path=facility_path,
+            facility_id_field_name=facility_id_field_name,
+            facility_where_sql=facility_where_sql,
+            incident_field_description=_source_id_field_description(
+                dataset_path, id_field_name
+            ),
+            travel_mode=travel_mode,
+            distance_units=solve_kwargs["distance_units"],
+            travel_from_facility=travel_from_facility,
+        )
+        analysis.defaultImpedanceCutoff = max_cost
+        _load_analysis_features(
+            analysis,
+            ClosestFacilityInputDataType.Incidents,
+            dataset_path=dataset_path,
+            id_field_name=id_field_name,
+            dataset_where_sql=dataset_where_sql,
+        )
+        yield from _closest_facility_results(
+            analysis, distance_units=solve_kwargs["distance_units"]
+        )
+        return
+
+    if chunk_size is None:
+        yield from _closest_facility_solve(
+            incident_field_description=_source_id_field_description(
+                dataset_path, id_field_name
+            ),
+            incidents=features_as_tuples(
+                dataset_path,
+                field_names=[id_field_name, "SHAPE@"],
+                dataset_where_sql=dataset_where_sql,
+            ),
+            facility_field_description=_source_id_field_description(
+                facility_path, facility_id_field_name
+            ),
+            facilities=features_as_tuples(
+                facility_path,
+                field_names=[facility_id_field_name, "SHAPE@"],
+                dataset_where_sql=facility_where_sql,
+            ),
+            **solve_kwargs,
+        )
+        return
+
+    facilities = [
+        (facility_id, bytes(geometry.WKB))
+        for facility_id, geometry in features_as_tuples(
+            facility_path,
+            field_names=[facility_id_field_name, "SHAPE@"],
+            dataset_where_sql=facility_where_sql,
+        )
+        if geometry is not None
     ]
-    analysis.addFields(ClosestFacilityInputDataType.Facilities, [field_description])
-    cursor = analysis.insertCursor(
-        ClosestFacilityInputDataType.Facilities,
-        field_names=["source_id", "SHAPE@"],
-    )
-    _features = features_as_tuples(
-        facility_path,
-        field_names=[facility_id_field_name, "SHAPE@"],
-        dataset_where_sql=facility_where_sql,
-    )
-    with cursor:
-        for feature in _features:
-            cursor.insertRow(feature)
-    # Load dataset locations.
-    field = Field(
-        dataset_path,
-        Dataset(dataset_path).oid_field_name
-        if id_field_name.upper() == "OID@"
-        else id_field_name,
-    )
-    field_description = [
-        "source_id",
-        field.type if field.type != "OID" else "LONG",
-        "#",
-        field.length,
-        "#",
-        "#",
+    incidents = [
+        (location_id, geometry)
+        for location_id, geometry in features_as_tuples(
+            dataset_path,
+            field_names=[id_field_name, "SHAPE@"],
+            dataset_where_sql=dataset_where_sql,
+        )
+        if geometry is not None
     ]
-    analysis.addFields(ClosestFacilityInputDataType.Incidents, [field_description])
-    cursor = analysis.insertCursor(
-        ClosestFacilityInputDataType.Incidents,
-        field_names=["source_id", "SHAPE@"],
-    )
-    _features = features_as_tuples(
-        dataset_path,
-        field_names=[id_field_name, "SHAPE@"],
-        dataset_where_sql=dataset_where_sql,
-    )
-    with cursor:
-        for feature in _features:
-            cursor.insertRow(feature)
-    # Solve & generate.
-    result = analysis.solve()
-    if not result.solveSucceeded:
-        for message in result.solverMessages(MessageSeverity.All):
-            LOG.error(message)
-        raise RuntimeError("Closest facility analysis failed")
+    if not incidents:
+        return
 
-    facility_oid_id = dict(
-        result.searchCursor(
-            output_type=getattr(ClosestFacilityOutputDataType, "Facilities"),
-            field_names=["FacilityOID", "source_id"],
+    x_values = [geometry.centroid.X for _, geometry in incidents]
+    y_values = [geometry.centroid.Y for _, geometry in incidents]
+    extent = (min(x_values), min(y_values), max(x_values), max(y_values))
+    incidents.sort(
+        key=lambda incident: morton_code(
+            incident[1].centroid.X, incident[1].centroid.Y, extent=extent
         )
     )
-    location_oid_id = dict(
-        result.searchCursor(
-            output_type=getattr(ClosestFacilityOutputDataType, "Incidents"),
-            field_names=["IncidentOID", "source_id"],
-        )
-    )
-    keys = ["FacilityOID", "IncidentOID", f"Total_{distance_units}", "SHAPE@"]
-    cursor = result.searchCursor(
-        output_type=ClosestFacilityOutputDataType.Routes, field_names=keys
-    )
-    with cursor:
-        for row in cursor:
-            route = dict(zip(keys, row))
-            yield {
-                "dataset_id": location_oid_id[route["IncidentOID"]],
-                "facility_id": facility_oid_id[route["FacilityOID"]],
-                "cost": route[f"Total_{distance_units}"],
-                "geometry": route["SHAPE@"],
-            }
+    chunk_kwargs = [
+        {
+            "chunk_index": chunk_index,
+            "dataset_path": dataset_path,
+            "id_field_name": id_field_name,
+            "incidents": [
+                (location_id, bytes(geometry.WKB))
+                for location_id, geometry in incidents[i : i + chunk_size]
+            ],
+            "facility_path": facility_path,
+            "facility_id_field_name": facility_id_field_name,
+            "facilities": facilities,
+            **solve_kwargs,
+        }
+        for chunk_index, i in enumerate(range(0, len(incidents), chunk_size))
+    ]
+    del incidents
+    LOG.debug("Solving %s chunks of closest facility routes.", len(chunk_kwargs))
+    if max_workers == 1:
+        futures = []
+        results = (_closest_facility_chunk_routes(**kwargs) for kwargs in chunk_kwargs)
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        futures = [
+            executor.submit(_closest_facility_chunk_routes, **kwargs)
+            for kwargs in chunk_kwargs
+        ]
+        results = (future.result() for future in as_completed(futures))
+    try:
+        for chunk_index, routes, seconds, spatial_reference_string in results:
+            record_metric(
+                "closest_facility_chunk",
+                dataset_path=dataset_path,
+                chunk_index=chunk_index,
+                incident_count=len(chunk_kwargs[chunk_index]["incidents"]),
+                route_count=len(routes),
+                seconds=seconds,
+            )
+            LOG.debug("Solved chunk %s in %.3f sec.", chunk_index, seconds)
+            if spatial_reference_string:
+                spatial_reference = ArcSpatialReference()
+                spatial_reference.loadFromString(spatial_reference_string)
+            for route in routes:
+                if route["geometry"] is not None:
+                    route["geometry"] = FromWKB(route["geometry"], spatial_reference)
+                yield route
+
+    finally:
+        # Py3.7: Can replace with `shutdown(cancel_futures=True)` in Py3.9.
+        for future in futures:
+            future.cancel()
+        if max_workers != 1:
+            executor.shutdown()
 
 
 def create_service_areas(
@@ -231,6 +1730,9 @@ def create_service_areas(
     restriction_attributes: Optional[Iterable[str]] = None,
     travel_from_facility: bool = False,
     trim_value: Optional[Union[float, int]] = None,
+    partition_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    session: Optional[NetworkSession] = None,
     log_level: int = INFO,
 ) -> Dataset:
     """Create service area features.
@@ -252,14 +1754,32 @@ def create_service_areas(
             rather than toward the facility.
         trim_value: Disstance from network features to trim service areas at, in units
             of the dataset.
+        partition_size: Maximum number of facilities to solve together. If set, solves
+            spatially clustered facility partitions in worker processes & merges the
+            results. If set to None, all facilities will be solved together.
+        max_workers: Maximum number of worker processes for solving partitions. If set
+            to None, will use the number of processors. Set to 1 to solve partitions
+            in-process. Ignored if partition_size is None.
+        session: Network session to reuse network layers & facility loads from.
+            Ignored if partition_size is set.
         log_level: Level to log the function at.
 
     Returns:
         Dataset metadata instance for output dataset.
+
+    Raises:
+        ValueError: If session is for a different network.
+        ValueError: If partitioned & overlap_facilities is False.
     """
     dataset_path = Path(dataset_path)
     network_path = Path(network_path)
     output_path = Path(output_path)
+    if session is not None and session.network_path != network_path:
+        raise ValueError("Session is for a different network")
+
+    if partition_size is not None and not overlap_facilities:
+        raise ValueError("Cannot partition facilities if they cannot overlap")
+
     LOG.log(
         log_level,
         "Start: Create service areas for `%s` in `%s`.",
@@ -269,53 +1789,27 @@ def create_service_areas(
     # `trim_value` assumes meters if not input as linear unit string.
     if trim_value is not None:
         trim_value = f"{trim_value} {SpatialReference(dataset_path).linear_unit}"
-    # ArcPy2.8.0: Convert Path to str.
-    MakeServiceAreaLayer(
-        in_network_dataset=str(network_path),
-        out_network_analysis_layer="service_area",
-        impedance_attribute=cost_attribute,
-        travel_from_to="TRAVEL_FROM" if travel_from_facility else "TRAVEL_TO",
-        default_break_values=f"{max_distance}",
-        polygon_type="DETAILED_POLYS" if detailed_features else "SIMPLE_POLYS",
-        merge="NO_MERGE" if overlap_facilities else "NO_OVERLAP",
-        nesting_type="DISKS",
-        UTurn_policy="ALLOW_DEAD_ENDS_AND_INTERSECTIONS_ONLY",
-        restriction_attribute_name=restriction_attributes,
-        polygon_trim=trim_value is not None,
-        poly_trim_value=trim_value,
-        hierarchy="NO_HIERARCHY",
-    )
-    view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
-    with view:
-        AddLocations(
-            in_network_analysis_layer="service_area",
-            sub_layer="Facilities",
-            in_table=view.name,
-            field_mappings=f"Name {id_field_name} #",
-            search_tolerance=max_distance,
-            match_type="MATCH_TO_CLOSEST",
-            append="CLEAR",
-            snap_to_position_along_network="NO_SNAP",
-            exclude_restricted_elements=True,
-        )
-    Solve(
-        in_network_analysis_layer="service_area",
-        ignore_invalids=True,
-        terminate_on_solve_error=True,
-    )
-    copy_dataset_features(
-        "service_area/Polygons", output_path=output_path, log_level=DEBUG
-    )
-    Delete("service_area")
-    id_field = Field(dataset_path, id_field_name)
-    add_field(output_path, log_level=DEBUG, **id_field.field_as_dict)
-    update_field_with_function(
-        output_path,
-        field_name=id_field.name,
-        function=FIELD_TYPE_EXTRACTOR_MAP[id_field.type.lower()],
-        field_as_first_arg=False,
-        arg_field_names=["Name"],
-        log_level=DEBUG,
+    _service_area_solve(
+        dataset_path,
+        id_field_name=id_field_name,
+        network_path=network_path,
+        dataset_where_sql=dataset_where_sql,
+        output_path=output_path,
+        max_distance=max_distance,
+        session=session,
+        partition_size=partition_size,
+        max_workers=max_workers,
+        impedance_attribute=cost_attribute,
+        travel_from_to="TRAVEL_FROM" if travel_from_facility else "TRAVEL_TO",
+        default_break_values=f"{max_distance}",
+        polygon_type="DETAILED_POLYS" if detailed_features else "SIMPLE_POLYS",
+        merge="NO_MERGE" if overlap_facilities else "NO_OVERLAP",
+        nesting_type="DISKS",
+        UTurn_policy="ALLOW_DEAD_ENDS_AND_INTERSECTIONS_ONLY",
+        restriction_attribute_name=restriction_attributes,
+        polygon_trim=trim_value is not None,
+        poly_trim_value=trim_value,
+        hierarchy="NO_HIERARCHY",
     )
     LOG.log(log_level, "End: Generate.")
     return Dataset(output_path)
@@ -336,6 +1830,9 @@ def create_service_rings(
     ring_width: Union[float, int],
     travel_from_facility: bool = False,
     trim_value: Optional[Union[float, int]] = None,
+    partition_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    session: Optional[NetworkSession] = None,
     log_level: int = INFO,
 ) -> Dataset:
     """Create service ring features.
@@ -359,14 +1856,32 @@ def create_service_rings(
             rather than toward the facility.
         trim_value: Disstance from network features to trim service areas at, in units
             of the dataset.
+        partition_size: Maximum number of facilities to solve together. If set, solves
+            spatially clustered facility partitions in worker processes & merges the
+            results. If set to None, all facilities will be solved together.
+        max_workers: Maximum number of worker processes for solving partitions. If set
+            to None, will use the number of processors. Set to 1 to solve partitions
+            in-process. Ignored if partition_size is None.
+        session: Network session to reuse network layers & facility loads from.
+            Ignored if partition_size is set.
         log_level: Level to log the function at.
 
     Returns:
         Dataset metadata instance for output dataset.
+
+    Raises:
+        ValueError: If session is for a different network.
+        ValueError: If partitioned & overlap_facilities is False.
     """
     dataset_path = Path(dataset_path)
     network_path = Path(network_path)
     output_path = Path(output_path)
+    if session is not None and session.network_path != network_path:
+        raise ValueError("Session is for a different network")
+
+    if partition_size is not None and not overlap_facilities:
+        raise ValueError("Cannot partition facilities if they cannot overlap")
+
     LOG.log(
         log_level,
         "Start: Create service rings for `%s` in `%s`.",
@@ -376,10 +1891,16 @@ def create_service_rings(
     # `trim_value` assumes meters if not input as linear unit string.
     if trim_value is not None:
         trim_value = f"{trim_value} {SpatialReference(dataset_path).linear_unit}"
-    # ArcPy2.8.0: Convert Path to str.
-    MakeServiceAreaLayer(
-        in_network_dataset=str(network_path),
-        out_network_analysis_layer="service_area",
+    _service_area_solve(
+        dataset_path,
+        id_field_name=id_field_name,
+        network_path=network_path,
+        dataset_where_sql=dataset_where_sql,
+        output_path=output_path,
+        max_distance=max_distance,
+        session=session,
+        partition_size=partition_size,
+        max_workers=max_workers,
         impedance_attribute=cost_attribute,
         travel_from_to="TRAVEL_FROM" if travel_from_facility else "TRAVEL_TO",
         default_break_values=(
@@ -394,38 +1915,6 @@ def create_service_rings(
         poly_trim_value=trim_value,
         hierarchy="NO_HIERARCHY",
     )
-    view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
-    with view:
-        AddLocations(
-            in_network_analysis_layer="service_area",
-            sub_layer="Facilities",
-            in_table=view.name,
-            field_mappings=f"Name {id_field_name} #",
-            search_tolerance=max_distance,
-            match_type="MATCH_TO_CLOSEST",
-            append="CLEAR",
-            snap_to_position_along_network="NO_SNAP",
-            exclude_restricted_elements=True,
-        )
-    Solve(
-        in_network_analysis_layer="service_area",
-        ignore_invalids=True,
-        terminate_on_solve_error=True,
-    )
-    copy_dataset_features(
-        "service_area/Polygons", output_path=output_path, log_level=DEBUG
-    )
-    Delete("service_area")
-    id_field = Field(dataset_path, id_field_name)
-    add_field(output_path, log_level=DEBUG, **id_field.field_as_dict)
-    update_field_with_function(
-        output_path,
-        field_name=id_field.name,
-        function=FIELD_TYPE_EXTRACTOR_MAP[id_field.type.lower()],
-        field_as_first_arg=False,
-        arg_field_names=["Name"],
-        log_level=DEBUG,
-    )
     LOG.log(log_level, "End: Generate.")
     return Dataset(output_path)
 
@@ -433,54 +1922,176 @@ def create_service_rings(
 # Node functions.
 
 
-def _updated_coordinates_node_map(
-    coordinates_node: Mapping[tuple, Mapping],
+def _node_id_reassignments(
+    node_ids: Sequence[Any],
+    *,
+    feature_counts: Sequence[int],
+    coordinates: Sequence[Tuple[float]],
     node_id_data_type: Any,
     node_id_max_length: int,
-) -> Dict[Tuple[float], Dict[str, Any]]:
-    """Return updated mapping of coordinates pair to node info mapping.
+) -> Dict[int, Any]:
+    """Return mapping of node index to new node ID, for nodes needing a new ID.
+
+    Nodes without an ID get a new one. Where nodes share an ID, the node with the most
+    features keeps it (ties go to the lowest coordinates) & the others get new IDs.
 
     Args:
-        coordinates_node: Mapping of coordinates tuple to node information dictionary.
+        node_ids: Node ID for each node. None if node has no ID.
+        feature_counts: Number of features incident to each node.
+        coordinates: Coordinates for each node.
         node_id_data_type: Value type for node ID.
         node_id_max_length: Maximum length for node ID, if ID data type is string.
     """
+    used_node_ids = {node_id for node_id in node_ids if node_id is not None}
+    open_node_ids = (
+        node_id
+        for node_id in unique_ids(node_id_data_type, string_length=node_id_max_length)
+        if node_id not in used_node_ids
+    )
+    # Sorting puts nodes sharing an ID together, keeper first.
+    order = sorted(
+        (i for i, node_id in enumerate(node_ids) if node_id is not None),
+        key=lambda i: (node_ids[i], -feature_counts[i], coordinates[i]),
+    )
+    reassign = [i for i, node_id in enumerate(node_ids) if node_id is None]
+    reassign.extend(
+        i for previous_i, i in pairwise(order) if node_ids[i] == node_ids[previous_i]
+    )
+    reassign.sort(key=lambda i: coordinates[i])
+    return {i: next(open_node_ids) for i in reassign}
+
+
+def _node_id_field_type(
+    dataset_path: Path, from_id_field_name: str, to_id_field_name: str
+) -> Tuple[Any, Optional[int]]:
+    """Return value type & maximum length for node IDs.
+
+    Args:
+        dataset_path: Path to dataset.
+        from_id_field_name: Name of from-node ID field.
+        to_id_field_name: Name of to-node ID field.
+
+    Returns:
+        Value type for node ID, & maximum length if ID data type is string (None
+        otherwise).
+
+    Raises:
+        ValueError: If from- & to-node ID fields are not the same type.
+    """
+    node_id_data_type = None
+    node_id_max_length = None
+    for node_id_field_name in [from_id_field_name, to_id_field_name]:
+        field = Field(dataset_path, node_id_field_name)
+        if not node_id_data_type:
+            node_id_data_type = python_type_constructor(field.type)
+        elif python_type_constructor(field.type) != node_id_data_type:
+            raise ValueError("From- and to-node ID fields must be same type")
+
+        if node_id_data_type == str:
+            if not node_id_max_length or node_id_max_length > field.length:
+                node_id_max_length = field.length
+    return node_id_data_type, node_id_max_length
 
-    def _feature_count(node: Mapping) -> int:
-        """Return count of features associated with node."""
-        return len(node["feature_ids"]["from"].union(node["feature_ids"]["to"]))
 
-    used_node_ids = {
-        node["node_id"]
-        for node in coordinates_node.values()
-        if node["node_id"] is not None
-    }
+def _node_index_update(
+    node_index: Mapping[str, Dict],
+    changed_feature_coordinates: Mapping[Any, Tuple[Tuple[float]]],
+    *,
+    removed_ids: Iterable[Any],
+    node_id_data_type: Any,
+    node_id_max_length: int,
+) -> Set[Any]:
+    """Update persisted node index in-place for changed features.
+
+    Only nodes at the old or new endpoints of changed features are touched. Nodes left
+    with no features are dropped; new nodes get IDs not already in the index.
+
+    Args:
+        node_index: Node index, with `coordinates_node` (same format as
+            `coordinates_node_map`) & `feature_coordinates` (mapping of feature ID to
+            from- & to-coordinates).
+        changed_feature_coordinates: Mapping of changed feature ID to from- &
+            to-coordinates.
+        removed_ids: IDs of features no longer in dataset.
+        node_id_data_type: Value type for node ID.
+        node_id_max_length: Maximum length for node ID, if ID data type is string.
+
+    Returns:
+        IDs of features with an endpoint on an affected node, that are still in dataset.
+    """
+    coordinates_node = node_index["coordinates_node"]
+    feature_coordinates = node_index["feature_coordinates"]
+    affected_coordinates = set()
+    for feature_id in set(changed_feature_coordinates).union(removed_ids):
+        for end, coordinates in zip(
+            ["from", "to"], feature_coordinates.pop(feature_id, ())
+        ):
+            coordinates_node[coordinates]["feature_ids"][end].discard(feature_id)
+            affected_coordinates.add(coordinates)
+    for feature_id, end_coordinates in changed_feature_coordinates.items():
+        feature_coordinates[feature_id] = end_coordinates
+        for end, coordinates in zip(["from", "to"], end_coordinates):
+            if coordinates not in coordinates_node:
+                coordinates_node[coordinates] = {
+                    "node_id": None,
+                    "feature_ids": {"from": set(), "to": set()},
+                }
+            coordinates_node[coordinates]["feature_ids"][end].add(feature_id)
+            affected_coordinates.add(coordinates)
+    affected_ids = set()
+    for coordinates in affected_coordinates:
+        feature_ids = coordinates_node[coordinates]["feature_ids"]
+        if not feature_ids["from"] and not feature_ids["to"]:
+            del coordinates_node[coordinates]
+        else:
+            affected_ids.update(feature_ids["from"], feature_ids["to"])
+    used_node_ids = {node["node_id"] for node in coordinates_node.values()}
     open_node_ids = (
         node_id
         for node_id in unique_ids(node_id_data_type, string_length=node_id_max_length)
         if node_id not in used_node_ids
     )
-    coordinates_node = deepcopy(coordinates_node)
-    node_id_coordinates = {}
-    for coordinates, node in coordinates_node.items():
-        # Assign IDs where missing.
-        if node["node_id"] is None:
-            node["node_id"] = next(open_node_ids)
-        # If ID duplicate, re-ID node with least features.
-        elif node["node_id"] in node_id_coordinates:
-            other_coordinates = node_id_coordinates[node["node_id"]]
-            other_node = copy(coordinates_node[other_coordinates])
-            new_node_id = next(open_node_ids)
-            if _feature_count(node) > _feature_count(other_node):
-                other_node["node_id"] = new_node_id
-                coordinates_node[other_coordinates] = other_node
-                node_id_coordinates[new_node_id] = node_id_coordinates.pop(
-                    node["node_id"]
-                )
-            else:
-                node["node_id"] = new_node_id
-        node_id_coordinates[node["node_id"]] = coordinates
-    return coordinates_node
+    for coordinates in sorted(affected_coordinates.intersection(coordinates_node)):
+        if coordinates_node[coordinates]["node_id"] is None:
+            coordinates_node[coordinates]["node_id"] = next(open_node_ids)
+    return affected_ids
+
+
+def _updated_coordinates_node_map(
+    coordinates_node: Mapping[tuple, Mapping],
+    node_id_data_type: Any,
+    node_id_max_length: int,
+    *,
+    only_changed: bool = False,
+) -> Dict[Tuple[float], Dict[str, Any]]:
+    """Return updated mapping of coordinates pair to node info mapping.
+
+    Notes:
+        Copy-on-write: only nodes with a new ID are copied. Unchanged node mappings are
+            the same objects as in `coordinates_node`.
+
+    Args:
+        coordinates_node: Mapping of coordinates tuple to node information dictionary.
+        node_id_data_type: Value type for node ID.
+        node_id_max_length: Maximum length for node ID, if ID data type is string.
+        only_changed: Return only nodes with a new ID if True.
+    """
+    coordinates = list(coordinates_node)
+    nodes = list(coordinates_node.values())
+    reassignments = _node_id_reassignments(
+        [node["node_id"] for node in nodes],
+        feature_counts=[
+            len(node["feature_ids"]["from"].union(node["feature_ids"]["to"]))
+            for node in nodes
+        ],
+        coordinates=coordinates,
+        node_id_data_type=node_id_data_type,
+        node_id_max_length=node_id_max_length,
+    )
+    updated_coordinates_node = {} if only_changed else dict(coordinates_node)
+    for i, node_id in reassignments.items():
+        updated_coordinates_node[coordinates[i]] = dict(nodes[i], node_id=node_id)
+    return updated_coordinates_node
 
 
 def coordinates_node_map(
@@ -492,6 +2103,7 @@ def coordinates_node_map(
     dataset_where_sql: Optional[str] = None,
     update_nodes: bool = False,
     spatial_reference_item: SpatialReferenceSourceItem = None,
+    tolerance: Optional[float] = None,
 ) -> Dict[Tuple[float], Dict[str, Any]]:
     """Return mapping of coordinates to node info mapping for dataset.
 
@@ -510,24 +2122,34 @@ def coordinates_node_map(
         spatial_reference_item: Item from which the spatial reference for any geometry
             properties will be set to. If set to None, will use spatial reference of
             the dataset.
+        tolerance: Snap tolerance for merging endpoints into nodes, in dataset units.
+            If set to None, only endpoints with identical coordinates merge, & the map
+            is built without an intermediate node graph.
 
     Raises:
         ValueError: If from- & to-node ID fields are not the same type.
     """
     dataset_path = Path(dataset_path)
     id_field_names = list(id_field_names)
-    node_id_data_type = None
-    node_id_max_length = None
-    for node_id_field_name in [from_id_field_name, to_id_field_name]:
-        field = Field(dataset_path, node_id_field_name)
-        if not node_id_data_type:
-            node_id_data_type = python_type_constructor(field.type)
-        elif python_type_constructor(field.type) != node_id_data_type:
-            raise ValueError("From- and to-node ID fields must be same type")
+    node_id_data_type, node_id_max_length = _node_id_field_type(
+        dataset_path, from_id_field_name, to_id_field_name
+    )
+    if tolerance is not None:
+        coordinate_node = NodeGraph.from_dataset(
+            dataset_path,
+            from_id_field_name=from_id_field_name,
+            to_id_field_name=to_id_field_name,
+            id_field_names=id_field_names,
+            dataset_where_sql=dataset_where_sql,
+            tolerance=tolerance,
+            spatial_reference_item=spatial_reference_item,
+        ).as_coordinates_node_map()
+        if update_nodes:
+            coordinate_node = _updated_coordinates_node_map(
+                coordinate_node, node_id_data_type, node_id_max_length
+            )
+        return coordinate_node
 
-        if node_id_data_type == str:
-            if not node_id_max_length or node_id_max_length > field.length:
-                node_id_max_length = field.length
     coordinate_node = {}
     for feature in features_as_dicts(
         dataset_path,
@@ -626,27 +2248,299 @@ def id_node_map(
     return id_node
 
 
+def native_closest_facility_routes(
+    dataset_path: Union[Path, str],
+    *,
+    id_field_name: str,
+    facility_path: Union[Path, str],
+    facility_id_field_name: str,
+    network_path: Union[Path, str],
+    cost_field_name: Optional[str] = None,
+    reverse_cost_field_name: Optional[str] = None,
+    dataset_where_sql: Optional[str] = None,
+    facility_where_sql: Optional[str] = None,
+    network_where_sql: Optional[str] = None,
+    max_cost: Optional[Union[float, int]] = None,
+    travel_from_facility: bool = False,
+    facility_count: int = 1,
+    include_geometry: bool = False,
+    tolerance: float = 0.0,
+    routing_graph: Optional[RoutingGraph] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Generate routes for the closest facilities to each location feature.
+
+    Routes are solved in-process over a line dataset, without Network Analyst.
+
+    Notes:
+        Locations & facilities are snapped to the nearest network node (line
+            endpoint), not to the nearest point along a line.
+
+    Args:
+        dataset_path: Path to dataset.
+        id_field_name: Name of dataset ID field.
+        facility_path: Path to facility dataset.
+        facility_id_field_name: Name of facility dataset ID field.
+        network_path: Path to network line dataset.
+        cost_field_name: Name of network field with cost to traverse line in digitized
+            direction. If set to None, cost will be line length.
+        reverse_cost_field_name: Name of network field with cost to traverse line
+            against digitized direction. If set to None, will use same cost as
+            digitized direction.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+        facility_where_sql: SQL where-clause for the facility dataset subselection.
+        network_where_sql: SQL where-clause for the network dataset subselection.
+        max_cost: Maximum travel cost the search will allow, in the units of the cost.
+        travel_from_facility: Perform the analysis travelling from the facility if True,
+            rather than toward the facility.
+        facility_count: Number of closest facilities to route to for each location.
+        include_geometry: Include route geometry if True.
+        tolerance: Snap tolerance for merging line endpoints into nodes.
+        routing_graph: Prebuilt routing graph for network. If set to None, will build
+            from network dataset.
+
+    Yields:
+        Closest facility route details.
+        Keys:
+            * dataset_id
+            * facility_id
+            * cost - Cost of route, in units of cost field (or length).
+            * geometry - Route geometry, in spatial reference of network. None if not
+                included or route has no length.
+    """
+    dataset_path = Path(dataset_path)
+    facility_path = Path(facility_path)
+    network_path = Path(network_path)
+    if routing_graph is None:
+        routing_graph = RoutingGraph.from_dataset(
+            network_path,
+            cost_field_name=cost_field_name,
+            reverse_cost_field_name=reverse_cost_field_name,
+            dataset_where_sql=network_where_sql,
+            tolerance=tolerance,
+        )
+    facility_label_nodes = [
+        (facility_id, routing_graph.nearest_node(*xy))
+        for facility_id, xy in features_as_tuples(
+            facility_path,
+            field_names=[facility_id_field_name, "SHAPE@XY"],
+            dataset_where_sql=facility_where_sql,
+            spatial_reference_item=network_path,
+        )
+        if xy is not None
+    ]
+    location_nodes = [
+        (location_id, routing_graph.nearest_node(*xy))
+        for location_id, xy in features_as_tuples(
+            dataset_path,
+            field_names=[id_field_name, "SHAPE@XY"],
+            dataset_where_sql=dataset_where_sql,
+            spatial_reference_item=network_path,
+        )
+        if xy is not None
+    ]
+    # Searching from facilities settles every location in one pass. Travelling toward
+    # facilities means searching against edge direction.
+    reverse = not travel_from_facility
+    node_costs, predecessors = routing_graph.search(
+        facility_label_nodes,
+        max_cost=max_cost,
+        source_count=facility_count,
+        reverse=reverse,
+        stop_node_indices={node_index for _, node_index in location_nodes},
+    )
+    routes = []
+    for location_id, node_index in location_nodes:
+        for cost, facility_id in node_costs.get(node_index, []):
+            route = {
+                "dataset_id": location_id,
+                "facility_id": facility_id,
+                "cost": cost,
+            }
+            if include_geometry:
+                route["edges"] = routing_graph.route_edges(
+                    predecessors,
+                    node_index=node_index,
+                    source_label=facility_id,
+                    reverse=reverse,
+                )
+            routes.append(route)
+    if include_geometry:
+        route_feature_indices = {
+            int(routing_graph.edge_features[edge])
+            for route in routes
+            for edge in route["edges"]
+        }
+        feature_id_index = {
+            feature_id: i
+            for i, feature_id in enumerate(routing_graph.node_graph.feature_ids)
+            if i in route_feature_indices
+        }
+        id_field_names = routing_graph.node_graph.id_field_names
+        feature_geometries = {
+            feature_id_index[tuple(feature[:-1])]: feature[-1]
+            for feature in features_as_tuples(
+                network_path,
+                field_names=id_field_names + ["SHAPE@"],
+                dataset_where_sql=network_where_sql,
+            )
+            if tuple(feature[:-1]) in feature_id_index
+        }
+        spatial_reference = SpatialReference(network_path).object
+    for route in routes:
+        if include_geometry:
+            route["geometry"] = routing_graph.route_geometry(
+                route.pop("edges"),
+                feature_geometries=feature_geometries,
+                spatial_reference=spatial_reference,
+            )
+        else:
+            route["geometry"] = None
+        yield route
+
+
+def od_cost_matrix(
+    dataset_path: Union[Path, str],
+    *,
+    id_field_name: str,
+    facility_path: Union[Path, str],
+    facility_id_field_name: str,
+    network_path: Union[Path, str],
+    cost_field_name: Optional[str] = None,
+    reverse_cost_field_name: Optional[str] = None,
+    dataset_where_sql: Optional[str] = None,
+    facility_where_sql: Optional[str] = None,
+    network_where_sql: Optional[str] = None,
+    max_cost: Optional[Union[float, int]] = None,
+    tolerance: float = 0.0,
+    routing_graph: Optional[RoutingGraph] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Generate origin-destination travel costs from each location to each facility.
+
+    Costs are solved in-process over a line dataset, without Network Analyst.
+
+    Notes:
+        Locations & facilities are snapped to the nearest network node (line
+            endpoint), not to the nearest point along a line.
+
+    Args:
+        dataset_path: Path to dataset.
+        id_field_name: Name of dataset ID field.
+        facility_path: Path to facility dataset.
+        facility_id_field_name: Name of facility dataset ID field.
+        network_path: Path to network line dataset.
+        cost_field_name: Name of network field with cost to traverse line in digitized
+            direction. If set to None, cost will be line length.
+        reverse_cost_field_name: Name of network field with cost to traverse line
+            against digitized direction. If set to None, will use same cost as
+            digitized direction.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+        facility_where_sql: SQL where-clause for the facility dataset subselection.
+        network_where_sql: SQL where-clause for the network dataset subselection.
+        max_cost: Maximum travel cost the search will allow, in the units of the cost.
+            Pairs beyond the maximum are not generated.
+        tolerance: Snap tolerance for merging line endpoints into nodes.
+        routing_graph: Prebuilt routing graph for network. If set to None, will build
+            from network dataset.
+
+    Yields:
+        Origin-destination cost details.
+        Keys:
+            * dataset_id
+            * facility_id
+            * cost - Cost of travel, in units of cost field (or length).
+    """
+    dataset_path = Path(dataset_path)
+    facility_path = Path(facility_path)
+    network_path = Path(network_path)
+    if routing_graph is None:
+        routing_graph = RoutingGraph.from_dataset(
+            network_path,
+            cost_field_name=cost_field_name,
+            reverse_cost_field_name=reverse_cost_field_name,
+            dataset_where_sql=network_where_sql,
+            tolerance=tolerance,
+        )
+    node_facility_ids = defaultdict(list)
+    for facility_id, xy in features_as_tuples(
+        facility_path,
+        field_names=[facility_id_field_name, "SHAPE@XY"],
+        dataset_where_sql=facility_where_sql,
+        spatial_reference_item=network_path,
+    ):
+        if xy is not None:
+            node_facility_ids[routing_graph.nearest_node(*xy)].append(facility_id)
+    if not node_facility_ids:
+        return
+
+    for location_id, xy in features_as_tuples(
+        dataset_path,
+        field_names=[id_field_name, "SHAPE@XY"],
+        dataset_where_sql=dataset_where_sql,
+        spatial_reference_item=network_path,
+    ):
+        if xy is None:
+            continue
+
+        node_costs, _ = routing_graph.search(
+            [(location_id, routing_graph.nearest_node(*xy))],
+            max_cost=max_cost,
+            stop_node_indices=set(node_facility_ids),
+        )
+        for node_index, facility_ids in node_facility_ids.items():
+            if node_index not in node_costs:
+                continue
+
+            cost = node_costs[node_index][0][0]
+            for facility_id in facility_ids:
+                yield {
+                    "dataset_id": location_id,
+                    "facility_id": facility_id,
+                    "cost": cost,
+                }
+
+
 def update_fields_with_node_ids(
     dataset_path: Union[Path, str],
     *,
     from_id_field_name: str,
     to_id_field_name: str,
     dataset_where_sql: Optional[str] = None,
+    changed_ids: Optional[Iterable[int]] = None,
+    changed_where_sql: Optional[str] = None,
+    node_index_path: Optional[Union[Path, str]] = None,
     use_edit_session: bool = False,
     log_level: int = INFO,
 ) -> Counter:
     """Update field attribute values with node IDs based on network connectivity.
 
+    Notes:
+        If changed features are given along with a current node index, only nodes at
+            the old & new endpoints of those features are reassigned, & only features
+            touching those nodes are updated. Otherwise all nodes are rebuilt.
+        A changed where-clause cannot find deleted features; include deleted feature
+            IDs in `changed_ids`.
+        The node index must only be updated by this function; edits not passed as
+            changed features will not be reflected until a full rebuild.
+
     Args:
         dataset_path: Path to the dataset.
         from_id_field_name: Name of from-node ID field.
         to_id_field_name: Name of to-node ID field.
         dataset_where_sql: SQL where-clause for dataset subselection.
+        changed_ids: Object IDs of features added, altered, or deleted since the node
+            index was saved.
+        changed_where_sql: SQL where-clause subselecting features added or altered
+            since the node index was saved (e.g. on an edit date field).
+        node_index_path: Path to persisted node index. Index is created if it does
+            not exist, & updated after each run.
         use_edit_session: True if edits are to be made in an edit session.
         log_level: Level to log the function at.
 
     Returns:
         Feature counts for each update-state.
+
+    Raises:
+        ValueError: If changed features are given without a node index path.
     """
     dataset_path = Path(dataset_path)
     LOG.log(
@@ -656,35 +2550,145 @@ def update_fields_with_node_ids(
         to_id_field_name,
         dataset_path,
     )
-    cursor = UpdateCursor(
-        # ArcPy2.8.0: Convert to str.
-        in_table=str(dataset_path),
-        field_names=["OID@", from_id_field_name, to_id_field_name],
-        where_clause=dataset_where_sql,
-    )
-    oid_node = id_node_map(
-        dataset_path,
-        from_id_field_name=from_id_field_name,
-        to_id_field_name=to_id_field_name,
-        update_nodes=True,
-    )
+    incremental = changed_ids is not None or changed_where_sql is not None
+    if incremental and not node_index_path:
+        raise ValueError("Must provide node_index_path for changed features")
+
+    node_index_path = Path(node_index_path) if node_index_path else None
+    node_index_key = (str(dataset_path), from_id_field_name, to_id_field_name)
+    node_index = None
+    if incremental and node_index_path.is_file():
+        with node_index_path.open(mode="rb") as indexfile:
+            node_index = pickle.load(indexfile)
+        if node_index["key"] != node_index_key:
+            node_index = None
+    if node_index is None:
+        if incremental:
+            LOG.log(log_level, "No current node index: rebuilding all nodes.")
+        coordinates_node = coordinates_node_map(
+            dataset_path,
+            from_id_field_name=from_id_field_name,
+            to_id_field_name=to_id_field_name,
+            id_field_names=["OID@"],
+            update_nodes=True,
+        )
+        node_index = {
+            "key": node_index_key,
+            "coordinates_node": {
+                coordinates: {
+                    "node_id": node["node_id"],
+                    "feature_ids": {
+                        end: {feature_id[0] for feature_id in node["feature_ids"][end]}
+                        for end in ["from", "to"]
+                    },
+                }
+                for coordinates, node in coordinates_node.items()
+            },
+            "feature_coordinates": {},
+        }
+        for coordinates, node in node_index["coordinates_node"].items():
+            for end, i in [("from", 0), ("to", 1)]:
+                for oid in node["feature_ids"][end]:
+                    if oid not in node_index["feature_coordinates"]:
+                        node_index["feature_coordinates"][oid] = [None, None]
+                    node_index["feature_coordinates"][oid][i] = coordinates
+        node_index["feature_coordinates"] = {
+            oid: tuple(end_coordinates)
+            for oid, end_coordinates in node_index["feature_coordinates"].items()
+        }
+        where_sqls = [dataset_where_sql]
+    else:
+        # Where-clauses need the real field name: `OID@` is only a cursor token.
+        oid_field_name = Dataset(dataset_path).oid_field_name
+        changed_where_sqls = (
+            [changed_where_sql]
+            if changed_where_sql is not None
+            else list(ids_where_sql([oid_field_name], ((oid,) for oid in changed_ids)))
+        )
+        changed_feature_coordinates = {}
+        # Features without geometry have no endpoints: drop them from the nodes.
+        null_geometry_ids = set()
+        for where_sql in changed_where_sqls:
+            for oid, geometry in features_as_tuples(
+                dataset_path,
+                field_names=["OID@", "SHAPE@"],
+                dataset_where_sql=where_sql,
+            ):
+                if geometry is None or geometry.firstPoint is None:
+                    null_geometry_ids.add(oid)
+                    continue
+
+                changed_feature_coordinates[oid] = (
+                    (geometry.firstPoint.X, geometry.firstPoint.Y),
+                    (geometry.lastPoint.X, geometry.lastPoint.Y),
+                )
+        node_id_data_type, node_id_max_length = _node_id_field_type(
+            dataset_path, from_id_field_name, to_id_field_name
+        )
+        affected_ids = _node_index_update(
+            node_index,
+            changed_feature_coordinates,
+            removed_ids=set(changed_ids or [])
+            .union(null_geometry_ids)
+            .difference(changed_feature_coordinates),
+            node_id_data_type=node_id_data_type,
+            node_id_max_length=node_id_max_length,
+        )
+        # Node IDs on features that lost their geometry need clearing.
+        affected_ids.update(null_geometry_ids)
+        LOG.log(log_level, "%s features touch changed nodes.", len(affected_ids))
+        where_sqls = [
+            f"({dataset_where_sql}) AND ({where_sql})"
+            if dataset_where_sql
+            else where_sql
+            for where_sql in ids_where_sql(
+                [oid_field_name], ((oid,) for oid in affected_ids)
+            )
+        ]
+    coordinates_node = node_index["coordinates_node"]
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
-    with session, cursor:
-        for old_feature in cursor:
-            oid = old_feature[0]
-            new_feature = (oid, oid_node[oid]["from"], oid_node[oid]["to"])
-            if same_feature(old_feature, new_feature):
-                states["unchanged"] += 1
-            else:
-                try:
-                    cursor.updateRow(new_feature)
-                    states["altered"] += 1
-                except RuntimeError as error:
-                    raise RuntimeError(
-                        f"Row failed to update. Offending row: `{new_feature}`"
-                    ) from error
+    with session:
+        for where_sql in where_sqls:
+            cursor = profile_cursor(
+                UpdateCursor(
+                    # ArcPy2.8.0: Convert to str.
+                    in_table=str(dataset_path),
+                    field_names=["OID@", from_id_field_name, to_id_field_name],
+                    where_clause=where_sql,
+                ),
+                dataset_path=dataset_path,
+                where_sql=where_sql,
+            )
+            with cursor:
+                for old_feature in cursor:
+                    oid = old_feature[0]
+                    if oid in node_index["feature_coordinates"]:
+                        from_coordinates, to_coordinates = node_index[
+                            "feature_coordinates"
+                        ][oid]
+                        new_feature = (
+                            oid,
+                            coordinates_node[from_coordinates]["node_id"],
+                            coordinates_node[to_coordinates]["node_id"],
+                        )
+                    # Features without geometry are not on any node.
+                    else:
+                        new_feature = (oid, None, None)
+                    if same_feature(old_feature, new_feature):
+                        states["unchanged"] += 1
+                    else:
+                        try:
+                            cursor.updateRow(new_feature)
+                            states["altered"] += 1
+                        except RuntimeError as error:
+                            raise RuntimeError(
+                                f"Row failed to update. Offending row: `{new_feature}`"
+                            ) from error
 
+    if node_index_path:
+        with node_index_path.open(mode="wb") as indexfile:
+            pickle.dump(node_index, indexfile, protocol=pickle.HIGHEST_PROTOCOL)
     log_entity_states("attributes", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Update.")
     return states
@@ -0,0 +1,415 @@
+"""Profiling & metrics objects."""
+from collections import Counter, deque
+from dataclasses import dataclass, field, fields
+from datetime import datetime as _datetime
+from logging import DEBUG, Logger, getLogger
+from os import environ
+from pathlib import Path
+from time import perf_counter
+from types import TracebackType
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+
+__all__ = []
+
+LOG: Logger = getLogger(__name__)
+"""Module-level logger."""
+
+FIELD_ACCESS_TYPES: List[str] = ["key", "spatial", "where"]
+"""Types of field access recorded in the field-access log.
+
+"key": fields used as IDs or join keys. "spatial": geometry used in a spatial
+relationship. "where": fields referenced in a subselection where-clause.
+"""
+RECORD_FIELD_ACCESS_ENVIRONMENT_VARIABLE: str = "ARCPROC_RECORD_FIELD_ACCESS"
+"""Name of environment variable that switches field-access recording on.
+
+Recording is on when the variable is set to a truthy value ("1", "true", "yes", "on").
+"""
+PROFILE_CURSORS_ENVIRONMENT_VARIABLE: str = "ARCPROC_PROFILE_CURSORS"
+"""Name of environment variable that switches cursor profiling on.
+
+Profiling is on when the variable is set to a truthy value ("1", "true", "yes", "on").
+"""
+PROFILE_SAMPLE_INTERVAL_ENVIRONMENT_VARIABLE: str = "ARCPROC_PROFILE_SAMPLE_INTERVAL"
+"""Name of environment variable for the row-latency sample interval.
+
+A value of N samples the latency of every Nth row. Default is every row.
+"""
+LATENCY_BUCKET_BOUNDS: List[float] = [
+    0.000_001,
+    0.000_01,
+    0.000_1,
+    0.001,
+    0.01,
+    0.1,
+    1.0,
+]
+"""Upper bounds (in seconds) for row-latency histogram buckets.
+
+Latencies greater than the last bound go into an overflow bucket.
+"""
+METRICS_MAX_LENGTH: int = 10_000
+"""Maximum number of metrics held in the registry.
+
+Once the registry is full, recording a metric drops the oldest one.
+"""
+METRICS: Deque["Metric"] = deque(maxlen=METRICS_MAX_LENGTH)
+"""Process-wide registry of recorded metrics, oldest first."""
+
+# Py3.7: Can replace usage with `typing.Self` in Py3.11.
+TProfiledCursor = TypeVar("TProfiledCursor", bound="ProfiledCursor")
+"""Type variable to enable method return of self on ProfiledCursor."""
+
+
+@dataclass
+class Metric:
+    """Representation of a recorded metric."""
+
+    name: str
+    """Name of the metric."""
+    values: Dict[str, Any] = field(default_factory=dict)
+    """Mapping of value name to value."""
+    time_recorded: _datetime = field(default_factory=_datetime.now)
+    """Timestamp for when metric was recorded."""
+
+    @property
+    def as_dict(self) -> dict:
+        """Metric as dictionary."""
+        return dict((field.name, getattr(self, field.name)) for field in fields(self))
+
+
+@dataclass
+class CursorProfile:
+    """Representation of cursor profiling information."""
+
+    dataset_path: Union[Path, str]
+    """Path to dataset the cursor is opened on."""
+    cursor_type: str
+    """Type name of the cursor, e.g. "UpdateCursor"."""
+    sample_interval: int = 1
+    """Interval of rows sampled for the latency histogram."""
+
+    call_counts: Counter = field(default_factory=Counter)
+    """Counts of row-write method calls, e.g. `updateRow`."""
+    fetch_seconds: float = 0.0
+    """Time spent fetching rows from the cursor."""
+    fetch_latency_histogram: Counter = field(default_factory=Counter)
+    """Counts of sampled row-fetch latencies, keyed by bucket label."""
+    process_seconds: float = 0.0
+    """Time spent in Python between row fetches, not counting row writes."""
+    row_count: int = 0
+    """Number of rows fetched from the cursor."""
+    write_seconds: float = 0.0
+    """Time spent in row-write methods."""
+
+    @property
+    def as_dict(self) -> dict:
+        """Profile as dictionary."""
+        return dict((field.name, getattr(self, field.name)) for field in fields(self))
+
+    @property
+    def total_seconds(self) -> float:
+        """Total time accounted for by the profile."""
+        return self.fetch_seconds + self.process_seconds + self.write_seconds
+
+    def add_fetch_latency(self, seconds: float) -> None:
+        """Add fetch latency for a single row to the histogram.
+
+        Args:
+            seconds: Latency of row fetch, in seconds.
+        """
+        for bound in LATENCY_BUCKET_BOUNDS:
+            if seconds <= bound:
+                self.fetch_latency_histogram[f"<={bound:g}s"] += 1
+                break
+
+        else:
+            self.fetch_latency_histogram[f">{LATENCY_BUCKET_BOUNDS[-1]:g}s"] += 1
+
+    def log(self, logger: Optional[Logger] = None, log_level: int = DEBUG) -> None:
+        """Log the profile.
+
+        Args:
+            logger: Logger to emit profile loglines. If not specified, will use module-
+                level logger.
+            log_level: Level to log the profile at.
+        """
+        if not logger:
+            logger = LOG
+        logger.log(
+            log_level,
+            "%s on `%s`: %s rows; %.3f sec fetch, %.3f sec process, %.3f sec write.",
+            self.cursor_type,
+            self.dataset_path,
+            self.row_count,
+            self.fetch_seconds,
+            self.process_seconds,
+            self.write_seconds,
+        )
+        for name, count in sorted(self.call_counts.items()):
+            logger.log(log_level, "%s calls: %s.", name, count)
+        for bucket, count in sorted(self.fetch_latency_histogram.items()):
+            logger.log(log_level, "Fetch latency %s: %s rows.", bucket, count)
+
+
+class FieldAccessLog:
+    """Log of field-access patterns per dataset, e.g. for index advice.
+
+    Recording is off unless switched on by environment variable or by `start`; while
+    off, `record` returns immediately. Bare names (views & layers) are not recorded.
+    """
+
+    counts: Counter
+    """Counts of field accesses, keyed by (dataset path, access type, detail). Detail
+    is a tuple of field names for "key" access, the where-clause for "where" access, &
+    None for "spatial" access.
+    """
+
+    def __init__(self) -> None:
+        """Initialize instance."""
+        self.counts = Counter()
+        self._recorders = 0
+
+    @property
+    def is_recording(self) -> bool:
+        """True if field accesses are being recorded, False otherwise."""
+        if self._recorders > 0:
+            return True
+
+        value = environ.get(RECORD_FIELD_ACCESS_ENVIRONMENT_VARIABLE, "")
+        return value.strip().lower() in ["1", "true", "yes", "on"]
+
+    def clear(self) -> None:
+        """Clear all recorded field accesses."""
+        self.counts.clear()
+
+    def record(
+        self,
+        dataset_path: Union[Path, str],
+        access_type: str,
+        detail: Union[Iterable[str], str, None] = None,
+    ) -> None:
+        """Record field access on dataset, if recording.
+
+        Args:
+            dataset_path: Path to dataset.
+            access_type: Type of field access. See `FIELD_ACCESS_TYPES`.
+            detail: Field names for "key" access, where-clause for "where" access.
+                Ignored for "spatial" access.
+
+        Raises:
+            ValueError: If access type not valid.
+        """
+        if access_type not in FIELD_ACCESS_TYPES:
+            raise ValueError(f"`{access_type}` not a valid field access type")
+
+        if not self.is_recording or len(Path(dataset_path).parts) < 2:
+            return
+
+        if access_type == "key":
+            detail = tuple(detail)
+        elif access_type == "spatial":
+            detail = None
+        elif not detail:
+            return
+
+        self.counts[(Path(dataset_path), access_type, detail)] += 1
+
+    def start(self) -> None:
+        """Start recording field accesses. Each start needs a matching stop."""
+        self._recorders += 1
+
+    def stop(self) -> None:
+        """Stop recording field accesses, if no other start remains."""
+        self._recorders = max(self._recorders - 1, 0)
+
+
+FIELD_ACCESS_LOG: FieldAccessLog = FieldAccessLog()
+"""Process-wide log of field-access patterns."""
+
+
+class ProfiledCursor:
+    """Profiling wrapper for an ArcPy data access cursor.
+
+    Attributes not defined here are passed through to the wrapped cursor.
+    """
+
+    cursor: Any
+    """Wrapped ArcPy cursor."""
+    profile: CursorProfile
+    """Profile for the cursor."""
+
+    def __init__(
+        self,
+        cursor: Any,
+        *,
+        dataset_path: Union[Path, str],
+        sample_interval: Optional[int] = None,
+    ) -> None:
+        """Initialize instance.
+
+        Args:
+            cursor: ArcPy cursor to wrap.
+            dataset_path: Path to dataset the cursor is opened on.
+            sample_interval: Interval of rows to sample for the latency histogram. If
+                set to None, will use the environment variable value (default 1).
+        """
+        if sample_interval is None:
+            sample_interval = int(
+                environ.get(PROFILE_SAMPLE_INTERVAL_ENVIRONMENT_VARIABLE, 1)
+            )
+        self.cursor = cursor
+        self.profile = CursorProfile(
+            dataset_path=dataset_path,
+            cursor_type=type(cursor).__name__,
+            sample_interval=max(sample_interval, 1),
+        )
+        self._last_fetched: Optional[float] = None
+        self._recorded = False
+
+    def __enter__(self) -> TProfiledCursor:
+        self.cursor.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
+        self._stop_process_timer()
+        result = self.cursor.__exit__(exception_type, exception_value, traceback)
+        self.record()
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.cursor, name)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        self._stop_process_timer()
+        start = perf_counter()
+        try:
+            row = next(self.cursor)
+        finally:
+            latency = perf_counter() - start
+            self.profile.fetch_seconds += latency
+        self.profile.row_count += 1
+        if self.profile.row_count % self.profile.sample_interval == 0:
+            self.profile.add_fetch_latency(latency)
+        self._last_fetched = perf_counter()
+        return row
+
+    def _stop_process_timer(self) -> None:
+        """Add time since last fetch to process time, if timer running."""
+        if self._last_fetched is not None:
+            self.profile.process_seconds += perf_counter() - self._last_fetched
+            self._last_fetched = None
+
+    def _timed_write(self, method_name: str, *args: Any) -> Any:
+        """Call row-write method on wrapped cursor, profiling the call."""
+        self.profile.call_counts[method_name] += 1
+        start = perf_counter()
+        result = getattr(self.cursor, method_name)(*args)
+        end = perf_counter()
+        self.profile.write_seconds += end - start
+        # Write time is not process time.
+        if self._last_fetched is not None:
+            self._last_fetched += end - start
+        return result
+
+    def deleteRow(self) -> None:  # pylint: disable=invalid-name
+        """Delete current row (profiled)."""
+        return self._timed_write("deleteRow")
+
+    def insertRow(self, row: Any) -> Any:  # pylint: disable=invalid-name
+        """Insert row (profiled)."""
+        return self._timed_write("insertRow", row)
+
+    def updateRow(self, row: Any) -> None:  # pylint: disable=invalid-name
+        """Update current row (profiled)."""
+        return self._timed_write("updateRow", row)
+
+    def record(self) -> CursorProfile:
+        """Record profile in the metrics registry, if not already recorded.
+
+        Returns:
+            Profile for the cursor.
+        """
+        if not self._recorded:
+            record_metric("cursor", **self.profile.as_dict)
+            self.profile.log()
+            self._recorded = True
+        return self.profile
+
+
+def clear_metrics() -> None:
+    """Clear all recorded metrics from the registry."""
+    METRICS.clear()
+
+
+def cursor_profiling_enabled() -> bool:
+    """Return True if cursor profiling is switched on by environment variable."""
+    value = environ.get(PROFILE_CURSORS_ENVIRONMENT_VARIABLE, "")
+    return value.strip().lower() in ["1", "true", "yes", "on"]
+
+
+def metrics(name: Optional[str] = None) -> List[Metric]:
+    """Return recorded metrics.
+
+    Args:
+        name: Name of metrics to return. If set to None, all metrics will be returned.
+    """
+    return [metric for metric in METRICS if name is None or metric.name == name]
+
+
+def profile_cursor(
+    cursor: Any, *, dataset_path: Union[Path, str], where_sql: Optional[str] = None
+) -> Any:
+    """Return cursor wrapped for profiling, if cursor profiling is switched on.
+
+    If profiling is switched off, the cursor is returned as-is; there is no overhead.
+    The cursor where-clause is recorded in `FIELD_ACCESS_LOG`, if recording.
+
+    Args:
+        cursor: ArcPy cursor to profile.
+        dataset_path: Path to dataset the cursor is opened on.
+        where_sql: SQL where-clause the cursor is opened with.
+    """
+    if where_sql:
+        FIELD_ACCESS_LOG.record(dataset_path, "where", where_sql)
+    if cursor_profiling_enabled():
+        return ProfiledCursor(cursor, dataset_path=dataset_path)
+
+    return cursor
+
+
+def record_metric(name: str, **values: Any) -> Metric:
+    """Record metric in the registry.
+
+    If the registry is full (see `METRICS_MAX_LENGTH`), the oldest metric is dropped.
+
+    Args:
+        name: Name of the metric.
+        **values: Metric values, keyed by value name.
+
+    Returns:
+        Recorded metric.
+    """
+    metric = Metric(name, values)
+    METRICS.append(metric)
+    return metric
@@ -1,23 +1,53 @@
 """Proximity-related operations."""
-from collections import Counter
+import pickle
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from heapq import heappush, heappushpop
 from logging import DEBUG, INFO, Logger, getLogger
+from math import atan2, degrees, hypot, inf
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from arcpy import SetLogHistory
+import numpy
+from arcpy import Geometry, Point, PointGeometry, SetLogHistory
 from arcpy.analysis import Buffer, Clip, Erase, GenerateNearTable, PolygonNeighbors
-from arcpy.management import Dissolve
+from arcpy.management import Dissolve, Merge, SelectLayerByLocation
 
 from arcproc.dataset import (
     DatasetView,
     dataset_feature_count,
+    dataset_signature,
     delete_dataset,
     unique_dataset_path,
 )
 from arcproc.features import features_as_dicts, features_as_tuples
 from arcproc.field import add_field, delete_field
-from arcproc.metadata import Dataset
-from arcproc.misc import log_entity_states
+from arcproc.metadata import (
+    FEATURE_COUNT_CACHE,
+    METADATA_CACHE,
+    Dataset,
+    SpatialReferenceSourceItem,
+)
+from arcproc.misc import ids_where_sql, log_entity_states
+from arcproc.profiling import record_metric
+from arcproc.workspace import create_file_geodatabase, delete_workspace
 
 
 LOG: Logger = getLogger(__name__)
@@ -25,6 +55,870 @@ LOG: Logger = getLogger(__name__)
 
 SetLogHistory(False)
 
+# Py3.7: Can replace usage with `typing.Self` in Py3.11.
+TAdjacencyIndex = TypeVar("TAdjacencyIndex", bound="AdjacencyIndex")
+"""Type variable to enable method return of self on AdjacencyIndex."""
+
+
+class AdjacencyIndex:
+    """Persistable index of polygon adjacency, with incremental refresh.
+
+    Refreshing for changed features only recomputes neighbors for those features &
+    the features around them.
+    """
+
+    cache_path: Optional[Path]
+    """Path to on-disk cache of index. If None, index is not cached."""
+    dataset_path: Path
+    """Path to dataset."""
+    dataset_where_sql: Optional[str]
+    """SQL where-clause for dataset subselection."""
+    exclude_overlap: bool
+    """Exclude features that overlap, but do not have adjacent edges or nodes if True.
+    """
+    id_field_names: List[str]
+    """Names of the feature ID fields, in lowercase."""
+    include_corner: bool
+    """Include features that have adjacent corner nodes, but no adjacent edges if True.
+    """
+    neighbors: Dict[Union[Tuple[Any], Any], Set[Union[Tuple[Any], Any]]]
+    """Mapping of feature ID to set of adjacent feature IDs."""
+    signature: Tuple[Any]
+    """Signature of dataset when index was loaded or refreshed."""
+
+    def __init__(
+        self,
+        dataset_path: Union[Path, str],
+        *,
+        id_field_names: Iterable[str],
+        dataset_where_sql: Optional[str] = None,
+        exclude_overlap: bool = False,
+        include_corner: bool = False,
+        cache_path: Optional[Union[Path, str]] = None,
+    ) -> None:
+        """Initialize instance.
+
+        Args:
+            dataset_path: Path to dataset.
+            id_field_names: Names of the feature ID fields.
+            dataset_where_sql: SQL where-clause for dataset subselection.
+            exclude_overlap: Exclude features that overlap, but do not have adjacent
+                edges or nodes if True.
+            include_corner: Include features that have adjacent corner nodes, but no
+                adjacent edges if True.
+            cache_path: Path to on-disk cache of index. Cache is reused if the dataset
+                signature is unchanged, rebuilt otherwise. If set to None, index will
+                not be cached.
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.dataset_path = Path(dataset_path)
+        self.dataset_where_sql = dataset_where_sql
+        self.exclude_overlap = exclude_overlap
+        # Lowercase to avoid casing mismatch.
+        self.id_field_names = [name.lower() for name in id_field_names]
+        self.include_corner = include_corner
+        self.neighbors = {}
+        self.signature = None
+        self.load()
+
+    @property
+    def _cache_key(self) -> Tuple[Any]:
+        """Key identifying the dataset, subselection, & options the index covers."""
+        return (
+            str(self.dataset_path),
+            tuple(self.id_field_names),
+            self.dataset_where_sql,
+            self.exclude_overlap,
+            self.include_corner,
+        )
+
+    def _add_pairs(self, view_name: str, ids: Optional[Set[Any]] = None) -> None:
+        """Add neighbor pairs found in view to index.
+
+        Args:
+            view_name: Name of dataset view.
+            ids: IDs of features to add pairs for. If set to None, will add all pairs.
+        """
+        for source_id, neighbor_id in _polygon_neighbor_pairs(
+            view_name,
+            id_field_names=self.id_field_names,
+            exclude_overlap=self.exclude_overlap,
+            include_corner=self.include_corner,
+        ):
+            if ids is not None and source_id not in ids and neighbor_id not in ids:
+                continue
+
+            if source_id not in self.neighbors:
+                self.neighbors[source_id] = set()
+            if neighbor_id is not None:
+                self.neighbors[source_id].add(neighbor_id)
+
+    def _save(self) -> None:
+        """Save index to cache, if caching."""
+        if self.cache_path:
+            cache = {
+                "key": self._cache_key,
+                "signature": self.signature,
+                "neighbors": self.neighbors,
+            }
+            with self.cache_path.open(mode="wb") as cachefile:
+                pickle.dump(cache, cachefile, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def as_csr(self) -> Tuple[List[Any], numpy.ndarray, numpy.ndarray]:
+        """Return adjacency in compressed sparse row form.
+
+        Neighbors of the feature at index `i` are at
+        `neighbor_indices[offsets[i]:offsets[i + 1]]`.
+
+        Returns:
+            Feature IDs, offsets (feature count + 1), & neighbor feature indices.
+        """
+        ids = list(self.neighbors)
+        id_index = {_id: i for i, _id in enumerate(ids)}
+        for neighbor_ids in self.neighbors.values():
+            for neighbor_id in neighbor_ids:
+                if neighbor_id not in id_index:
+                    id_index[neighbor_id] = len(ids)
+                    ids.append(neighbor_id)
+        counts = [len(self.neighbors.get(_id, ())) for _id in ids]
+        offsets = numpy.zeros(len(ids) + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+        neighbor_indices = numpy.fromiter(
+            (
+                id_index[neighbor_id]
+                for _id in ids
+                for neighbor_id in sorted(
+                    self.neighbors.get(_id, ()), key=id_index.__getitem__
+                )
+            ),
+            dtype=numpy.int64,
+            count=offsets[-1],
+        )
+        return ids, offsets, neighbor_indices
+
+    def load(self) -> TAdjacencyIndex:
+        """Load index from cache if current, otherwise build from dataset.
+
+        Returns:
+            Reference to instance.
+        """
+        self.signature = dataset_signature(self.dataset_path)
+        if self.cache_path and self.cache_path.is_file():
+            with self.cache_path.open(mode="rb") as cachefile:
+                cache = pickle.load(cachefile)
+            if cache["key"] == self._cache_key and cache["signature"] == self.signature:
+                LOG.debug("Loaded adjacency index from cache `%s`.", self.cache_path)
+                self.neighbors = cache["neighbors"]
+                return self
+
+        view = DatasetView(
+            self.dataset_path,
+            field_names=self.id_field_names,
+            dataset_where_sql=self.dataset_where_sql,
+        )
+        self.neighbors = {}
+        with view:
+            self._add_pairs(view.name)
+        self._save()
+        return self
+
+    def refresh(self, changed_ids: Optional[Iterable[Any]] = None) -> bool:
+        """Update index if the dataset has changed since loading.
+
+        Args:
+            changed_ids: IDs of features added, altered, or deleted since index was
+                loaded. If set to None, will rebuild the whole index.
+
+        Returns:
+            True if index was updated, False otherwise.
+        """
+        signature = dataset_signature(self.dataset_path)
+        if signature == self.signature:
+            return False
+
+        if changed_ids is None:
+            self.load()
+            return True
+
+        changed_ids = set(changed_ids)
+        for _id in changed_ids:
+            for neighbor_id in self.neighbors.pop(_id, set()):
+                self.neighbors.get(neighbor_id, set()).discard(_id)
+        view = DatasetView(
+            self.dataset_path,
+            field_names=self.id_field_names,
+            dataset_where_sql=self.dataset_where_sql,
+        )
+        existing_changed_count = 0
+        with view:
+            for i, where_sql in enumerate(
+                ids_where_sql(
+                    self.id_field_names,
+                    (
+                        _id if len(self.id_field_names) > 1 else (_id,)
+                        for _id in changed_ids
+                    ),
+                    dataset_path=self.dataset_path,
+                )
+            ):
+                changed_view = DatasetView(
+                    self.dataset_path,
+                    field_names=self.id_field_names,
+                    dataset_where_sql=(
+                        f"({self.dataset_where_sql}) AND ({where_sql})"
+                        if self.dataset_where_sql
+                        else where_sql
+                    ),
+                )
+                with changed_view:
+                    existing_changed_count += changed_view.feature_count
+                    # Polygons around changed ones must be included to be found.
+                    SelectLayerByLocation(
+                        in_layer=view.name,
+                        overlap_type="INTERSECT",
+                        select_features=changed_view.name,
+                        selection_type=(
+                            "NEW_SELECTION" if i == 0 else "ADD_TO_SELECTION"
+                        ),
+                    )
+            # Empty selection would make neighbors run on all features.
+            if existing_changed_count:
+                self._add_pairs(view.name, ids=changed_ids)
+        self.signature = signature
+        self._save()
+        return True
+
+
+class NearestNeighborIndex:
+    """In-memory k-nearest-neighbor index over near-features.
+
+    Points (or feature centroids) are held in a static KD-tree. With exact geometry,
+    the tree holds extent centers instead: candidates within reach of the search are
+    found through the tree, visited in order of distance to their extents, & measured
+    against the true geometry, so polylines & polygons get the same answer as a
+    geoprocessing near-table.
+    """
+
+    coordinates: numpy.ndarray
+    """Coordinates for each near-feature (centroid for non-points), as (count, 2)."""
+    ids: List[Any]
+    """ID for each near-feature."""
+    geometries: Optional[List[Geometry]]
+    """Geometry for each near-feature, if measuring exact geometry distance."""
+    extents: Optional[numpy.ndarray]
+    """Extent for each near-feature as (xmin, ymin, xmax, ymax), if measuring exact
+    geometry distance.
+    """
+
+    def __init__(
+        self,
+        coordinates: Iterable[Tuple[float]],
+        ids: Iterable[Any],
+        *,
+        geometries: Optional[Iterable[Geometry]] = None,
+    ) -> None:
+        """Initialize instance.
+
+        Args:
+            coordinates: Coordinates for each near-feature.
+            ids: ID for each near-feature.
+            geometries: Geometry for each near-feature. If set to None, distances are
+                measured between coordinates only.
+        """
+        self.coordinates = numpy.array(list(coordinates), dtype=numpy.float64).reshape(
+            -1, 2
+        )
+        self.ids = list(ids)
+        self.geometries = list(geometries) if geometries is not None else None
+        self.extents = (
+            numpy.array(
+                [
+                    (
+                        geometry.extent.XMin,
+                        geometry.extent.YMin,
+                        geometry.extent.XMax,
+                        geometry.extent.YMax,
+                    )
+                    for geometry in self.geometries
+                ],
+                dtype=numpy.float64,
+            ).reshape(-1, 4)
+            if self.geometries is not None
+            else None
+        )
+        # Near-features share one spatial reference: query points are built in it.
+        self._spatial_reference = (
+            self.geometries[0].spatialReference if self.geometries else None
+        )
+        if self.extents is not None:
+            self._tree_coordinates = (self.extents[:, :2] + self.extents[:, 2:]) / 2
+            # Every geometry lies within this distance of its extent center.
+            self._max_half_diagonal = (
+                float(
+                    numpy.hypot(
+                        self.extents[:, 2] - self.extents[:, 0],
+                        self.extents[:, 3] - self.extents[:, 1],
+                    ).max()
+                    / 2
+                )
+                if len(self.extents)
+                else 0.0
+            )
+        else:
+            self._tree_coordinates = self.coordinates
+        # Tree is implicit: median of each index range splits on axis of range depth.
+        self._tree_order = numpy.arange(len(self.ids))
+        ranges = [(0, len(self.ids), 0)]
+        while ranges:
+            start, stop, depth = ranges.pop()
+            if stop - start < 2:
+                continue
+
+            mid = (start + stop) // 2
+            order = self._tree_order[start:stop]
+            self._tree_order[start:stop] = order[
+                numpy.argpartition(
+                    self._tree_coordinates[order, depth % 2], mid - start
+                )
+            ]
+            ranges.extend([(start, mid, depth + 1), (mid + 1, stop, depth + 1)])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset_path: Union[Path, str],
+        *,
+        id_field_name: str,
+        dataset_where_sql: Optional[str] = None,
+        spatial_reference_item: SpatialReferenceSourceItem = None,
+        exact_geometry: bool = False,
+    ) -> "NearestNeighborIndex":
+        """Return index built from near-dataset.
+
+        Args:
+            dataset_path: Path to near-dataset.
+            id_field_name: Name of the near-dataset ID field.
+            dataset_where_sql: SQL where-clause for near-dataset subselection.
+            spatial_reference_item: Item from which the spatial reference for any
+                geometry properties will be set to. If set to None, will use spatial
+                reference of the dataset.
+            exact_geometry: Measure distances to near-feature geometry if True,
+                otherwise to near-feature centroids. Ignored for point datasets.
+        """
+        # Point distance is exact already; keep the KD-tree search.
+        if Dataset(dataset_path).geometry_type.lower() == "point":
+            exact_geometry = False
+        field_names = [id_field_name, "SHAPE@XY"]
+        if exact_geometry:
+            field_names.append("SHAPE@")
+        features = [
+            feature
+            for feature in features_as_tuples(
+                dataset_path,
+                field_names=field_names,
+                dataset_where_sql=dataset_where_sql,
+                spatial_reference_item=spatial_reference_item,
+            )
+            if feature[1] is not None
+        ]
+        return cls(
+            coordinates=(feature[1] for feature in features),
+            ids=(feature[0] for feature in features),
+            geometries=(
+                (feature[2] for feature in features) if exact_geometry else None
+            ),
+        )
+
+    def _exact_nearest(
+        self, x: float, y: float, *, k: int, max_distance: float
+    ) -> List[Tuple[float, int, float]]:
+        """Return (distance, near-feature index, angle) of nearest geometries.
+
+        Args:
+            x: X-coordinate of point to search from.
+            y: Y-coordinate of point to search from.
+            k: Number of nearest near-features to find.
+            max_distance: Maximum distance to search for near-features.
+        """
+        # The k nearest extent centers bound the kth-nearest geometry distance; any
+        # geometry that near has its extent center within one more half-diagonal.
+        search_distance = max_distance + self._max_half_diagonal
+        center_nearest = self._tree_nearest(x, y, k=k, max_distance=inf)
+        if len(center_nearest) == k:
+            search_distance = min(
+                search_distance, center_nearest[-1][0] + 2 * self._max_half_diagonal
+            )
+        candidates = self._tree_within(x, y, radius=search_distance)
+        extents = self.extents[candidates]
+        # Distance to extent is never more than distance to geometry.
+        extent_distances = numpy.hypot(
+            numpy.maximum.reduce(
+                [extents[:, 0] - x, numpy.zeros(len(extents)), x - extents[:, 2]]
+            ),
+            numpy.maximum.reduce(
+                [extents[:, 1] - y, numpy.zeros(len(extents)), y - extents[:, 3]]
+            ),
+        )
+        within = extent_distances <= max_distance
+        candidates, extent_distances = candidates[within], extent_distances[within]
+        # Keep candidate order stable by index for equal extent distances.
+        order = numpy.lexsort((candidates, extent_distances))
+        point = PointGeometry(Point(x, y), self._spatial_reference)
+        heap = []
+        for i, extent_distance in zip(
+            candidates[order].tolist(), extent_distances[order].tolist()
+        ):
+            if len(heap) == k and extent_distance > -heap[0][0]:
+                break
+
+            geometry = self.geometries[i]
+            distance = geometry.distanceTo(point)
+            if distance > max_distance:
+                continue
+
+            near_point = geometry.queryPointAndDistance(point)[0].firstPoint
+            angle = (
+                degrees(atan2(near_point.Y - y, near_point.X - x)) if distance else 0.0
+            )
+            if len(heap) < k:
+                heappush(heap, (-distance, -i, angle))
+            else:
+                heappushpop(heap, (-distance, -i, angle))
+        return sorted((-distance, -i, angle) for distance, i, angle in heap)
+
+    def _tree_nearest(
+        self, x: float, y: float, *, k: int, max_distance: float
+    ) -> List[Tuple[float, int, float]]:
+        """Return (distance, near-feature index, angle) of nearest coordinates.
+
+        Args:
+            x: X-coordinate of point to search from.
+            y: Y-coordinate of point to search from.
+            k: Number of nearest near-features to find.
+            max_distance: Maximum distance to search for near-features.
+        """
+        heap = []
+        ranges = [(0, len(self), 0)]
+        while ranges:
+            start, stop, depth = ranges.pop()
+            if start >= stop:
+                continue
+
+            mid = (start + stop) // 2
+            i = int(self._tree_order[mid])
+            near_x, near_y = self._tree_coordinates[i].tolist()
+            distance = hypot(near_x - x, near_y - y)
+            if distance <= max_distance:
+                angle = degrees(atan2(near_y - y, near_x - x)) if distance else 0.0
+                if len(heap) < k:
+                    heappush(heap, (-distance, -i, angle))
+                elif distance < -heap[0][0]:
+                    heappushpop(heap, (-distance, -i, angle))
+            split_offset = (x, y)[depth % 2] - (near_x, near_y)[depth % 2]
+            near_range, far_range = (
+                ((start, mid, depth + 1), (mid + 1, stop, depth + 1))
+                if split_offset < 0
+                else ((mid + 1, stop, depth + 1), (start, mid, depth + 1))
+            )
+            search_distance = -heap[0][0] if len(heap) == k else max_distance
+            # Stack is last-in-first-out: push far side first to visit near side first.
+            if abs(split_offset) <= search_distance:
+                ranges.append(far_range)
+            ranges.append(near_range)
+        return sorted((-distance, -i, angle) for distance, i, angle in heap)
+
+    def _tree_within(self, x: float, y: float, *, radius: float) -> numpy.ndarray:
+        """Return near-feature indices with tree coordinates within radius of point.
+
+        Args:
+            x: X-coordinate of point to search from.
+            y: Y-coordinate of point to search from.
+            radius: Search radius.
+        """
+        indices = []
+        ranges = [(0, len(self), 0)]
+        while ranges:
+            start, stop, depth = ranges.pop()
+            if start >= stop:
+                continue
+
+            mid = (start + stop) // 2
+            i = int(self._tree_order[mid])
+            near_x, near_y = self._tree_coordinates[i].tolist()
+            if hypot(near_x - x, near_y - y) <= radius:
+                indices.append(i)
+            split_offset = (x, y)[depth % 2] - (near_x, near_y)[depth % 2]
+            # Lower range is on or before the split, upper range on or after.
+            if split_offset <= radius:
+                ranges.append((start, mid, depth + 1))
+            if -split_offset <= radius:
+                ranges.append((mid + 1, stop, depth + 1))
+        return numpy.array(indices, dtype=numpy.int64)
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        *,
+        k: int = 1,
+        max_distance: Optional[Union[float, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return info dictionaries for the k nearest near-features to point.
+
+        Args:
+            x: X-coordinate of point to search from.
+            y: Y-coordinate of point to search from.
+            k: Number of nearest near-features to find.
+            max_distance: Maximum distance to search for near-features. If set to None,
+                search is unbounded.
+
+        Returns:
+            Nearest feature details, ordered by nearness rank.
+            Keys:
+                * near_id
+                * near_rank
+                * angle: Angle from point & near-feature, in decimal degrees.
+                * distance: Distance between point & near-feature.
+        """
+        search = (
+            self._exact_nearest if self.geometries is not None else self._tree_nearest
+        )
+        return [
+            {
+                "near_id": self.ids[i],
+                "near_rank": rank,
+                "angle": angle,
+                "distance": distance,
+            }
+            for rank, (distance, i, angle) in enumerate(
+                search(
+                    x,
+                    y,
+                    k=k,
+                    max_distance=inf if max_distance is None else max_distance,
+                ),
+                start=1,
+            )
+        ]
+
+
+def _polygon_neighbor_pairs(
+    view_name: str,
+    *,
+    id_field_names: List[str],
+    exclude_overlap: bool,
+    include_corner: bool,
+) -> Iterator[Tuple[Any, Optional[Any]]]:
+    """Generate (source ID, neighbor ID) pairs for polygon neighbors in view.
+
+    Notes:
+        Neighbor ID is None where neighbor only touches at corner & corner neighbors
+            are not included. Source ID is still generated so it can be mapped.
+
+    Args:
+        view_name: Name of dataset view. Neighbors are found for selected features only.
+        id_field_names: Names of the feature ID fields, in lowercase.
+        exclude_overlap: Exclude features that overlap, but do not have adjacent edges
+            or nodes if True.
+        include_corner: Include features that have adjacent corner nodes, but no
+            adjacent edges if True.
+    """
+    temp_neighbor_path = unique_dataset_path("neighbor")
+    # ArcPy2.8.0: Convert Path to str.
+    PolygonNeighbors(
+        in_features=view_name,
+        out_table=str(temp_neighbor_path),
+        in_fields=id_field_names,
+        area_overlap=not exclude_overlap,
+        both_sides=True,
+    )
+    for row in features_as_dicts(temp_neighbor_path):
+        # Lowercase to avoid casing mismatch.
+        row = {key.lower(): val for key, val in row.items()}
+        if len(id_field_names) == 1:
+            source_id = row[f"src_{id_field_names[0]}"]
+            neighbor_id = row[f"nbr_{id_field_names[0]}"]
+        else:
+            source_id = tuple(row[f"src_{name}"] for name in id_field_names)
+            neighbor_id = tuple(row[f"nbr_{name}"] for name in id_field_names)
+        if not include_corner and not row["length"] and not row["area"]:
+            neighbor_id = None
+        yield source_id, neighbor_id
+
+    delete_dataset(temp_neighbor_path, log_level=DEBUG)
+
+
+def _oid_ranges_where_sqls(
+    oid_field_name: str,
+    oids: Iterable[int],
+    *,
+    sorted_oids: Sequence[int],
+    chunk_size: int = 500,
+) -> Iterator[str]:
+    """Generate SQL where-clauses that subselect features with the given object IDs.
+
+    Object IDs that are consecutive among all object IDs are selected as one range,
+    so spatially-grouped features with nearby IDs need few terms. Ranges are split
+    into chunks so that no single where-clause gets unwieldy.
+
+    Args:
+        oid_field_name: Name of the object ID field.
+        oids: Object IDs to select.
+        sorted_oids: All object IDs in the selection's dataset, sorted. Ranges never
+            span an ID in here that is not in `oids`.
+        chunk_size: Maximum number of ranges to include in each where-clause.
+    """
+    indices = sorted(bisect_left(sorted_oids, oid) for oid in oids)
+    ranges = []
+    for index in indices:
+        if ranges and index == ranges[-1][1] + 1:
+            ranges[-1][1] = index
+        else:
+            ranges.append([index, index])
+    for i in range(0, len(ranges), chunk_size):
+        # ArcPy where clauses cannot use `BETWEEN`.
+        yield " OR ".join(
+            f"({oid_field_name} = {sorted_oids[first]})"
+            if first == last
+            else (
+                f"({oid_field_name} >= {sorted_oids[first]}"
+                f" AND {oid_field_name} <= {sorted_oids[last]})"
+            )
+            for first, last in ranges[i : i + chunk_size]
+        )
+
+
+def _quadtree_tiles(
+    oid_xys: Sequence[Tuple[int, Tuple[float, float]]], *, max_count: int
+) -> List[List[int]]:
+    """Return object IDs partitioned into quadtree tiles.
+
+    Tiles split into quadrants until each holds no more than `max_count` features.
+    Features belong to the tile holding their centroid.
+
+    Args:
+        oid_xys: Object ID & centroid coordinates for each feature.
+        max_count: Maximum number of features in a tile.
+    """
+    tiles = []
+    quads = [list(oid_xys)] if oid_xys else []
+    while quads:
+        quad = quads.pop()
+        xs = [x for _, (x, _) in quad]
+        ys = [y for _, (_, y) in quad]
+        # Coincident centroids cannot be split further.
+        if len(quad) <= max_count or (min(xs) == max(xs) and min(ys) == max(ys)):
+            tiles.append([oid for oid, _ in quad])
+            continue
+
+        mid_x = (min(xs) + max(xs)) / 2
+        mid_y = (min(ys) + max(ys)) / 2
+        quadrants = defaultdict(list)
+        for oid, (x, y) in quad:
+            quadrants[(x > mid_x, y > mid_y)].append((oid, (x, y)))
+        quads.extend(quadrant for _, quadrant in sorted(quadrants.items()))
+    return tiles
+
+
+def _tile_tool_output(
+    tile_index: int,
+    *,
+    tool_name: str,
+    dataset_path: Path,
+    dataset_where_sql: Optional[str],
+    field_names: Optional[List[str]],
+    view_paths: Dict[str, Tuple[Path, Optional[str]]],
+    scratch_path: Path,
+    tool_kwargs: Dict[str, Any],
+) -> Tuple[int, Path, float]:
+    """Run geoprocessing tool on a tile of features into a scratch geodatabase.
+
+    Each tile has its own views & scratch workspace, so that this can run in a worker
+    process alongside other tiles.
+
+    Args:
+        tile_index: Index of tile.
+        tool_name: Name of tool to run: "Buffer", "Clip", "Dissolve", or "Erase".
+        dataset_path: Path to dataset.
+        dataset_where_sql: SQL where-clause for tile subselection.
+        field_names: Names of fields to include in dataset view. If set to None, all
+            fields will be included.
+        view_paths: Mapping of tool keyword to dataset path & SQL where-clause, for
+            other datasets the tool reads (e.g. clip features).
+        scratch_path: Path to folder to create scratch geodatabase in.
+        tool_kwargs: Other keyword arguments for tool.
+
+    Returns:
+        Tile index, path to tile output, & seconds taken to run.
+    """
+    start_time = perf_counter()
+    tool = {"Buffer": Buffer, "Clip": Clip, "Dissolve": Dissolve, "Erase": Erase}[
+        tool_name
+    ]
+    workspace_path = scratch_path / f"tile{tile_index}.gdb"
+    create_file_geodatabase(workspace_path, log_level=DEBUG)
+    tile_output_path = workspace_path / "output"
+    views = {
+        keyword: DatasetView(path, field_names=[], dataset_where_sql=where_sql)
+        for keyword, (path, where_sql) in view_paths.items()
+    }
+    view = DatasetView(
+        dataset_path, field_names=field_names, dataset_where_sql=dataset_where_sql
+    )
+    with view:
+        for other_view in views.values():
+            other_view.create()
+        try:
+            # ArcPy2.8.0: Convert Path to str.
+            tool(
+                view.name,
+                out_feature_class=str(tile_output_path),
+                **{keyword: other_view.name for keyword, other_view in views.items()},
+                **tool_kwargs,
+            )
+        finally:
+            for other_view in views.values():
+                other_view.discard()
+    return tile_index, tile_output_path, perf_counter() - start_time
+
+
+def _tiled_tool_run(
+    tool_name: str,
+    *,
+    dataset_path: Path,
+    dataset_where_sql: Optional[str],
+    field_names: Optional[List[str]] = None,
+    view_paths: Optional[Dict[str, Tuple[Path, Optional[str]]]] = None,
+    output_path: Path,
+    tile_feature_count: int,
+    max_workers: Optional[int],
+    tool_kwargs: Dict[str, Any],
+    seam_dissolve_kwargs: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Run geoprocessing tool over quadtree tiles of dataset & merge tile outputs.
+
+    Split, per-tile, & merge timings are recorded as metrics (`tile_split`,
+    `tile_run`, & `tile_merge`), to help tune tile feature count.
+
+    Args:
+        tool_name: Name of tool to run: "Buffer", "Clip", "Dissolve", or "Erase".
+        dataset_path: Path to dataset.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+        field_names: Names of fields to include in dataset view. If set to None, all
+            fields will be included.
+        view_paths: Mapping of tool keyword to dataset path & SQL where-clause, for
+            other datasets the tool reads (e.g. clip features).
+        output_path: Path to output dataset.
+        tile_feature_count: Maximum number of features in a tile.
+        max_workers: Maximum number of worker processes for running tiles. If set to
+            None, will use the number of processors. Set to 1 to run tiles in-process.
+        tool_kwargs: Other keyword arguments for tool.
+        seam_dissolve_kwargs: Keyword arguments for `Dissolve`, to re-dissolve merged
+            tile outputs across tile seams. If set to None, tile outputs are only
+            merged.
+    """
+    start_time = perf_counter()
+    oid_xys = list(
+        features_as_tuples(
+            dataset_path,
+            field_names=["OID@", "SHAPE@XY"],
+            dataset_where_sql=dataset_where_sql,
+        )
+    )
+    # Features without geometry are in no tile, but still break up OID ranges.
+    sorted_oids = sorted(oid for oid, _ in oid_xys)
+    tile_where_sqls = [
+        f"({dataset_where_sql}) AND ({where_sql})" if dataset_where_sql else where_sql
+        for oids in _quadtree_tiles(
+            [(oid, xy) for oid, xy in oid_xys if xy is not None],
+            max_count=tile_feature_count,
+        )
+        for where_sql in _oid_ranges_where_sqls(
+            Dataset(dataset_path).oid_field_name, oids, sorted_oids=sorted_oids
+        )
+    ]
+    # No features: run as a single (empty) tile, same as untiled.
+    if not tile_where_sqls:
+        tile_where_sqls = [dataset_where_sql]
+    record_metric(
+        "tile_split",
+        dataset_path=dataset_path,
+        tile_count=len(tile_where_sqls),
+        seconds=perf_counter() - start_time,
+    )
+    LOG.debug("Running %s on %s tiles.", tool_name, len(tile_where_sqls))
+    scratch_path = Path(mkdtemp(prefix="arcproc"))
+    tile_kwargs = [
+        {
+            "tile_index": tile_index,
+            "tool_name": tool_name,
+            "dataset_path": dataset_path,
+            "dataset_where_sql": where_sql,
+            "field_names": field_names,
+            "view_paths": view_paths or {},
+            "scratch_path": scratch_path,
+            "tool_kwargs": tool_kwargs,
+        }
+        for tile_index, where_sql in enumerate(tile_where_sqls)
+    ]
+    results = []
+    try:
+        if max_workers == 1:
+            results = [_tile_tool_output(**kwargs) for kwargs in tile_kwargs]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = [
+                    future.result()
+                    for future in as_completed(
+                        executor.submit(_tile_tool_output, **kwargs)
+                        for kwargs in tile_kwargs
+                    )
+                ]
+        results.sort(key=itemgetter(0))
+        for tile_index, _, seconds in results:
+            record_metric(
+                "tile_run",
+                dataset_path=dataset_path,
+                tile_index=tile_index,
+                seconds=seconds,
+            )
+        start_time = perf_counter()
+        merged_path = (
+            scratch_path / "merged.gdb" / "merged"
+            if seam_dissolve_kwargs is not None
+            else output_path
+        )
+        if seam_dissolve_kwargs is not None:
+            create_file_geodatabase(merged_path.parent, log_level=DEBUG)
+        # ArcPy2.8.0: Convert Path to str.
+        Merge(
+            inputs=[str(tile_output_path) for _, tile_output_path, _ in results],
+            output=str(merged_path),
+        )
+        if seam_dissolve_kwargs is not None:
+            # ArcPy2.8.0: Convert Path to str.
+            Dissolve(
+                in_features=str(merged_path),
+                out_feature_class=str(output_path),
+                **seam_dissolve_kwargs,
+            )
+            delete_workspace(merged_path.parent, log_level=DEBUG)
+        FEATURE_COUNT_CACHE.invalidate(output_path)
+        METADATA_CACHE.invalidate(output_path)
+        record_metric(
+            "tile_merge",
+            dataset_path=dataset_path,
+            tile_count=len(results),
+            seconds=perf_counter() - start_time,
+        )
+    finally:
+        for _, tile_output_path, _ in results:
+            delete_workspace(tile_output_path.parent, log_level=DEBUG)
+        rmtree(scratch_path, ignore_errors=True)
+
 
 def adjacent_neighbors_map(
     dataset_path: Union[Path, str],
@@ -33,6 +927,7 @@ def adjacent_neighbors_map(
     dataset_where_sql: Optional[str] = None,
     exclude_overlap: bool = False,
     include_corner: bool = False,
+    cache_path: Optional[Union[Path, str]] = None,
 ) -> Dict[Union[Tuple[Any], Any], Set[Union[Tuple[Any], Any]]]:
     """Return mapping of feature ID to set of adjacent feature IDs.
 
@@ -49,7 +944,21 @@ def adjacent_neighbors_map(
             or nodes if True.
         include_corner: Include features that have adjacent corner nodes, but no
             adjacent edges if True.
+        cache_path: Path to on-disk cache of adjacency index. Cache is reused if the
+            dataset signature is unchanged, rebuilt otherwise. If set to None, mapping
+            will not be cached.
     """
+    if cache_path:
+        index = AdjacencyIndex(
+            dataset_path,
+            id_field_names=id_field_names,
+            dataset_where_sql=dataset_where_sql,
+            exclude_overlap=exclude_overlap,
+            include_corner=include_corner,
+            cache_path=cache_path,
+        )
+        return index.neighbors
+
     dataset_path = Path(dataset_path)
     id_field_names = list(id_field_names)
     # Lowercase to avoid casing mismatch.
@@ -57,33 +966,18 @@ def adjacent_neighbors_map(
     view = DatasetView(
         dataset_path, field_names=id_field_names, dataset_where_sql=dataset_where_sql
     )
-    with view:
-        temp_neighbor_path = unique_dataset_path("neighbor")
-        # ArcPy2.8.0: Convert Path to str.
-        PolygonNeighbors(
-            in_features=view.name,
-            out_table=str(temp_neighbor_path),
-            in_fields=id_field_names,
-            area_overlap=not exclude_overlap,
-            both_sides=True,
-        )
     adjacent_neighbors = {}
-    for row in features_as_dicts(temp_neighbor_path):
-        # Lowercase to avoid casing mismatch.
-        row = {key.lower(): val for key, val in row.items()}
-        if len(id_field_names) == 1:
-            source_id = row[f"src_{id_field_names[0]}"]
-            neighbor_id = row[f"nbr_{id_field_names[0]}"]
-        else:
-            source_id = tuple(row[f"src_{name}"] for name in id_field_names)
-            neighbor_id = tuple(row[f"nbr_{name}"] for name in id_field_names)
-        if source_id not in adjacent_neighbors:
-            adjacent_neighbors[source_id] = set()
-        if not include_corner and not row["length"] and not row["area"]:
-            continue
-
-        adjacent_neighbors[source_id].add(neighbor_id)
-    delete_dataset(temp_neighbor_path, log_level=DEBUG)
+    with view:
+        for source_id, neighbor_id in _polygon_neighbor_pairs(
+            view.name,
+            id_field_names=id_field_names,
+            exclude_overlap=exclude_overlap,
+            include_corner=include_corner,
+        ):
+            if source_id not in adjacent_neighbors:
+                adjacent_neighbors[source_id] = set()
+            if neighbor_id is not None:
+                adjacent_neighbors[source_id].add(neighbor_id)
     return adjacent_neighbors
 
 
@@ -93,6 +987,8 @@ def buffer_features(
     dataset_where_sql: Optional[str] = None,
     output_path: Union[Path, str],
     distance: Union[float, int],
+    tile_feature_count: Optional[int] = None,
+    max_workers: Optional[int] = None,
     log_level: int = INFO,
 ) -> Counter:
     """Buffer feature geometries a given distance.
@@ -102,6 +998,11 @@ def buffer_features(
         dataset_where_sql: SQL where-clause for dataset subselection.
         output_path: Path to output dataset.
         distance: Distance to buffer from feature, in the units of the dataset.
+        tile_feature_count: Maximum number of features to process together, in
+            quadtree tiles. If set to None, will process all features together.
+        max_workers: Maximum number of worker processes for running tiles. If set to
+            None, will use the number of processors. Set to 1 to run tiles in-process.
+            Ignored if `tile_feature_count` is None.
         log_level: Level to log the function at.
 
     Returns:
@@ -111,18 +1012,32 @@ def buffer_features(
     output_path = Path(output_path)
     LOG.log(log_level, "Start: Buffer features in `%s`.", dataset_path)
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
-    view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
-    with view:
-        # ArcPy2.8.0: Convert Path to str.
-        Buffer(
-            in_features=view.name,
-            out_feature_class=str(output_path),
-            buffer_distance_or_field=distance,
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
+    if tile_feature_count:
+        # Buffers are per-feature, so tile outputs do not need a seam dissolve.
+        _tiled_tool_run(
+            "Buffer",
+            dataset_path=dataset_path,
+            dataset_where_sql=dataset_where_sql,
+            output_path=output_path,
+            tile_feature_count=tile_feature_count,
+            max_workers=max_workers,
+            tool_kwargs={"buffer_distance_or_field": distance},
         )
+    else:
+        view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
+        with view:
+            # ArcPy2.8.0: Convert Path to str.
+            Buffer(
+                in_features=view.name,
+                out_feature_class=str(output_path),
+                buffer_distance_or_field=distance,
+            )
+        FEATURE_COUNT_CACHE.invalidate(output_path)
+        METADATA_CACHE.invalidate(output_path)
     for field_name in ["BUFF_DIST", "ORIG_FID"]:
         delete_field(output_path, field_name=field_name, log_level=DEBUG)
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Buffer.")
     return states
@@ -135,6 +1050,8 @@ def clip_features(
     dataset_where_sql: Optional[str] = None,
     clip_where_sql: Optional[str] = None,
     output_path: Union[Path, str],
+    tile_feature_count: Optional[int] = None,
+    max_workers: Optional[int] = None,
     log_level: int = INFO,
 ) -> Counter:
     """Clip feature geometries where it overlaps clip-dataset geometries.
@@ -145,6 +1062,11 @@ def clip_features(
         dataset_where_sql: SQL where-clause for dataset subselection.
         clip_where_sql: SQL where-clause for clip-dataset subselection.
         output_path: Path to output dataset.
+        tile_feature_count: Maximum number of features to process together, in
+            quadtree tiles. If set to None, will process all features together.
+        max_workers: Maximum number of worker processes for running tiles. If set to
+            None, will use the number of processors. Set to 1 to run tiles in-process.
+            Ignored if `tile_feature_count` is None.
         log_level: Level to log the function at.
 
     Returns:
@@ -160,17 +1082,31 @@ def clip_features(
         clip_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
-    view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
-    clip_view = DatasetView(clip_path, dataset_where_sql=clip_where_sql)
-    with view, clip_view:
-        # ArcPy2.8.0: Convert Path to str.
-        Clip(
-            in_features=view.name,
-            clip_features=clip_view.name,
-            out_feature_class=str(output_path),
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
+    if tile_feature_count:
+        _tiled_tool_run(
+            "Clip",
+            dataset_path=dataset_path,
+            dataset_where_sql=dataset_where_sql,
+            view_paths={"clip_features": (clip_path, clip_where_sql)},
+            output_path=output_path,
+            tile_feature_count=tile_feature_count,
+            max_workers=max_workers,
+            tool_kwargs={},
         )
-    states["in output"] = dataset_feature_count(output_path)
+    else:
+        view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
+        clip_view = DatasetView(clip_path, dataset_where_sql=clip_where_sql)
+        with view, clip_view:
+            # ArcPy2.8.0: Convert Path to str.
+            Clip(
+                in_features=view.name,
+                clip_features=clip_view.name,
+                out_feature_class=str(output_path),
+            )
+        FEATURE_COUNT_CACHE.invalidate(output_path)
+        METADATA_CACHE.invalidate(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Clip.")
     return states
@@ -185,6 +1121,8 @@ def dissolve_features(
     all_fields_in_output: bool = False,
     allow_multipart: bool = True,
     unsplit_lines: bool = False,
+    tile_feature_count: Optional[int] = None,
+    max_workers: Optional[int] = None,
     log_level: int = INFO,
 ) -> Counter:
     """Dissolve feature geometries that share values in given fields.
@@ -200,6 +1138,11 @@ def dissolve_features(
         allow_multipart: Allow multipart features in output if True.
         unsplit_lines: Merge line features when endpoints meet without crossing features
             if True.
+        tile_feature_count: Maximum number of features to process together, in
+            quadtree tiles. If set to None, will process all features together.
+        max_workers: Maximum number of worker processes for running tiles. If set to
+            None, will use the number of processors. Set to 1 to run tiles in-process.
+            Ignored if `tile_feature_count` is None.
         log_level: Level to log the function at.
 
     Returns:
@@ -216,21 +1159,42 @@ def dissolve_features(
         dissolve_field_names,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
-    view = DatasetView(
-        dataset_path,
-        field_names=dissolve_field_names,
-        dataset_where_sql=dataset_where_sql,
-    )
-    with view:
-        # ArcPy2.8.0: Convert Path to str.
-        Dissolve(
-            in_features=view.name,
-            out_feature_class=str(output_path),
-            dissolve_field=dissolve_field_names,
-            multi_part=allow_multipart,
-            unsplit_lines=unsplit_lines,
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
+    if tile_feature_count:
+        dissolve_kwargs = {
+            "dissolve_field": dissolve_field_names,
+            "multi_part": allow_multipart,
+            "unsplit_lines": unsplit_lines,
+        }
+        # Features sharing values can land in different tiles; dissolve again.
+        _tiled_tool_run(
+            "Dissolve",
+            dataset_path=dataset_path,
+            dataset_where_sql=dataset_where_sql,
+            field_names=dissolve_field_names,
+            output_path=output_path,
+            tile_feature_count=tile_feature_count,
+            max_workers=max_workers,
+            tool_kwargs=dissolve_kwargs,
+            seam_dissolve_kwargs=dissolve_kwargs,
+        )
+    else:
+        view = DatasetView(
+            dataset_path,
+            field_names=dissolve_field_names,
+            dataset_where_sql=dataset_where_sql,
         )
+        with view:
+            # ArcPy2.8.0: Convert Path to str.
+            Dissolve(
+                in_features=view.name,
+                out_feature_class=str(output_path),
+                dissolve_field=dissolve_field_names,
+                multi_part=allow_multipart,
+                unsplit_lines=unsplit_lines,
+            )
+        FEATURE_COUNT_CACHE.invalidate(output_path)
+        METADATA_CACHE.invalidate(output_path)
     if all_fields_in_output:
         for _field in Dataset(dataset_path).user_fields:
             # Cannot add a non-nullable field to existing features.
@@ -241,7 +1205,7 @@ def dissolve_features(
                 log_level=DEBUG,
                 **_field.field_as_dict,
             )
-    states["in output"] = dataset_feature_count(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Dissolve.")
     return states
@@ -254,6 +1218,8 @@ def erase_features(
     dataset_where_sql: Optional[str] = None,
     erase_where_sql: Optional[str] = None,
     output_path: Union[Path, str],
+    tile_feature_count: Optional[int] = None,
+    max_workers: Optional[int] = None,
     log_level: int = INFO,
 ) -> Counter:
     """Erase feature geometries where it overlaps erase-dataset geometries.
@@ -264,6 +1230,11 @@ def erase_features(
         dataset_where_sql: SQL where-clause for dataset subselection.
         erase_where_sql: SQL where-clause for erase-dataset subselection.
         output_path: Path to output dataset.
+        tile_feature_count: Maximum number of features to process together, in
+            quadtree tiles. If set to None, will process all features together.
+        max_workers: Maximum number of worker processes for running tiles. If set to
+            None, will use the number of processors. Set to 1 to run tiles in-process.
+            Ignored if `tile_feature_count` is None.
         log_level: Level to log the function at.
 
     Returns:
@@ -279,19 +1250,33 @@ def erase_features(
         erase_path,
     )
     states = Counter()
-    states["in original dataset"] = dataset_feature_count(dataset_path)
-    view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
-    erase_view = DatasetView(
-        erase_path, field_names=[], dataset_where_sql=erase_where_sql
-    )
-    with view, erase_view:
-        # ArcPy2.8.0: Convert Path to str.
-        Erase(
-            in_features=view.name,
-            erase_features=erase_view.name,
-            out_feature_class=str(output_path),
+    states["in original dataset"] = dataset_feature_count(dataset_path, refresh=True)
+    if tile_feature_count:
+        _tiled_tool_run(
+            "Erase",
+            dataset_path=dataset_path,
+            dataset_where_sql=dataset_where_sql,
+            view_paths={"erase_features": (erase_path, erase_where_sql)},
+            output_path=output_path,
+            tile_feature_count=tile_feature_count,
+            max_workers=max_workers,
+            tool_kwargs={},
+        )
+    else:
+        view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
+        erase_view = DatasetView(
+            erase_path, field_names=[], dataset_where_sql=erase_where_sql
         )
-    states["in output"] = dataset_feature_count(output_path)
+        with view, erase_view:
+            # ArcPy2.8.0: Convert Path to str.
+            Erase(
+                in_features=view.name,
+                erase_features=erase_view.name,
+                out_feature_class=str(output_path),
+            )
+        FEATURE_COUNT_CACHE.invalidate(output_path)
+        METADATA_CACHE.invalidate(output_path)
+    states["in output"] = dataset_feature_count(output_path, refresh=True)
     log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Erase.")
     return states
@@ -307,9 +1292,18 @@ def nearest_features(
     near_where_sql: Optional[str] = None,
     max_distance: Optional[Union[float, int]] = None,
     near_rank: int = 1,
+    all_ranks: bool = False,
+    in_memory: bool = False,
+    exact_geometry: bool = True,
 ) -> Iterator[Dict[str, Any]]:
     """Generate info dictionaries for relationship with Nth-nearest near-feature.
 
+    Notes:
+        In-memory search measures from dataset feature centroids, so is best suited to
+            point datasets.
+        If the near-dataset is the dataset, a feature is never its own near-feature,
+            in either search.
+
     Args:
         dataset_path: Path to dataset.
         id_field_name: Name of dataset ID field.
@@ -320,18 +1314,72 @@ def nearest_features(
         max_distance: Maximum distance to search for near-features, in units of the
             dataset.
         near_rank: Nearness rank of the feature to map info for (Nth-nearest).
+        all_ranks: Generate info for every rank from 1 to `near_rank` if True.
+        in_memory: Search with an in-memory nearest-neighbor index if True, instead of
+            generating a near-table.
+        exact_geometry: Measure in-memory distances to near-feature geometry if True,
+            otherwise to near-feature centroids. Ignored if `in_memory` is False.
 
     Yields:
         Nearest feature details.
         Keys:
             * dataset_id
             * near_id
+            * near_rank
             * angle: Angle from dataset feature & near-feature, in decimal degrees.
             * distance: Distance between feature & near-feature, in units of the
                 dataset.
     """
     dataset_path = Path(dataset_path)
     near_path = Path(near_path)
+    if in_memory:
+        # Like a near-table, skip self-matches: index on OID to tell them apart.
+        self_near = near_path == dataset_path
+        index = NearestNeighborIndex.from_dataset(
+            near_path,
+            id_field_name="OID@" if self_near else near_id_field_name,
+            dataset_where_sql=near_where_sql,
+            spatial_reference_item=dataset_path,
+            exact_geometry=exact_geometry,
+        )
+        if self_near:
+            near_oid_id_map = dict(
+                features_as_tuples(
+                    near_path,
+                    field_names=["OID@", near_id_field_name],
+                    dataset_where_sql=near_where_sql,
+                )
+            )
+        for oid, dataset_id, coordinates in features_as_tuples(
+            dataset_path,
+            field_names=["OID@", id_field_name, "SHAPE@XY"],
+            dataset_where_sql=dataset_where_sql,
+        ):
+            if coordinates is None:
+                continue
+
+            nears = [
+                near
+                for near in index.nearest(
+                    *coordinates, k=near_rank + self_near, max_distance=max_distance
+                )
+                if not (self_near and near["near_id"] == oid)
+            ][:near_rank]
+            for rank, near in enumerate(nears, start=1):
+                if all_ranks or rank == near_rank:
+                    yield dict(
+                        near,
+                        dataset_id=dataset_id,
+                        near_id=(
+                            near_oid_id_map[near["near_id"]]
+                            if self_near
+                            else near["near_id"]
+                        ),
+                        near_rank=rank,
+                    )
+
+        return
+
     view = DatasetView(dataset_path, dataset_where_sql=dataset_where_sql)
     near_view = DatasetView(near_path, dataset_where_sql=near_where_sql)
     with view, near_view:
@@ -352,15 +1400,22 @@ def nearest_features(
         near_oid_id_map = dict(
             features_as_tuples(near_view.name, field_names=["OID@", near_id_field_name])
         )
+    field_names = ["IN_FID", "NEAR_FID", "NEAR_ANGLE", "NEAR_DIST"]
+    if near_rank == 1:
+        rank_where_sql = None
+    else:
+        field_names.append("NEAR_RANK")
+        rank_where_sql = (
+            f"NEAR_RANK <= {near_rank}" if all_ranks else f"NEAR_RANK = {near_rank}"
+        )
     _features = features_as_dicts(
-        temp_near_path,
-        field_names=["IN_FID", "NEAR_FID", "NEAR_ANGLE", "NEAR_DIST"],
-        dataset_where_sql=f"NEAR_RANK = {near_rank}" if near_rank != 1 else None,
+        temp_near_path, field_names=field_names, dataset_where_sql=rank_where_sql
     )
     for feature in _features:
         yield {
             "dataset_id": oid_id_map[feature["IN_FID"]],
             "near_id": near_oid_id_map[feature["NEAR_FID"]],
+            "near_rank": feature.get("NEAR_RANK", 1),
             "angle": feature["NEAR_ANGLE"],
             "distance": feature["NEAR_DIST"],
         }
@@ -0,0 +1,322 @@
+"""Network topology diagnostic operations."""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from logging import DEBUG, INFO, Logger, getLogger
+from math import floor, hypot, isclose
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy
+from arcpy import SetLogHistory
+
+from arcproc.dataset import create_dataset
+from arcproc.features import insert_features_from_sequences
+from arcproc.metadata import SpatialReferenceSourceItem
+from arcproc.misc import log_entity_states
+from arcproc.network import NodeGraph
+
+
+LOG: Logger = getLogger(__name__)
+"""Module-level logger."""
+
+SetLogHistory(False)
+
+TOPOLOGY_ERROR_FIELDS: List[Dict[str, Any]] = [
+    {"name": "error_type", "type": "TEXT", "length": 32},
+    {"name": "feature_ids", "type": "TEXT", "length": 255},
+    {"name": "component_id", "type": "LONG"},
+]
+"""Field metadata for topology error output datasets."""
+
+
+@dataclass(eq=False)
+class TopologyReport:
+    """Representation of network topology diagnostics."""
+
+    node_graph: NodeGraph
+    """Node graph diagnostics were run over."""
+    near_miss_tolerance: float
+    """Distance within which distinct nodes are reported as near-misses."""
+
+    node_components: numpy.ndarray = field(init=False)
+    """Connected component ID for each node."""
+    dangle_nodes: numpy.ndarray = field(init=False)
+    """Indices of nodes with only one feature end (dangling endpoints)."""
+    pseudo_nodes: numpy.ndarray = field(init=False)
+    """Indices of nodes joining exactly two distinct features (pseudo-nodes)."""
+    near_miss_node_pairs: numpy.ndarray = field(init=False)
+    """Pairs of distinct node indices within near-miss tolerance, as (count, 2).
+
+    At least one node in each pair is a dangle, & no feature joins the pair: nodes
+    on a short feature or both on a well-connected junction are not near-misses.
+    """
+    duplicate_feature_groups: List[List[int]] = field(init=False)
+    """Groups of feature indices with the same end nodes & length."""
+
+    def __post_init__(self) -> None:
+        graph = self.node_graph
+        from_nodes = graph.feature_from_nodes
+        to_nodes = graph.feature_to_nodes
+        self.node_components = _union_find_components(
+            from_nodes, to_nodes, graph.node_count
+        )
+        # Loop features add two ends to the same node.
+        end_counts = numpy.bincount(
+            from_nodes, minlength=graph.node_count
+        ) + numpy.bincount(to_nodes, minlength=graph.node_count)
+        self.dangle_nodes = numpy.flatnonzero(end_counts == 1)
+        self.pseudo_nodes = numpy.flatnonzero(
+            (end_counts == 2) & (graph.node_feature_counts() == 2)
+        )
+        node_pair_features = defaultdict(list)
+        for i, node_pair in enumerate(
+            zip(
+                numpy.minimum(from_nodes, to_nodes), numpy.maximum(from_nodes, to_nodes)
+            )
+        ):
+            node_pair_features[tuple(node_pair)].append(i)
+        near_node_pairs = _near_node_pairs(
+            graph.node_coordinates, self.near_miss_tolerance
+        )
+        is_dangle = end_counts == 1
+        self.near_miss_node_pairs = near_node_pairs[
+            (is_dangle[near_node_pairs[:, 0]] | is_dangle[near_node_pairs[:, 1]])
+            & numpy.array(
+                [
+                    (min(pair), max(pair)) not in node_pair_features
+                    for pair in near_node_pairs.tolist()
+                ],
+                dtype=bool,
+            ).reshape(-1)
+        ]
+        self.duplicate_feature_groups = []
+        for feature_indices in node_pair_features.values():
+            if len(feature_indices) < 2:
+                continue
+
+            groups = []
+            for i in feature_indices:
+                length = graph.feature_lengths[i]
+                for group in groups:
+                    if isclose(
+                        length,
+                        graph.feature_lengths[group[0]],
+                        abs_tol=graph.tolerance,
+                    ):
+                        group.append(i)
+                        break
+
+                else:
+                    groups.append([i])
+            self.duplicate_feature_groups.extend(
+                group for group in groups if len(group) > 1
+            )
+
+    @property
+    def component_count(self) -> int:
+        """Number of connected components in network."""
+        return len(numpy.unique(self.node_components))
+
+    @property
+    def error_counts(self) -> Dict[str, int]:
+        """Mapping of error type to count."""
+        return {
+            "dangle": len(self.dangle_nodes),
+            "duplicate segment": len(self.duplicate_feature_groups),
+            "near-miss": len(self.near_miss_node_pairs),
+            "pseudo-node": len(self.pseudo_nodes),
+        }
+
+    @property
+    def feature_components(self) -> numpy.ndarray:
+        """Connected component ID for each feature."""
+        return self.node_components[self.node_graph.feature_from_nodes]
+
+    def error_rows(self) -> List[Tuple[Any]]:
+        """Return topology errors as rows for an error dataset.
+
+        Rows are (error type, feature IDs, component ID, (x, y)), with the point at the
+        node of the error (for duplicate segments, the first segment's from-node).
+        """
+        graph = self.node_graph
+        rows = []
+
+        def node_feature_ids(node_index: int) -> str:
+            """Return IDs of features incident to node, as text."""
+            feature_indices = set(graph.from_feature_indices(node_index).tolist())
+            feature_indices.update(graph.to_feature_indices(node_index).tolist())
+            return _ids_text(graph.feature_ids[i] for i in sorted(feature_indices))
+
+        for error_type, node_indices in [
+            ("dangle", self.dangle_nodes),
+            ("pseudo-node", self.pseudo_nodes),
+        ]:
+            for node_index in node_indices.tolist():
+                rows.append(
+                    (
+                        error_type,
+                        node_feature_ids(node_index),
+                        int(self.node_components[node_index]),
+                        tuple(graph.node_coordinates[node_index].tolist()),
+                    )
+                )
+        for node_index, other_node_index in self.near_miss_node_pairs.tolist():
+            rows.append(
+                (
+                    "near-miss",
+                    _ids_text(
+                        [
+                            node_feature_ids(node_index),
+                            node_feature_ids(other_node_index),
+                        ]
+                    ),
+                    int(self.node_components[node_index]),
+                    tuple(graph.node_coordinates[node_index].tolist()),
+                )
+            )
+        for feature_indices in self.duplicate_feature_groups:
+            node_index = int(graph.feature_from_nodes[feature_indices[0]])
+            rows.append(
+                (
+                    "duplicate segment",
+                    _ids_text(graph.feature_ids[i] for i in feature_indices),
+                    int(self.node_components[node_index]),
+                    tuple(graph.node_coordinates[node_index].tolist()),
+                )
+            )
+        return rows
+
+
+def _ids_text(ids: Iterable[Any]) -> str:
+    """Return IDs as comma-separated text, truncated to fit error dataset field.
+
+    Args:
+        ids: IDs to represent. Single-value ID tuples are represented as the value.
+    """
+    text = ", ".join(
+        str(_id[0] if isinstance(_id, tuple) and len(_id) == 1 else _id) for _id in ids
+    )
+    length = TOPOLOGY_ERROR_FIELDS[1]["length"]
+    return text if len(text) <= length else text[: length - 3] + "..."
+
+
+def _near_node_pairs(coordinates: numpy.ndarray, tolerance: float) -> numpy.ndarray:
+    """Return pairs of node indices within tolerance of each other, via spatial hash.
+
+    Args:
+        coordinates: Coordinates for each node, as (node count, 2) array.
+        tolerance: Distance within which to pair nodes.
+    """
+    pairs = []
+    if tolerance > 0:
+        cell_node_indices = defaultdict(list)
+        for i, (x, y) in enumerate(coordinates.tolist()):
+            cell = (floor(x / tolerance), floor(y / tolerance))
+            for x_offset in (-1, 0, 1):
+                for y_offset in (-1, 0, 1):
+                    for j in cell_node_indices.get(
+                        (cell[0] + x_offset, cell[1] + y_offset), []
+                    ):
+                        other_x, other_y = coordinates[j].tolist()
+                        if hypot(x - other_x, y - other_y) <= tolerance:
+                            pairs.append((j, i))
+            cell_node_indices[cell].append(i)
+    return numpy.array(pairs, dtype=numpy.int64).reshape(-1, 2)
+
+
+def _union_find_components(
+    from_nodes: numpy.ndarray, to_nodes: numpy.ndarray, node_count: int
+) -> numpy.ndarray:
+    """Return connected component ID for each node, via union-find.
+
+    Component IDs are the lowest node index in each component.
+
+    Args:
+        from_nodes: From-node index for each feature.
+        to_nodes: To-node index for each feature.
+        node_count: Number of nodes.
+    """
+    parents = list(range(node_count))
+
+    def root(node_index: int) -> int:
+        """Return root node index for node, compressing path."""
+        while parents[node_index] != node_index:
+            parents[node_index] = parents[parents[node_index]]
+            node_index = parents[node_index]
+        return node_index
+
+    for from_node, to_node in zip(from_nodes.tolist(), to_nodes.tolist()):
+        from_root, to_root = root(from_node), root(to_node)
+        if from_root != to_root:
+            parents[max(from_root, to_root)] = min(from_root, to_root)
+    return numpy.array([root(i) for i in range(node_count)], dtype=numpy.int64)
+
+
+def network_topology_report(
+    dataset_path: Union[Path, str],
+    *,
+    id_field_names: Iterable[str] = ("OID@",),
+    dataset_where_sql: Optional[str] = None,
+    tolerance: float = 0.0,
+    near_miss_tolerance: float = 0.0,
+    spatial_reference_item: SpatialReferenceSourceItem = None,
+    output_path: Optional[Union[Path, str]] = None,
+    log_level: int = INFO,
+) -> TopologyReport:
+    """Return topology diagnostics for network line dataset.
+
+    Dataset is read once into a node graph; all checks run over that graph.
+
+    Args:
+        dataset_path: Path to dataset.
+        id_field_names: Names of the feature ID fields.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+        tolerance: Snap tolerance for merging endpoints into nodes, in dataset units.
+        near_miss_tolerance: Distance within which distinct nodes are reported as
+            near-misses, in dataset units. Only pairs with a dangle & no feature
+            joining them are reported. If set to 0, near-misses are not checked.
+        spatial_reference_item: Item from which the spatial reference for any geometry
+            properties will be set to. If set to None, will use spatial reference of
+            the dataset.
+        output_path: Path to output point dataset for topology errors. If set to None,
+            no output dataset will be created.
+        log_level: Level to log the function at.
+    """
+    dataset_path = Path(dataset_path)
+    LOG.log(log_level, "Start: Check network topology for `%s`.", dataset_path)
+    report = TopologyReport(
+        node_graph=NodeGraph.from_dataset(
+            dataset_path,
+            id_field_names=id_field_names,
+            dataset_where_sql=dataset_where_sql,
+            tolerance=tolerance,
+            spatial_reference_item=spatial_reference_item,
+        ),
+        near_miss_tolerance=near_miss_tolerance,
+    )
+    LOG.log(log_level, "%s connected components.", report.component_count)
+    log_entity_states(
+        "topology errors", report.error_counts, logger=LOG, log_level=log_level
+    )
+    if output_path:
+        output_path = Path(output_path)
+        create_dataset(
+            output_path,
+            field_metadata_list=TOPOLOGY_ERROR_FIELDS,
+            geometry_type="POINT",
+            spatial_reference_item=(
+                spatial_reference_item
+                if spatial_reference_item is not None
+                else dataset_path
+            ),
+            log_level=DEBUG,
+        )
+        insert_features_from_sequences(
+            output_path,
+            field_names=[_field["name"] for _field in TOPOLOGY_ERROR_FIELDS]
+            + ["SHAPE@XY"],
+            source_features=report.error_rows(),
+            log_level=DEBUG,
+        )
+    LOG.log(log_level, "End: Check.")
+    return report
@@ -1,24 +1,50 @@
 """Tracking operations."""
+import pickle
+from bisect import bisect_right
 from collections import Counter, defaultdict
 from datetime import date
 from datetime import datetime as _datetime
+from datetime import time
+from inspect import isgeneratorfunction
 from itertools import chain
 from logging import DEBUG, INFO, Logger, getLogger
 from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Optional, Union
+from tempfile import TemporaryFile
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from arcpy import SetLogHistory
-from arcpy.da import UpdateCursor
+from arcpy.da import InsertCursor, UpdateCursor
 
+from arcproc.dataset import dataset_signature
 from arcproc.features import (
     features_as_dicts,
     features_as_tuples,
-    insert_features_from_sequences,
     update_features_from_mappings,
 )
-from arcproc.metadata import Dataset
-from arcproc.misc import log_entity_states, same_value
+from arcproc.metadata import FEATURE_COUNT_CACHE, Dataset
+from arcproc.misc import (
+    freeze_values,
+    ids_where_sql,
+    log_entity_states,
+    same_feature,
+    same_value,
+    sql_value_literal,
+)
+from arcproc.profiling import profile_cursor
 from arcproc.workspace import Session
 
 
@@ -27,6 +53,579 @@ LOG: Logger = getLogger(__name__)
 
 SetLogHistory(False)
 
+# Py3.7: Can replace usage with `typing.Self` in Py3.11.
+TTrackingIndex = TypeVar("TTrackingIndex", bound="TrackingIndex")
+"""Type variable to enable method return of self on TrackingIndex."""
+
+
+class TrackingIndex:
+    """Interval index of tracking dataset values, for point-in-time queries.
+
+    Rows for each ID are held in arrays sorted by initiated date, so as-of lookups are
+    a binary search per ID.
+    """
+
+    cache_path: Optional[Path]
+    """Path to on-disk cache of index. If None, index is not cached."""
+    dataset_path: Path
+    """Path to tracking dataset."""
+    date_expired_field_name: str
+    """Name of tracking-row-expired date field."""
+    date_initiated_field_name: str
+    """Name of tracking-row-inititated date field."""
+    field_name: str
+    """Name of field with tracked attribute."""
+    id_field_names: List[str]
+    """Names of the feature ID fields."""
+    signature: Tuple[Any]
+    """Signature of tracking dataset when index was loaded."""
+
+    def __init__(
+        self,
+        dataset_path: Union[Path, str],
+        *,
+        field_name: str,
+        id_field_names: Iterable[str],
+        date_initiated_field_name: str = "date_initiated",
+        date_expired_field_name: str = "date_expired",
+        cache_path: Optional[Union[Path, str]] = None,
+    ) -> None:
+        """Initialize instance.
+
+        Args:
+            dataset_path: Path to tracking dataset.
+            field_name: Name of field with tracked attribute.
+            id_field_names: Names of the feature ID fields.
+            date_initiated_field_name: Name of tracking-row-inititated date field.
+            date_expired_field_name: Name of tracking-row-expired date field.
+            cache_path: Path to on-disk cache of index. Cache is reused if the dataset
+                signature is unchanged, rebuilt otherwise. If set to None, index will
+                not be cached.
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.dataset_path = Path(dataset_path)
+        self.date_expired_field_name = date_expired_field_name
+        self.date_initiated_field_name = date_initiated_field_name
+        self.field_name = field_name
+        self.id_field_names = list(id_field_names)
+        self._id_intervals: Dict[
+            Tuple[Any], Tuple[List[_datetime], List[Optional[_datetime]], List[Any]]
+        ] = {}
+        self.signature = None
+        self.load()
+
+    @property
+    def _cache_key(self) -> Tuple[Any]:
+        """Key identifying the dataset & fields the index covers."""
+        return (
+            str(self.dataset_path),
+            self.field_name,
+            tuple(self.id_field_names),
+            self.date_initiated_field_name,
+            self.date_expired_field_name,
+        )
+
+    @property
+    def ids(self) -> List[Tuple[Any]]:
+        """IDs in index."""
+        return list(self._id_intervals)
+
+    def _build(self) -> None:
+        """Build index from tracking dataset."""
+        id_rows = defaultdict(list)
+        for row in features_as_tuples(
+            self.dataset_path,
+            field_names=self.id_field_names
+            + [
+                self.date_initiated_field_name,
+                self.date_expired_field_name,
+                self.field_name,
+            ],
+        ):
+            # Rows without an initiated date cannot be placed in time.
+            if row[-3] is None:
+                continue
+
+            id_rows[tuple(row[:-3])].append(row[-3:])
+        self._id_intervals = {}
+        for _id, rows in id_rows.items():
+            rows.sort(key=itemgetter(0))
+            self._id_intervals[_id] = tuple(list(values) for values in zip(*rows))
+
+    def _interval_index(self, _id: Tuple[Any], as_of_date: _datetime) -> Optional[int]:
+        """Return index of the row for ID active at the given date.
+
+        Args:
+            _id: Feature ID.
+            as_of_date: Date to find active row at.
+
+        Returns:
+            Index of active row in ID arrays. None if no row active at date.
+        """
+        if _id not in self._id_intervals:
+            return None
+
+        date_initiated, date_expired, _ = self._id_intervals[_id]
+        i = bisect_right(date_initiated, as_of_date) - 1
+        if i < 0 or (date_expired[i] is not None and date_expired[i] <= as_of_date):
+            return None
+
+        return i
+
+    def as_of(self, as_of_date: Union[date, _datetime]) -> Dict[Tuple[Any], Any]:
+        """Return mapping of ID to tracked value as of the given date.
+
+        IDs without a row active at the date are not included.
+
+        Args:
+            as_of_date: Date to find values at.
+        """
+        as_of_date = _as_datetime(as_of_date)
+        id_value = {}
+        for _id, (_, _, values) in self._id_intervals.items():
+            i = self._interval_index(_id, as_of_date)
+            if i is not None:
+                id_value[_id] = values[i]
+        return id_value
+
+    def changes_between(
+        self,
+        start_date: Union[date, _datetime],
+        end_date: Union[date, _datetime],
+    ) -> Dict[Tuple[Any], Tuple[Any, Any]]:
+        """Return mapping of ID to value change between the given dates.
+
+        Args:
+            start_date: Date to compare values from.
+            end_date: Date to compare values to.
+
+        Returns:
+            Mapping of ID to (start value, end value), for IDs with different values at
+            each date. Value is None if ID has no row active at the date.
+        """
+        start_date = _as_datetime(start_date)
+        end_date = _as_datetime(end_date)
+        id_change = {}
+        for _id, (_, _, values) in self._id_intervals.items():
+            start_i = self._interval_index(_id, start_date)
+            end_i = self._interval_index(_id, end_date)
+            if start_i == end_i:
+                continue
+
+            start_value = values[start_i] if start_i is not None else None
+            end_value = values[end_i] if end_i is not None else None
+            if not same_value(start_value, end_value):
+                id_change[_id] = (start_value, end_value)
+        return id_change
+
+    def history(
+        self, _id: Union[Sequence[Any], Any]
+    ) -> List[Tuple[_datetime, Optional[_datetime], Any]]:
+        """Return tracking history for ID.
+
+        Args:
+            _id: Feature ID. If id_field_names contains only one field, ID may be
+                provided as non-sequence single-value.
+
+        Returns:
+            Tracking rows for ID, as (date initiated, date expired, value), ordered by
+            date initiated.
+        """
+        if not isinstance(_id, Sequence) or isinstance(_id, str):
+            _id = (_id,)
+        if tuple(_id) not in self._id_intervals:
+            return []
+
+        return list(zip(*self._id_intervals[tuple(_id)]))
+
+    def load(self) -> TTrackingIndex:
+        """Load index from cache if current, otherwise build from tracking dataset.
+
+        Returns:
+            Reference to instance.
+        """
+        self.signature = dataset_signature(self.dataset_path)
+        if self.cache_path and self.cache_path.is_file():
+            with self.cache_path.open(mode="rb") as cachefile:
+                cache = pickle.load(cachefile)
+            if cache["key"] == self._cache_key and cache["signature"] == self.signature:
+                LOG.debug("Loaded tracking index from cache `%s`.", self.cache_path)
+                self._id_intervals = cache["id_intervals"]
+                return self
+
+        self._build()
+        if self.cache_path:
+            cache = {
+                "key": self._cache_key,
+                "signature": self.signature,
+                "id_intervals": self._id_intervals,
+            }
+            with self.cache_path.open(mode="wb") as cachefile:
+                pickle.dump(cache, cachefile, protocol=pickle.HIGHEST_PROTOCOL)
+        return self
+
+    def refresh(self) -> bool:
+        """Reload index if the tracking dataset has changed since loading.
+
+        Returns:
+            True if index was reloaded, False otherwise.
+        """
+        if dataset_signature(self.dataset_path) == self.signature:
+            return False
+
+        self.load()
+        return True
+
+    def value(
+        self, _id: Union[Sequence[Any], Any], as_of_date: Union[date, _datetime]
+    ) -> Any:
+        """Return tracked value for ID as of the given date.
+
+        Args:
+            _id: Feature ID. If id_field_names contains only one field, ID may be
+                provided as non-sequence single-value.
+            as_of_date: Date to find value at.
+
+        Returns:
+            Tracked value. None if ID has no row active at date.
+        """
+        if not isinstance(_id, Sequence) or isinstance(_id, str):
+            _id = (_id,)
+        i = self._interval_index(tuple(_id), _as_datetime(as_of_date))
+        return self._id_intervals[tuple(_id)][2][i] if i is not None else None
+
+
+def _as_datetime(value: Union[date, _datetime]) -> _datetime:
+    """Return date as datetime, at midnight if value has no time part.
+
+    Args:
+        value: Date to convert.
+    """
+    if not isinstance(value, _datetime):
+        value = _datetime.combine(value, time.min)
+    return value
+
+
+def _consolidated_rows(
+    rows: Iterable[Dict[str, Any]],
+    *,
+    field_name: str,
+    date_initiated_field_name: str,
+    date_expired_field_name: str,
+) -> List[Dict[str, Any]]:
+    """Return tracking rows for a single ID, consolidated where value does not change.
+
+    Args:
+        rows: Tracking rows for the ID, as dictionaries. The surviving row of each
+            consolidated run is altered in-place.
+        field_name: Name of field with tracked attribute.
+        date_initiated_field_name: Name of tracking-row-inititated date field.
+        date_expired_field_name: Name of tracking-row-expired date field.
+    """
+    rows = sorted(rows, key=itemgetter(date_initiated_field_name))
+    for i, row in enumerate(rows):
+        if i == 0 or row[date_initiated_field_name] is None:
+            continue
+
+        date_initiated = row[date_initiated_field_name]
+        value = row[field_name]
+        previous_row = rows[i - 1]
+        previous_value = previous_row[field_name]
+        previous_date_expired = previous_row[date_expired_field_name]
+        if same_value(value, previous_value) and same_value(
+            date_initiated, previous_date_expired
+        ):
+            # Move previous row date initiated to current row & clear from previous.
+            row[date_initiated_field_name] = previous_row[date_initiated_field_name]
+            previous_row[date_initiated_field_name] = None
+    return [row for row in rows if row[date_initiated_field_name] is not None]
+
+
+def _id_sort_key(_id: Tuple[Any]) -> Tuple[Tuple[bool, Any]]:
+    """Return sort key for ID, ordering nulls first.
+
+    Args:
+        _id: Feature ID.
+    """
+    return tuple((value is not None, value) for value in _id)
+
+
+def _ids_ordered(
+    dataset_path: Path,
+    *,
+    id_field_names: List[str],
+    dataset_where_sql: Optional[str] = None,
+) -> bool:
+    """Return True if dataset rows ordered by ID in the database are in Python order.
+
+    Only the ID fields are read, so this is a light, read-only pass over the dataset.
+
+    Args:
+        dataset_path: Path to dataset.
+        id_field_names: Names of the feature ID fields.
+        dataset_where_sql: SQL where-clause for dataset subselection.
+    """
+    previous_key = None
+    for _id in features_as_tuples(
+        dataset_path,
+        field_names=id_field_names,
+        dataset_where_sql=dataset_where_sql,
+        order_by_field_names=id_field_names,
+    ):
+        key = _id_sort_key(_id)
+        if previous_key is not None and key < previous_key:
+            return False
+
+        previous_key = key
+    return True
+
+
+def _ordered_id_rows(
+    rows: Iterable[Sequence[Any]], *, id_length: int, dataset_path: Path
+) -> Iterator[Tuple[Any]]:
+    """Generate rows with unique IDs, checking that rows are ordered by ID.
+
+    If consecutive rows share an ID, only the last is generated.
+
+    Args:
+        rows: Rows ordered by ID, with ID values at the start of each.
+        id_length: Number of ID values in each row.
+        dataset_path: Path to dataset rows are from (for error messages).
+
+    Raises:
+        RuntimeError: If rows are not ordered by ID.
+    """
+    previous_row = None
+    for row in rows:
+        row = tuple(row)
+        if previous_row is not None:
+            key = _id_sort_key(row[:id_length])
+            previous_key = _id_sort_key(previous_row[:id_length])
+            if key < previous_key:
+                raise RuntimeError(
+                    f"`{dataset_path}` rows not ordered by ID; database collation may"
+                    " differ from Python ordering (use stream_sorted=False)"
+                )
+
+            if key != previous_key:
+                yield previous_row
+
+        previous_row = row
+    if previous_row is not None:
+        yield previous_row
+
+
+def _spilled_rows(spillfile: BinaryIO) -> Iterator[Tuple[Any]]:
+    """Generate rows from batches spilled to a file.
+
+    Args:
+        spillfile: File with pickled row batches.
+    """
+    spillfile.seek(0)
+    while True:
+        try:
+            batch = pickle.load(spillfile)
+        except EOFError:
+            break
+
+        yield from batch
+
+
+def _tracking_changes(
+    id_current_value: Dict[Tuple[Any], Any],
+    id_cmp_value: Dict[Tuple[Any], Any],
+    *,
+    cmp_date: Union[date, _datetime],
+) -> Tuple[Set[Tuple[Any]], Set[Tuple[Any]], List[Tuple[Any]]]:
+    """Return tracking changes between current & comparison values.
+
+    Args:
+        id_current_value: Mapping of ID to current tracked value.
+        id_cmp_value: Mapping of ID to comparison value.
+        cmp_date: Date to mark comparison change.
+
+    Returns:
+        IDs with changed values, IDs no longer present in comparison, & new tracking
+        rows as (*ID, value, date initiated).
+    """
+    changed_ids = set()
+    expired_ids = {_id for _id in id_current_value if _id not in id_cmp_value}
+    new_rows = []
+    for _id, value in id_cmp_value.items():
+        if _id not in id_current_value:
+            new_rows.append(_id + (value, cmp_date))
+        elif not same_value(value, id_current_value[_id]):
+            changed_ids.add(_id)
+            new_rows.append(_id + (value, cmp_date))
+    return changed_ids, expired_ids, new_rows
+
+
+def _tracking_ids_changed_since(
+    dataset_path: Path,
+    *,
+    id_field_names: List[str],
+    changed_since: _datetime,
+    date_initiated_field_name: str,
+    date_expired_field_name: str,
+) -> Set[Tuple[Any]]:
+    """Return IDs for tracking rows initiated or expired on or after the given date.
+
+    Rows are filtered in the database by a where-clause on the date fields, so the
+    pass reads only changed rows. If the workspace has no supported date literal (see
+    `sql_value_literal`), the ID & date fields for all rows are read & filtered here.
+
+    Args:
+        dataset_path: Path to tracking dataset.
+        id_field_names: Names of the feature ID fields.
+        changed_since: Date to find changes on or after.
+        date_initiated_field_name: Name of tracking-row-inititated date field.
+        date_expired_field_name: Name of tracking-row-expired date field.
+    """
+    try:
+        changed_since_literal = sql_value_literal(
+            changed_since, dataset_path=dataset_path
+        )
+    except ValueError:
+        dataset_where_sql = None
+    else:
+        dataset_where_sql = (
+            f"{date_initiated_field_name} >= {changed_since_literal}"
+            f" OR {date_expired_field_name} >= {changed_since_literal}"
+        )
+    ids = set()
+    for row in features_as_tuples(
+        dataset_path,
+        field_names=id_field_names
+        + [date_initiated_field_name, date_expired_field_name],
+        dataset_where_sql=dataset_where_sql,
+    ):
+        if dataset_where_sql or any(
+            _date is not None and _date >= changed_since for _date in row[-2:]
+        ):
+            ids.add(tuple(row[:-2]))
+    return ids
+
+
+def _update_tracking_rows_streamed(
+    dataset_path: Path,
+    *,
+    field_name: str,
+    id_field_names: List[str],
+    cmp_dataset_path: Path,
+    cmp_field_name: str,
+    cmp_id_field_names: List[str],
+    cmp_date: Union[date, _datetime],
+    date_initiated_field_name: str,
+    date_expired_field_name: str,
+    batch_size: int,
+    use_edit_session: bool,
+) -> Counter:
+    """Update tracking rows from comparison dataset in a single sorted merge pass.
+
+    Check both datasets are in ID order (see `_ids_ordered`) before calling: an order
+    error found mid-merge is only rolled back inside an edit session.
+
+    Args:
+        dataset_path: Path to tracking dataset.
+        field_name: Name of field with tracked attribute.
+        id_field_names: Names of the feature ID fields.
+        cmp_dataset_path: Path to comparison dataset.
+        cmp_field_name: Name of field with tracked attribute in comparison dataset.
+        cmp_id_field_names: Names of the feature ID fields in comparison dataset.
+        cmp_date: Date to mark comparison change.
+        date_initiated_field_name: Name of tracking-row-inititated date field.
+        date_expired_field_name: Name of tracking-row-expired date field.
+        batch_size: Number of new rows to hold in memory before spilling.
+        use_edit_session: True if edits are to be made in an edit session.
+
+    Returns:
+        Feature counts for each update-state.
+    """
+    id_length = len(id_field_names)
+    cmp_rows = _ordered_id_rows(
+        features_as_tuples(
+            cmp_dataset_path,
+            field_names=cmp_id_field_names + [cmp_field_name],
+            order_by_field_names=cmp_id_field_names,
+        ),
+        id_length=id_length,
+        dataset_path=cmp_dataset_path,
+    )
+    cmp_row = next(cmp_rows, None)
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert Path to str.
+            in_table=str(dataset_path),
+            field_names=id_field_names + [field_name, date_expired_field_name],
+            where_clause=f"{date_expired_field_name} IS NULL",
+            sql_clause=(None, f"ORDER BY {', '.join(id_field_names)}"),
+        ),
+        dataset_path=dataset_path,
+        where_sql=f"{date_expired_field_name} IS NULL",
+    )
+    session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
+    states = Counter()
+    new_rows = []
+    with TemporaryFile() as spillfile:
+
+        def add_new_row(row: Tuple[Any]) -> None:
+            """Add new row, spilling batch to file if full."""
+            new_rows.append(row + (cmp_date,))
+            if len(new_rows) >= batch_size:
+                pickle.dump(new_rows, spillfile, protocol=pickle.HIGHEST_PROTOCOL)
+                new_rows.clear()
+
+        # Updates & inserts share one session, so an edit session can roll back both.
+        with session:
+            with cursor:
+                previous_key = None
+                for row in cursor:
+                    _id = tuple(row[:id_length])
+                    key = _id_sort_key(_id)
+                    if previous_key is not None and key < previous_key:
+                        raise RuntimeError(
+                            f"`{dataset_path}` rows not ordered by ID; database collation"
+                            " may differ from Python ordering (use stream_sorted=False)"
+                        )
+
+                    previous_key = key
+                    # Comparison IDs before current ID are not in tracking dataset: new.
+                    while cmp_row is not None and _id_sort_key(cmp_row[:-1]) < key:
+                        add_new_row(cmp_row)
+                        cmp_row = next(cmp_rows, None)
+                    if cmp_row is not None and _id_sort_key(cmp_row[:-1]) == key:
+                        if same_value(cmp_row[-1], row[-2]):
+                            states["unchanged"] += 1
+                        else:
+                            cursor.updateRow(_id + (row[-2], cmp_date))
+                            states["changed"] += 1
+                            add_new_row(cmp_row)
+                        cmp_row = next(cmp_rows, None)
+                    else:
+                        cursor.updateRow(_id + (row[-2], cmp_date))
+                        states["expired"] += 1
+            while cmp_row is not None:
+                add_new_row(cmp_row)
+                cmp_row = next(cmp_rows, None)
+            if new_rows:
+                pickle.dump(new_rows, spillfile, protocol=pickle.HIGHEST_PROTOCOL)
+                new_rows.clear()
+            insert_cursor = profile_cursor(
+                InsertCursor(
+                    # ArcPy2.8.0: Convert Path to str.
+                    in_table=str(dataset_path),
+                    field_names=id_field_names
+                    + [field_name, date_initiated_field_name],
+                ),
+                dataset_path=dataset_path,
+            )
+            with insert_cursor:
+                for new_row in _spilled_rows(spillfile):
+                    insert_cursor.insertRow(new_row)
+                    states["inserted"] += 1
+    FEATURE_COUNT_CACHE.adjust(dataset_path, states["inserted"])
+    return states
+
 
 def consolidate_tracking_rows(
     dataset_path: Union[Path, str],
@@ -35,6 +634,8 @@ def consolidate_tracking_rows(
     id_field_names: Iterable[str],
     date_initiated_field_name: str = "date_initiated",
     date_expired_field_name: str = "date_expired",
+    ids: Optional[Iterable[Union[Sequence[Any], Any]]] = None,
+    changed_since: Optional[Union[date, _datetime]] = None,
     use_edit_session: bool = False,
     log_level: int = INFO,
 ) -> Counter:
@@ -42,12 +643,20 @@ def consolidate_tracking_rows(
 
     Useful for quick-loaded point-in-time values, or for processing hand-altered rows.
 
+    If `ids` or `changed_since` are given, consolidation is incremental: only the
+    history for those IDs is read (subselected by where-clause), and only rows that
+    actually merge are written. Otherwise the whole dataset is consolidated.
+
     Args:
         dataset_path: Path to tracking dataset.
         field_name: Name of field with tracked attribute.
         id_field_names: Names of the feature ID fields.
         date_initiated_field_name: Name of tracking-row-inititated date field.
         date_expired_field_name: Name of tracking-row-expired date field.
+        ids: ID sequences for features to consolidate. If id_field_names contains only
+            one field, IDs may be provided as non-sequence single-value.
+        changed_since: Consolidate features with rows initiated or expired on or after
+            this date.
         use_edit_session: True if edits are to be made in an edit session.
         log_level: Level to log the function at.
 
@@ -62,39 +671,94 @@ def consolidate_tracking_rows(
         date_expired_field_name,
         field_name,
     ]
-    id_rows = defaultdict(list)
-    for row in features_as_dicts(dataset_path, field_names=field_names):
-        _id = tuple(row[name] for name in id_field_names)
-        id_rows[_id].append(row)
-    for _id in list(id_rows):
-        rows = sorted(id_rows[_id], key=itemgetter(date_initiated_field_name))
-        for i, row in enumerate(rows):
-            if i == 0 or row[date_initiated_field_name] is None:
-                continue
+    kwargs = {
+        "field_name": field_name,
+        "date_initiated_field_name": date_initiated_field_name,
+        "date_expired_field_name": date_expired_field_name,
+    }
+    if ids is None and changed_since is None:
+        id_rows = defaultdict(list)
+        for row in features_as_dicts(dataset_path, field_names=field_names):
+            _id = tuple(row[name] for name in id_field_names)
+            id_rows[_id].append(row)
+        states = update_features_from_mappings(
+            dataset_path,
+            field_names=field_names,
+            # In tracking dataset, ID is ID + date_initiated.
+            id_field_names=id_field_names + [date_initiated_field_name],
+            source_features=chain.from_iterable(
+                _consolidated_rows(rows, **kwargs) for rows in id_rows.values()
+            ),
+            use_edit_session=use_edit_session,
+            log_level=DEBUG,
+        )
+        log_entity_states("tracking rows", states, logger=LOG, log_level=log_level)
+        LOG.log(log_level, "End: Consolidate.")
+        return states
 
-            date_initiated = row[date_initiated_field_name]
-            value = row[field_name]
-            previous_row = rows[i - 1]
-            previous_value = previous_row[field_name]
-            previous_date_expired = previous_row[date_expired_field_name]
-            if same_value(value, previous_value) and same_value(
-                date_initiated, previous_date_expired
-            ):
-                # Move previous row date initiated to current row & clear from previous.
-                row[date_initiated_field_name] = previous_row[date_initiated_field_name]
-                previous_row[date_initiated_field_name] = None
-        id_rows[_id] = [
-            row for row in rows if row[date_initiated_field_name] is not None
-        ]
-    states = update_features_from_mappings(
-        dataset_path,
-        field_names=field_names,
+    touched_ids = set()
+    if ids is not None:
+        if isgeneratorfunction(ids):
+            ids = ids()
+        for _id in ids:
+            if isinstance(_id, Iterable) and not isinstance(_id, str):
+                touched_ids.add(tuple(_id))
+            else:
+                touched_ids.add((_id,))
+    if changed_since is not None:
+        changed_since = _as_datetime(changed_since)
+        touched_ids.update(
+            _tracking_ids_changed_since(
+                dataset_path,
+                id_field_names=id_field_names,
+                changed_since=changed_since,
+                date_initiated_field_name=date_initiated_field_name,
+                date_expired_field_name=date_expired_field_name,
+            )
+        )
+    LOG.log(log_level, "Consolidating %s touched IDs.", len(touched_ids))
+    session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
+    states = Counter()
+    for where_sql in ids_where_sql(
+        id_field_names, touched_ids, dataset_path=dataset_path
+    ):
+        id_rows = defaultdict(list)
+        for row in features_as_dicts(
+            dataset_path, field_names=field_names, dataset_where_sql=where_sql
+        ):
+            _id = tuple(row[name] for name in id_field_names)
+            id_rows[_id].append(row)
         # In tracking dataset, ID is ID + date_initiated.
-        id_field_names=id_field_names + [date_initiated_field_name],
-        source_features=chain(*id_rows.values()),
-        use_edit_session=use_edit_session,
-        log_level=DEBUG,
-    )
+        key_row = {
+            _id + (row[date_initiated_field_name],): row
+            for _id, rows in id_rows.items()
+            for row in _consolidated_rows(rows, **kwargs)
+        }
+        cursor = profile_cursor(
+            UpdateCursor(
+                # ArcPy2.8.0: Convert Path to str.
+                in_table=str(dataset_path),
+                field_names=field_names,
+                where_clause=where_sql,
+            ),
+            dataset_path=dataset_path,
+            where_sql=where_sql,
+        )
+        with session, cursor:
+            for feature in cursor:
+                key = tuple(freeze_values(*feature[: len(id_field_names) + 1]))
+                if key not in key_row:
+                    cursor.deleteRow()
+                    states["deleted"] += 1
+                    continue
+
+                new_feature = [key_row[key][name] for name in field_names]
+                if same_feature(feature, new_feature):
+                    states["unchanged"] += 1
+                else:
+                    cursor.updateRow(new_feature)
+                    states["altered"] += 1
+    FEATURE_COUNT_CACHE.adjust(dataset_path, -states["deleted"])
     log_entity_states("tracking rows", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Consolidate.")
     return states
@@ -111,11 +775,20 @@ def update_tracking_rows(
     cmp_date: Optional[Union[date, _datetime]] = None,
     date_initiated_field_name: str = "date_initiated",
     date_expired_field_name: str = "date_expired",
+    stream_sorted: bool = False,
+    batch_size: int = 10_000,
     use_edit_session: bool = False,
     log_level: int = INFO,
 ) -> Counter:
     """Update tracking rows from comparison dataset.
 
+    If `stream_sorted` is True, both datasets are read ordered by ID & merged in a
+    single pass, with new rows spilled to a temporary file in batches. Memory use is
+    then flat regardless of dataset size. Streaming requires both datasets to support
+    ORDER BY (i.e. be in a database). IDs are checked in a read-only pass first; if
+    the database does not sort them the same as Python does, rows are read into memory
+    instead.
+
     Args:
         dataset_path: Path to tracking dataset.
         field_name: Name of field with tracked attribute.
@@ -129,6 +802,9 @@ def update_tracking_rows(
             of execution.
         date_initiated_field_name: Name of tracking-row-inititated date field.
         date_expired_field_name: Name of tracking-row-expired date field.
+        stream_sorted: Stream both datasets ordered by ID in a single merge pass if
+            True. Read both into memory if False.
+        batch_size: Number of new rows to hold in memory before spilling, if streaming.
         use_edit_session: True if edits are to be made in an edit session.
         log_level: Level to log the function at.
 
@@ -152,6 +828,38 @@ def update_tracking_rows(
     if cmp_date is None:
         cmp_date = date.today()
     current_where_sql = f"{date_expired_field_name} IS NULL"
+    # Check order before streaming: finding it out mid-merge would leave half-written
+    # tracking rows, with no rollback outside an edit session.
+    if stream_sorted and not (
+        _ids_ordered(
+            dataset_path,
+            id_field_names=id_field_names,
+            dataset_where_sql=current_where_sql,
+        )
+        and _ids_ordered(cmp_dataset_path, id_field_names=cmp_id_field_names)
+    ):
+        LOG.warning(
+            "Database ID order differs from Python order; not streaming tracking rows."
+        )
+        stream_sorted = False
+    if stream_sorted:
+        states = _update_tracking_rows_streamed(
+            dataset_path,
+            field_name=field_name,
+            id_field_names=id_field_names,
+            cmp_dataset_path=cmp_dataset_path,
+            cmp_field_name=cmp_field_name,
+            cmp_id_field_names=cmp_id_field_names,
+            cmp_date=cmp_date,
+            date_initiated_field_name=date_initiated_field_name,
+            date_expired_field_name=date_expired_field_name,
+            batch_size=batch_size,
+            use_edit_session=use_edit_session,
+        )
+        log_entity_states("features", states, logger=LOG, log_level=log_level)
+        LOG.log(log_level, "End: Update.")
+        return states
+
     id_current_value = {
         row[:-1]: row[-1]
         for row in features_as_tuples(
@@ -166,43 +874,265 @@ def update_tracking_rows(
             cmp_dataset_path, field_names=cmp_id_field_names + [cmp_field_name]
         )
     }
-    changed_ids = set()
-    expired_ids = {_id for _id in id_current_value if _id not in id_cmp_value}
-    new_rows = []
-    for _id, value in id_cmp_value.items():
-        if _id not in id_current_value:
-            new_rows.append(_id + (value, cmp_date))
-        elif not same_value(value, id_current_value[_id]):
-            changed_ids.add(_id)
-            new_rows.append(_id + (value, cmp_date))
-    # ArcPy2.8.0: Convert Path to str.
-    cursor = UpdateCursor(
-        in_table=str(dataset_path),
-        field_names=id_field_names + [field_name, date_expired_field_name],
-        where_clause=current_where_sql,
+    changed_ids, expired_ids, new_rows = _tracking_changes(
+        id_current_value, id_cmp_value, cmp_date=cmp_date
+    )
+    cursor = profile_cursor(
+        UpdateCursor(
+            # ArcPy2.8.0: Convert Path to str.
+            in_table=str(dataset_path),
+            field_names=id_field_names + [field_name, date_expired_field_name],
+            where_clause=current_where_sql,
+        ),
+        dataset_path=dataset_path,
+        where_sql=current_where_sql,
     )
     session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
     states = Counter()
-    with session, cursor:
-        for row in cursor:
-            _id = tuple(row[: len(id_field_names)])
-            if _id in changed_ids or _id in expired_ids:
-                cursor.updateRow(_id + (row[-2], cmp_date))
-            else:
-                states["unchanged"] += 1
+    # Updates & inserts share one session, so an edit session can roll back both.
+    with session:
+        with cursor:
+            for row in cursor:
+                _id = tuple(row[: len(id_field_names)])
+                if _id in changed_ids or _id in expired_ids:
+                    cursor.updateRow(_id + (row[-2], cmp_date))
+                else:
+                    states["unchanged"] += 1
+        insert_cursor = profile_cursor(
+            InsertCursor(
+                # ArcPy2.8.0: Convert Path to str.
+                in_table=str(dataset_path),
+                field_names=id_field_names + [field_name, date_initiated_field_name],
+            ),
+            dataset_path=dataset_path,
+        )
+        with insert_cursor:
+            for new_row in new_rows:
+                insert_cursor.insertRow(new_row)
     if changed_ids:
         states["changed"] = len(changed_ids)
     if expired_ids:
         states["expired"] = len(expired_ids)
-    states.update(
-        insert_features_from_sequences(
+    if new_rows:
+        states["inserted"] = len(new_rows)
+    FEATURE_COUNT_CACHE.adjust(dataset_path, len(new_rows))
+    log_entity_states("features", states, logger=LOG, log_level=log_level)
+    LOG.log(log_level, "End: Update.")
+    return states
+
+
+def update_tracking_rows_multi(
+    *,
+    tracked_fields: Iterable[Dict[str, Any]],
+    id_field_names: Iterable[str],
+    cmp_dataset_path: Union[Path, str],
+    cmp_id_field_names: Optional[Iterable[str]] = None,
+    cmp_date: Optional[Union[date, _datetime]] = None,
+    attribute_field_name: Optional[str] = None,
+    date_initiated_field_name: str = "date_initiated",
+    date_expired_field_name: str = "date_expired",
+    use_edit_session: bool = False,
+    log_level: int = INFO,
+) -> Dict[str, Counter]:
+    """Update tracking rows for multiple tracked fields from comparison dataset.
+
+    Comparison dataset is read once, & each tracking dataset is read once & written
+    with one update & one insert cursor in one session, no matter how many fields it
+    tracks.
+
+    Tracked field mappings have the following keys:
+        dataset_path: Path to tracking dataset.
+        field_name: Name of field with tracked attribute in tracking dataset.
+        cmp_field_name (optional): Name of field with tracked attribute in comparison
+            dataset. If not given, will assume same as field_name.
+        attribute (optional): Value in `attribute_field_name` identifying the tracked
+            attribute in a long-format tracking dataset. Also the key for the tracked
+            field in the returned states, so must be unique. If not given, will assume
+            same as cmp_field_name.
+
+    Args:
+        tracked_fields: Mappings describing each tracked field.
+        id_field_names: Names of the feature ID fields.
+        cmp_dataset_path: Path to comparison dataset.
+        cmp_id_field_names: Names of the feature ID fields in comparison dataset. If set
+            to None, will assume same as id_field_names.
+        cmp_date: Date to mark comparison change. If set to None, will set to the date
+            of execution.
+        attribute_field_name: Name of field identifying the tracked attribute, for
+            long-format tracking datasets shared by several tracked fields. If set to
+            None, each tracking dataset must track only one field.
+        date_initiated_field_name: Name of tracking-row-inititated date field.
+        date_expired_field_name: Name of tracking-row-expired date field.
+        use_edit_session: True if edits are to be made in an edit session.
+        log_level: Level to log the function at.
+
+    Returns:
+        Feature counts for each update-state, keyed by tracked field attribute.
+
+    Raises:
+        ValueError: If several tracked fields share a tracking dataset & no
+            `attribute_field_name` is given.
+        ValueError: If several tracked fields share an attribute.
+    """
+    cmp_dataset_path = Path(cmp_dataset_path)
+    LOG.log(
+        log_level,
+        "Start: Update tracking rows for multiple fields from `%s`.",
+        cmp_dataset_path,
+    )
+    id_field_names = list(id_field_names)
+    cmp_id_field_names = (
+        id_field_names if cmp_id_field_names is None else list(cmp_id_field_names)
+    )
+    if cmp_date is None:
+        cmp_date = date.today()
+    tracked_fields = [dict(tracked_field) for tracked_field in tracked_fields]
+    dataset_tracked_fields = defaultdict(list)
+    for tracked_field in tracked_fields:
+        tracked_field["dataset_path"] = Path(tracked_field["dataset_path"])
+        tracked_field.setdefault("cmp_field_name", tracked_field["field_name"])
+        tracked_field.setdefault("attribute", tracked_field["cmp_field_name"])
+        dataset_tracked_fields[tracked_field["dataset_path"]].append(tracked_field)
+    attribute_counts = Counter(
+        tracked_field["attribute"] for tracked_field in tracked_fields
+    )
+    for attribute, count in attribute_counts.items():
+        if count > 1:
+            raise ValueError(
+                f"Multiple tracked fields share attribute `{attribute}`: set a unique"
+                " `attribute` for each"
+            )
+
+    if attribute_field_name is None:
+        for dataset_path, _tracked_fields in dataset_tracked_fields.items():
+            if len(_tracked_fields) > 1:
+                raise ValueError(
+                    f"Multiple tracked fields share `{dataset_path}`: set"
+                    " `attribute_field_name` for long-format tracking datasets"
+                )
+
+    cmp_field_names = [
+        tracked_field["cmp_field_name"] for tracked_field in tracked_fields
+    ]
+    cmp_field_id_value = {name: {} for name in cmp_field_names}
+    for row in features_as_tuples(
+        cmp_dataset_path, field_names=cmp_id_field_names + cmp_field_names
+    ):
+        _id = tuple(row[: len(cmp_id_field_names)])
+        for name, value in zip(cmp_field_names, row[len(cmp_id_field_names) :]):
+            cmp_field_id_value[name][_id] = value
+    current_where_sql = f"{date_expired_field_name} IS NULL"
+    key_field_names = id_field_names + (
+        [attribute_field_name] if attribute_field_name else []
+    )
+    states = {}
+    for dataset_path, _tracked_fields in dataset_tracked_fields.items():
+        value_field_names = list(
+            {tracked_field["field_name"]: None for tracked_field in _tracked_fields}
+        )
+        attribute_tracked_field = {
+            tracked_field["attribute"]: tracked_field
+            for tracked_field in _tracked_fields
+        }
+        attribute_id_current_value = defaultdict(dict)
+        for row in features_as_dicts(
             dataset_path,
-            field_names=id_field_names + [field_name, date_initiated_field_name],
-            source_features=new_rows,
-            use_edit_session=use_edit_session,
-            log_level=DEBUG,
+            field_names=key_field_names + value_field_names,
+            dataset_where_sql=current_where_sql,
+        ):
+            if attribute_field_name:
+                attribute = row[attribute_field_name]
+                if attribute not in attribute_tracked_field:
+                    continue
+
+            else:
+                attribute = _tracked_fields[0]["attribute"]
+            field_name = attribute_tracked_field[attribute]["field_name"]
+            _id = tuple(row[name] for name in id_field_names)
+            attribute_id_current_value[attribute][_id] = row[field_name]
+        attribute_changes = {}
+        for attribute, tracked_field in attribute_tracked_field.items():
+            attribute_changes[attribute] = _tracking_changes(
+                attribute_id_current_value[attribute],
+                cmp_field_id_value[tracked_field["cmp_field_name"]],
+                cmp_date=cmp_date,
+            )
+            states[attribute] = Counter()
+        new_rows = []
+        for attribute, (_, _, _new_rows) in attribute_changes.items():
+            tracked_field = attribute_tracked_field[attribute]
+            # New row is (*ID, value, date initiated); value goes in its own field.
+            value_index = value_field_names.index(tracked_field["field_name"])
+            for _id, value, date_initiated in (
+                (row[:-2], row[-2], row[-1]) for row in _new_rows
+            ):
+                values = [None] * len(value_field_names)
+                values[value_index] = value
+                new_rows.append(
+                    _id
+                    + ((attribute,) if attribute_field_name else ())
+                    + tuple(values)
+                    + (date_initiated,)
+                )
+        cursor = profile_cursor(
+            UpdateCursor(
+                # ArcPy2.8.0: Convert Path to str.
+                in_table=str(dataset_path),
+                field_names=key_field_names + [date_expired_field_name],
+                where_clause=current_where_sql,
+            ),
+            dataset_path=dataset_path,
+            where_sql=current_where_sql,
+        )
+        session = Session(Dataset(dataset_path).workspace_path, use_edit_session)
+        # Updates & inserts share one session, so an edit session can roll back both.
+        with session:
+            with cursor:
+                for row in cursor:
+                    if attribute_field_name:
+                        attribute = row[len(id_field_names)]
+                        if attribute not in attribute_tracked_field:
+                            continue
+
+                    else:
+                        attribute = _tracked_fields[0]["attribute"]
+                    changed_ids, expired_ids, _ = attribute_changes[attribute]
+                    _id = tuple(row[: len(id_field_names)])
+                    if _id in changed_ids or _id in expired_ids:
+                        cursor.updateRow(row[:-1] + [cmp_date])
+                    else:
+                        states[attribute]["unchanged"] += 1
+            insert_cursor = profile_cursor(
+                InsertCursor(
+                    # ArcPy2.8.0: Convert Path to str.
+                    in_table=str(dataset_path),
+                    field_names=key_field_names
+                    + value_field_names
+                    + [date_initiated_field_name],
+                ),
+                dataset_path=dataset_path,
+            )
+            with insert_cursor:
+                for new_row in new_rows:
+                    insert_cursor.insertRow(new_row)
+        for attribute, (
+            changed_ids,
+            expired_ids,
+            _new_rows,
+        ) in attribute_changes.items():
+            if changed_ids:
+                states[attribute]["changed"] = len(changed_ids)
+            if expired_ids:
+                states[attribute]["expired"] = len(expired_ids)
+            if _new_rows:
+                states[attribute]["inserted"] = len(_new_rows)
+        FEATURE_COUNT_CACHE.adjust(dataset_path, len(new_rows))
+    for attribute, field_states in states.items():
+        log_entity_states(
+            f"features for `{attribute}`",
+            field_states,
+            logger=LOG,
+            log_level=log_level,
         )
-    )
-    log_entity_states("features", states, logger=LOG, log_level=log_level)
     LOG.log(log_level, "End: Update.")
     return states
@@ -19,7 +19,13 @@ from arcpy.management import (
     ImportXMLWorkspaceDocument,
 )
 
-from arcproc.metadata import Dataset, Workspace
+from arcproc.metadata import (
+    DOMAIN_REGISTRY,
+    FEATURE_COUNT_CACHE,
+    METADATA_CACHE,
+    Dataset,
+    Workspace,
+)
 
 
 LOG: Logger = getLogger(__name__)
@@ -189,6 +195,8 @@ def copy_workspace(
 
     # ArcPy2.8.0: Convert to str x2.
     Copy(in_data=str(workspace_path), out_data=str(output_path))
+    FEATURE_COUNT_CACHE.invalidate(output_path)
+    METADATA_CACHE.invalidate(output_path)
     LOG.log(log_level, "End: Copy.")
     return Workspace(output_path)
 
@@ -301,6 +309,9 @@ def delete_workspace(
 
     # ArcPy2.8.0: Convert to str.
     Delete(in_data=str(workspace_path))
+    DOMAIN_REGISTRY.invalidate(workspace_path)
+    FEATURE_COUNT_CACHE.invalidate(workspace_path)
+    METADATA_CACHE.invalidate(workspace_path)
     LOG.log(log_level, "End: Delete.")
     return _workspace
 